@@ -0,0 +1,2 @@
+"""Ad-hoc performance benchmarks. Not collected by pytest; run each module
+with ``python -m benchmarks.<name>`` from the repository root."""
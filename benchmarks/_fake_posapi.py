@@ -0,0 +1,106 @@
+"""Minimal PosAPI stand-in for benchmarks.
+
+Serves canned JSON for the handful of endpoints the benchmarks hit over
+keep-alive HTTP/1.1 — on localhost TCP or a Unix domain socket — with an
+optional artificial per-request latency. It is a
+single-threaded asyncio server running in a child process, so it neither
+competes with the client under test for the GIL nor degrades with many
+concurrent keep-alive connections the way a thread-per-connection server does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from tests.data.receipt import SUCCESS_RESPONSE as RECEIPT_RESPONSE
+
+_BODIES: dict[tuple[str, str], bytes] = {
+    ("POST", "/rest/receipt"): json.dumps(RECEIPT_RESPONSE).encode(),
+    ("GET", "/rest/sendData"): b"",
+}
+
+
+def _handler(latency_s: float):  # noqa: ANN202 - asyncio callback
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = lines[0].split(" ", 2)
+                length = 0
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+                if latency_s:
+                    await asyncio.sleep(latency_s)
+                body = _BODIES.get((method, target.split("?", 1)[0]))
+                status = "200 OK" if body is not None else "404 Not Found"
+                body = body or b""
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return handle
+
+
+def _serve_tcp(latency_s: float, ready: multiprocessing.Queue) -> None:
+    async def main() -> None:
+        server = await asyncio.start_server(_handler(latency_s), "127.0.0.1", 0, backlog=1024)
+        host, port = server.sockets[0].getsockname()[:2]
+        ready.put(f"http://{host}:{port}")
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def _serve_uds(path: str, latency_s: float, ready: multiprocessing.Queue) -> None:
+    async def main() -> None:
+        server = await asyncio.start_unix_server(_handler(latency_s), path, backlog=1024)
+        ready.put(path)
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+@contextmanager
+def _serve(target, *args: object) -> Iterator[str]:  # noqa: ANN001
+    ready: multiprocessing.Queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=target, args=(*args, ready), daemon=True)
+    proc.start()
+    try:
+        yield ready.get(timeout=10)
+    finally:
+        proc.terminate()
+        proc.join()
+
+
+@contextmanager
+def serve_tcp(latency_s: float = 0.0) -> Iterator[str]:
+    """Run the fake server on an ephemeral localhost port; yield its base URL."""
+    with _serve(_serve_tcp, latency_s) as base_url:
+        yield base_url
+
+
+@contextmanager
+def serve_uds(latency_s: float = 0.0) -> Iterator[str]:
+    """Run the fake server on a Unix domain socket in a temporary directory;
+    yield the socket path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with _serve(_serve_uds, os.path.join(tmp, "posapi.sock"), latency_s) as path:
+            yield path
@@ -0,0 +1,94 @@
+"""Encode/decode cost of a 200-item ``CreateReceiptRequest``.
+
+Usage::
+
+    python -m benchmarks.bench_json [--items 200] [--rounds 200]
+
+Compares the old path — ``model_dump(mode="json")`` to a dict that httpx then
+encodes with stdlib ``json`` / ``json.loads`` followed by ``model_validate`` —
+with the direct pydantic-core path the resources now use
+(``model_dump_json`` / ``model_validate_json``), plus orjson and msgspec on
+the dict path when they are installed. No network is involved.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from ebarimt_pos_sdk import CreateReceiptRequest
+
+from .bench_payloads import build_receipt
+
+
+def _encoders(model: CreateReceiptRequest) -> dict[str, Callable[[], Any]]:
+    def dump() -> dict[str, Any]:
+        return model.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    encoders: dict[str, Callable[[], Any]] = {
+        "model_dump + json.dumps (old)": lambda: json.dumps(
+            dump(), ensure_ascii=False, separators=(",", ":")
+        ).encode(),
+        "model_dump_json (new)": lambda: model.model_dump_json(
+            by_alias=True, exclude_none=True
+        ).encode(),
+    }
+    if importlib.util.find_spec("orjson") is not None:
+        import orjson
+
+        encoders["model_dump + orjson.dumps"] = lambda: orjson.dumps(dump())
+    if importlib.util.find_spec("msgspec") is not None:
+        import msgspec
+
+        encoder = msgspec.json.Encoder()
+        encoders["model_dump + msgspec"] = lambda: encoder.encode(dump())
+    return encoders
+
+
+def _decoders(body: bytes) -> dict[str, Callable[[], Any]]:
+    model = CreateReceiptRequest
+    decoders: dict[str, Callable[[], Any]] = {
+        "json.loads + model_validate (old)": lambda: model.model_validate(json.loads(body)),
+        "model_validate_json (new)": lambda: model.model_validate_json(body),
+    }
+    if importlib.util.find_spec("orjson") is not None:
+        import orjson
+
+        decoders["orjson.loads + model_validate"] = lambda: model.model_validate(orjson.loads(body))
+    if importlib.util.find_spec("msgspec") is not None:
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+        decoders["msgspec + model_validate"] = lambda: model.model_validate(decoder.decode(body))
+    return decoders
+
+
+def _report(title: str, cases: dict[str, Callable[[], Any]], rounds: int) -> None:
+    print(f"\n{title}")
+    baseline: float | None = None
+    for name, fn in cases.items():
+        fn()  # warm up
+        best = min(timeit.repeat(fn, number=rounds, repeat=5)) / rounds
+        baseline = baseline or best
+        print(f"  {name:<36} {best * 1e6:9.1f} µs   x{baseline / best:4.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    model = build_receipt(args.items)
+    body = model.model_dump_json(by_alias=True, exclude_none=True).encode()
+    print(f"CreateReceiptRequest with {args.items} items, {len(body):,} bytes of JSON")
+    _report("encode (model -> bytes)", _encoders(model), args.rounds)
+    _report("decode (bytes -> model)", _decoders(body), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Receipt payload builders shared by the benchmarks."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from ebarimt_pos_sdk import CreateReceiptRequest, Item, SubReceipt
+
+
+def build_receipt(items: int) -> CreateReceiptRequest:
+    """A single-sub-receipt B2C receipt with ``items`` identical line items."""
+    unit_price = Decimal("1120")
+    lines = [
+        Item(
+            name=f"Item {i}",
+            measure_unit="ш",
+            qty=1,
+            unit_price=unit_price,
+            total_amount=unit_price,
+            bar_code="19059010880001",
+            bar_code_type="GS1",
+            classification_code="2349010",
+            total_vat=Decimal("100"),
+            total_city_tax=Decimal("20"),
+        )
+        for i in range(items)
+    ]
+    total = unit_price * items
+    return CreateReceiptRequest(
+        branch_no="001",
+        total_amount=total,
+        total_vat=Decimal("100") * items,
+        total_city_tax=Decimal("20") * items,
+        merchant_tin="37900846788",
+        pos_no="001",
+        type="B2C_RECEIPT",
+        bill_id_suffix="01",
+        receipts=[
+            SubReceipt(
+                total_amount=total,
+                tax_type="VAT_ABLE",
+                merchant_tin="37900846788",
+                items=lines,
+            )
+        ],
+    )
@@ -0,0 +1,84 @@
+"""Throughput of concurrent ``receipt.acreate`` calls under different pool settings.
+
+Usage::
+
+    python -m benchmarks.bench_pool [--requests 400] [--latency-ms 20]
+
+For each pool configuration and each concurrency level (1, 10, 100) the
+benchmark issues ``--requests`` receipt creations against a local fake PosAPI
+that answers after ``--latency-ms`` and reports requests/second.
+
+Measure before tuning: bigger is not automatically faster. The default pool
+keeps only 20 idle connections, so at 100-way concurrency most requests pay a
+fresh TCP connect — but httpcore also scans every pooled connection when
+assigning a request, so a very large warm pool can lose to a smaller one once
+CPU, not latency, is the bottleneck.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from ebarimt_pos_sdk import EbarimtRestClient, RestClientSettings
+from ebarimt_pos_sdk.settings import RetrySettings
+
+from ._fake_posapi import serve_tcp
+from .bench_payloads import build_receipt
+
+CONCURRENCY_LEVELS = (1, 10, 100)
+
+POOLS: dict[str, dict[str, object]] = {
+    "httpx default (100/20/5s)": {},
+    "tight (10/10/5s)": {"max_connections": 10, "max_keepalive_connections": 10},
+    "warm (100/50/30s)": {
+        "max_connections": 100,
+        "max_keepalive_connections": 50,
+        "keepalive_expiry_s": 30.0,
+    },
+    "large (200/200/60s)": {
+        "max_connections": 200,
+        "max_keepalive_connections": 200,
+        "keepalive_expiry_s": 60.0,
+    },
+}
+
+
+async def _run(base_url: str, pool: dict[str, object], concurrency: int, total: int) -> float:
+    settings = RestClientSettings(
+        base_url=base_url,
+        retry=RetrySettings(max_retries=1),
+        **pool,  # type: ignore[arg-type]
+    )
+    payload = build_receipt(items=1)
+    sem = asyncio.Semaphore(concurrency)
+
+    async with EbarimtRestClient(settings) as client:
+
+        async def one() -> None:
+            async with sem:
+                await client.receipt.acreate(payload)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return total / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with serve_tcp(latency_s=args.latency_ms / 1000) as base_url:
+        header = f"{'pool':<28}" + "".join(f"{f'c={c}':>12}" for c in CONCURRENCY_LEVELS)
+        print(header)
+        print("-" * len(header))
+        for name, pool in POOLS.items():
+            row = [asyncio.run(_run(base_url, pool, c, args.requests)) for c in CONCURRENCY_LEVELS]
+            print(f"{name:<28}" + "".join(f"{rps:>10.0f}/s" for rps in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Cost of deriving and checking the tax totals of a 500-item receipt.
+
+Usage::
+
+    python -m benchmarks.bench_tax [--items 500] [--rounds 100]
+
+``hand-written loop`` is the straightforward per-item version: Decimal
+arithmetic with the rates looked up per line and each total assigned through
+the model. It is compared with ``ReceiptTaxCalculator.fill`` and with
+``check_receipt`` on the filled receipt, in Decimal and (when NumPy is
+installed) with the vectorized screen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import timeit
+from collections.abc import Callable
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from ebarimt_pos_sdk import CreateReceiptRequest
+from ebarimt_pos_sdk.resources import ReceiptTaxCalculator
+
+from .bench_payloads import build_receipt
+
+CENT = Decimal("0.01")
+
+
+def _hand_written(request: CreateReceiptRequest) -> None:
+    receipt_vat = receipt_city = receipt_amount = Decimal(0)
+    for sub in request.receipts:
+        sub_vat = sub_city = sub_amount = Decimal(0)
+        for item in sub.items:
+            vat_rate = Decimal("0.10") if sub.tax_type == "VAT_ABLE" else Decimal(0)
+            city_rate = Decimal("0.02") if sub.tax_type == "VAT_ABLE" else Decimal(0)
+            amount = (Decimal(item.qty) * Decimal(item.unit_price)).quantize(CENT, ROUND_HALF_UP)
+            divisor = 1 + vat_rate + city_rate
+            item.total_amount = amount
+            item.total_vat = (amount * vat_rate / divisor).quantize(CENT, ROUND_HALF_UP)
+            item.total_city_tax = (amount * city_rate / divisor).quantize(CENT, ROUND_HALF_UP)
+            sub_amount += amount
+            sub_vat += item.total_vat
+            sub_city += item.total_city_tax
+        sub.total_amount, sub.total_vat, sub.total_city_tax = sub_amount, sub_vat, sub_city
+        receipt_amount += sub_amount
+        receipt_vat += sub_vat
+        receipt_city += sub_city
+    request.total_amount = receipt_amount
+    request.total_vat, request.total_city_tax = receipt_vat, receipt_city
+
+
+def _cases(request: CreateReceiptRequest) -> dict[str, Callable[[], Any]]:
+    calculator = ReceiptTaxCalculator(vectorize=False)
+    cases: dict[str, Callable[[], Any]] = {
+        "hand-written loop": lambda: _hand_written(request),
+        "ReceiptTaxCalculator.fill": lambda: calculator.fill(request),
+        "check_receipt (Decimal)": lambda: calculator.check_receipt(request),
+    }
+    if importlib.util.find_spec("numpy") is not None:
+        vectorized = ReceiptTaxCalculator(vectorize=True)
+        cases["check_receipt (NumPy screen)"] = lambda: vectorized.check_receipt(request)
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    request = build_receipt(args.items)
+    ReceiptTaxCalculator().fill(request)
+    print(f"CreateReceiptRequest with {args.items} items")
+    baseline: float | None = None
+    for name, fn in _cases(request).items():
+        fn()  # warm up
+        best = min(timeit.repeat(fn, number=args.rounds, repeat=5)) / args.rounds
+        baseline = baseline or best
+        print(f"  {name:<32} {best * 1e3:7.2f} ms   x{baseline / best:4.2f}")
+    if ReceiptTaxCalculator().check_receipt(request):
+        raise SystemExit("the filled receipt does not check out")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Cost of preparing a 500-item receipt dict for the wire, validated or trusted.
+
+Usage::
+
+    python -m benchmarks.bench_trusted [--items 500] [--rounds 100]
+
+Compares what ``receipt.create(payload_dict)`` does before sending —
+``model_validate`` then ``model_dump_json`` — with ``validate=False``, which
+checks the dict's structure and serializes it directly
+(``trusted_receipt_json``). ``model_construct`` on every nested model is
+shown for reference: it skips validation but rebuilds the models in Python,
+which is no faster. No network is involved.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from ebarimt_pos_sdk import CreateReceiptRequest, Item, SubReceipt
+from ebarimt_pos_sdk.resources import trusted_receipt_json
+
+from .bench_payloads import build_receipt
+
+
+def _dump(model: CreateReceiptRequest) -> bytes:
+    return model.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def _construct(data: dict[str, Any]) -> CreateReceiptRequest:
+    receipts = [
+        SubReceipt.model_construct(
+            **{**sub, "items": [Item.model_construct(**item) for item in sub["items"]]}
+        )
+        for sub in data["receipts"]
+    ]
+    return CreateReceiptRequest.model_construct(**{**data, "receipts": receipts})
+
+
+def _cases(data: dict[str, Any]) -> dict[str, Callable[[], bytes]]:
+    return {
+        "model_validate + dump (validate=True)": lambda: _dump(
+            CreateReceiptRequest.model_validate(data)
+        ),
+        "model_construct + dump": lambda: _dump(_construct(data)),
+        "trusted_receipt_json (validate=False)": lambda: trusted_receipt_json(data),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    data = build_receipt(args.items).model_dump(by_alias=True, exclude_none=True)
+    expected = trusted_receipt_json(data)
+    print(f"CreateReceiptRequest dict with {args.items} items, {len(expected):,} bytes of JSON")
+    baseline: float | None = None
+    for name, fn in _cases(data).items():
+        if fn() != expected:
+            raise SystemExit(f"{name} produced different bytes")
+        best = min(timeit.repeat(fn, number=args.rounds, repeat=5)) / args.rounds
+        baseline = baseline or best
+        print(f"  {name:<40} {best * 1e3:7.2f} ms   x{baseline / best:4.2f}")
+
+
+if __name__ == "__main__":
+    main()
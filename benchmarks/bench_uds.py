@@ -0,0 +1,83 @@
+"""Per-request latency of ``receipt.create`` over localhost TCP vs a Unix socket.
+
+Usage::
+
+    python -m benchmarks.bench_uds [--requests 2000] [--items 1]
+
+Sends ``--requests`` sequential receipt creations (sync and async) to the
+local fake PosAPI over keep-alive connections and reports p50/p99 latency and
+throughput for each transport. Sequential calls isolate the per-request cost
+of the socket path; the fake server answers instantly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from ebarimt_pos_sdk import EbarimtRestClient, RestClientSettings
+from ebarimt_pos_sdk.settings import RetrySettings
+
+from ._fake_posapi import serve_tcp, serve_uds
+from .bench_payloads import build_receipt
+
+
+def _summary(samples: list[float]) -> str:
+    samples.sort()
+    p50 = statistics.median(samples) * 1e6
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1e6
+    rps = len(samples) / sum(samples)
+    return f"p50 {p50:7.0f} µs   p99 {p99:7.0f} µs   {rps:7.0f} req/s"
+
+
+def _run_sync(settings: RestClientSettings, total: int, items: int) -> list[float]:
+    payload = build_receipt(items)
+    samples: list[float] = []
+    with EbarimtRestClient(settings) as client:
+        client.receipt.create(payload)  # open the keep-alive connection
+        for _ in range(total):
+            started = time.perf_counter()
+            client.receipt.create(payload)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def _run_async(settings: RestClientSettings, total: int, items: int) -> list[float]:
+    payload = build_receipt(items)
+    samples: list[float] = []
+    async with EbarimtRestClient(settings) as client:
+        await client.receipt.acreate(payload)
+        for _ in range(total):
+            started = time.perf_counter()
+            await client.receipt.acreate(payload)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=1)
+    args = parser.parse_args()
+
+    retry = RetrySettings(max_retries=1)
+    with serve_tcp() as base_url, serve_uds() as uds:
+        transports = {
+            "localhost TCP": RestClientSettings(base_url=base_url, retry=retry),
+            "localhost TCP, trust_env=False": RestClientSettings(
+                base_url=base_url, retry=retry, trust_env=False
+            ),
+            "Unix socket": RestClientSettings(
+                base_url="http://localhost", uds=uds, retry=retry, trust_env=False
+            ),
+        }
+        for name, settings in transports.items():
+            print(f"{name:<32} sync   {_summary(_run_sync(settings, args.requests, args.items))}")
+            samples = asyncio.run(_run_async(settings, args.requests, args.items))
+            print(f"{'':<32} async  {_summary(samples)}")
+
+
+if __name__ == "__main__":
+    main()
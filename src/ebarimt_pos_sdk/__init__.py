@@ -2,7 +2,10 @@ import logging
 
 from .clients import EbarimtApiClient, EbarimtRestClient
 from .errors import (
+    PosApiAmbiguousReceiptError,
     PosApiBusinessError,
+    PosApiCircuitOpenError,
+    PosApiDeadlineExceededError,
     PosApiDecodeError,
     PosApiError,
     PosApiHttpError,
@@ -54,7 +57,10 @@ __all__ = [
     "ReceiptItemData",
     "ReceiptType",
     "TaxType",
+    "PosApiAmbiguousReceiptError",
     "PosApiBusinessError",
+    "PosApiCircuitOpenError",
+    "PosApiDeadlineExceededError",
     "PosApiDecodeError",
     "PosApiError",
     "PosApiHttpError",
@@ -0,0 +1,76 @@
+"""Background refreshes for stale-while-revalidate caches.
+
+A stale entry is served immediately while a refresh runs out of band: on a
+daemon thread for sync callers, on a task of the running loop for async ones.
+At most one refresh per key runs at a time, and a failed refresh is logged
+and swallowed — the caller already has its (stale) answer, and the next read
+past the TTL simply tries again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class Revalidator:
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._running: set[Hashable] = set()
+        # Strong references: the loop only keeps weak ones to its tasks.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _claim(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._running:
+                return False
+            self._running.add(key)
+            return True
+
+    def _release(self, key: Hashable) -> None:
+        with self._lock:
+            self._running.discard(key)
+
+    def _failed(self, key: Hashable) -> None:
+        logger.warning("%s: background refresh of %r failed", self._name, key, exc_info=True)
+
+    def running(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._running
+
+    def in_thread(self, key: Hashable, refresh: Callable[[], object]) -> None:
+        """Run ``refresh`` on a daemon thread unless one is already running for ``key``."""
+        if not self._claim(key):
+            return
+
+        def run() -> None:
+            try:
+                refresh()
+            except Exception:
+                self._failed(key)
+            finally:
+                self._release(key)
+
+        threading.Thread(target=run, name=f"{self._name}-refresh", daemon=True).start()
+
+    def in_task(self, key: Hashable, refresh: Callable[[], Awaitable[object]]) -> None:
+        """Schedule ``refresh`` on the running loop unless one is already running for ``key``."""
+        if not self._claim(key):
+            return
+
+        async def run() -> None:
+            try:
+                await refresh()
+            except Exception:
+                self._failed(key)
+            finally:
+                self._release(key)
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
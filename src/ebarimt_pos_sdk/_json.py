@@ -0,0 +1,111 @@
+"""Pluggable JSON backend for bodies that are not pydantic models.
+
+Models never go through a backend: requests are serialized straight to bytes
+with ``model_dump_json`` and responses validated straight from bytes with
+``model_validate_json``, both in pydantic-core. The backend handles what is
+left — plain ``dict`` payloads handed to a transport directly, error bodies,
+and responses decoded without a model.
+
+``stdlib`` is the default. ``orjson`` and ``msgspec`` are used only when
+selected (or via ``auto``) and installed; neither is a dependency of the SDK.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Callable
+from typing import Any, Literal, Protocol
+
+JsonBackendName = Literal["stdlib", "orjson", "msgspec", "auto"]
+
+JSON_BACKEND_NAMES: frozenset[str] = frozenset({"stdlib", "orjson", "msgspec", "auto"})
+
+
+class JsonBackend(Protocol):
+    name: str
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class _StdlibBackend:
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:
+        # Same compact, non-ASCII-escaping form httpx produces for ``json=``.
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+            "utf-8"
+        )
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class _OrjsonBackend:
+    name = "orjson"
+
+    def __init__(self, orjson: Any) -> None:
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class _MsgspecBackend:
+    name = "msgspec"
+
+    def __init__(self, msgspec: Any) -> None:
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            # Callers catch ValueError, like json.JSONDecodeError/orjson's error.
+            raise ValueError(str(exc)) from exc
+
+
+STDLIB_JSON: JsonBackend = _StdlibBackend()
+
+
+_OPTIONAL_BACKENDS: dict[str, Callable[[Any], JsonBackend]] = {
+    "orjson": _OrjsonBackend,
+    "msgspec": _MsgspecBackend,
+}
+
+
+def _load(name: str) -> JsonBackend:
+    """Import the optional package ``name`` and wrap it; raises ``ImportError``."""
+    return _OPTIONAL_BACKENDS[name](importlib.import_module(name))
+
+
+def get_json_backend(name: JsonBackendName) -> JsonBackend:
+    """Resolve a backend by name. ``auto`` prefers orjson, then msgspec, then
+    the stdlib; naming a backend that is not installed raises ``ImportError``."""
+    if name == "stdlib":
+        return STDLIB_JSON
+    if name == "auto":
+        for candidate in _OPTIONAL_BACKENDS:
+            try:
+                return _load(candidate)
+            except ImportError:
+                continue
+        return STDLIB_JSON
+    if name not in _OPTIONAL_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}")
+    try:
+        return _load(name)
+    except ImportError as exc:
+        raise ImportError(
+            f"json_backend={name!r} requires the {name!r} package; install it or use 'stdlib'."
+        ) from exc
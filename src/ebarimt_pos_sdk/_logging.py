@@ -99,3 +99,31 @@ def log_retry(
         )
     except Exception:  # pragma: no cover - logging must never break a request
         pass
+
+
+def log_retry_skipped(
+    logger: logging.Logger,
+    request_id: str,
+    attempt: int,
+    reason: str,
+    blocked_by: str,
+) -> None:
+    """WARNING line emitted when a retryable failure is *not* retried because a
+    client-wide guard refused it. ``blocked_by`` names the guard, e.g.
+    ``"retry budget exhausted"`` or ``"circuit open"``."""
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    try:
+        logger.warning(
+            "not retrying attempt %d after %s: %s [%s]",
+            attempt,
+            reason,
+            blocked_by,
+            request_id,
+            extra={
+                "request_id": request_id,
+                "attempt": attempt,
+            },
+        )
+    except Exception:  # pragma: no cover - logging must never break a request
+        pass
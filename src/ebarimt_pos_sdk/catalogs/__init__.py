@@ -0,0 +1,31 @@
+"""
+In-memory, TTL-cached indexes over the public reference-data endpoints, and
+an offline snapshot of the БҮНА classification tree.
+
+Catalogs are opt-in lookup helpers for application code. The SDK never uses
+them to validate requests — reference-table rules belong to the server.
+"""
+
+from ._base import Catalog
+from .buna import BUNA_LEVELS, BunaBarcode, BunaCrawler, BunaNode, BunaSnapshot
+from .buna_index import BunaIndex, BunaIssue
+from .district import DistrictCatalog, DistrictIndex
+from .product_tax_code import ProductTaxCodeCatalog, ProductTaxCodeIndex
+from .store import SnapshotStore, Stored
+
+__all__ = [
+    "BUNA_LEVELS",
+    "BunaBarcode",
+    "BunaCrawler",
+    "BunaIndex",
+    "BunaIssue",
+    "BunaNode",
+    "BunaSnapshot",
+    "Catalog",
+    "DistrictCatalog",
+    "DistrictIndex",
+    "ProductTaxCodeCatalog",
+    "ProductTaxCodeIndex",
+    "SnapshotStore",
+    "Stored",
+]
@@ -0,0 +1,220 @@
+"""TTL-cached, in-memory indexes over reference-data endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from .._background import Revalidator
+
+if TYPE_CHECKING:
+    from .store import SnapshotStore, Stored
+
+logger = logging.getLogger(__name__)
+
+ResponseT = TypeVar("ResponseT")
+IndexT = TypeVar("IndexT")
+
+
+def normalize_name(name: str) -> str:
+    """Case- and whitespace-insensitive key for name lookups."""
+    return " ".join(name.split()).casefold()
+
+
+class Catalog(ABC, Generic[ResponseT, IndexT]):
+    """Fetches a reference table, builds an immutable index from it and keeps
+    it for ``ttl_s`` seconds.
+
+    ``get``/``aget`` return the cached index and only hit the network once it
+    has expired; ``refresh``/``arefresh`` force a reload. Concurrent callers
+    that find the cache expired wait for a single reload instead of each
+    fetching the table. A failed reload raises and leaves the previous index
+    (if any) in place for the next attempt.
+
+    With ``max_stale_s`` set, an expired index is still served for up to that
+    many seconds past its TTL while a reload runs in the background (a thread
+    for ``get``, a task for ``aget``), so callers never wait on the network
+    for a table they already have. Past that bound the reload is synchronous
+    again, and its errors raise.
+
+    With a ``snapshot_store``, every successful load is also written there,
+    and the first read of a new process starts from the stored copy, aged by
+    when it was fetched, instead of from the network. Store errors are logged
+    and never fail a read. ``aget``/``arefresh`` use the store from a worker
+    thread and never wait on a sync reload in progress.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float,
+        max_stale_s: float | None = None,
+        snapshot_store: SnapshotStore | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_s <= 0:
+            raise ValueError(f"{type(self).__name__} ttl_s must be > 0")
+        if max_stale_s is not None and max_stale_s <= 0:
+            raise ValueError(f"{type(self).__name__} max_stale_s must be > 0")
+        self._ttl_s = ttl_s
+        self._max_stale_s = max_stale_s
+        self._clock = clock
+        self._revalidator = Revalidator(type(self).__name__)
+        self._snapshot_store = snapshot_store
+        self._restore_pending = snapshot_store is not None
+        self._index: IndexT | None = None
+        self._expires_at = 0.0
+        # ``_lock`` serializes sync reloads and is held across their network
+        # I/O, so the async path never takes it. ``_state_lock`` only guards
+        # swapping the index in and out and is never held across I/O.
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._restore_lock = threading.Lock()
+        # One asyncio.Lock per event loop: a lock is bound to the loop that
+        # first waits on it.
+        self._async_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @abstractmethod
+    def _fetch(self) -> ResponseT: ...
+
+    @abstractmethod
+    async def _afetch(self) -> ResponseT: ...
+
+    @abstractmethod
+    def _build(self, response: ResponseT) -> IndexT: ...
+
+    def _load_stored(self, store: SnapshotStore) -> Stored[ResponseT] | None:
+        """Read this catalog's table from ``store``; subclasses with a store
+        format override this and :meth:`_save_stored`."""
+        return None
+
+    def _save_stored(self, store: SnapshotStore, response: ResponseT) -> None:
+        return None
+
+    def _restore(self) -> None:
+        """Seed the index from the snapshot store, once, before the first fetch.
+        Reads the store, so the async path runs it in a worker thread."""
+        with self._restore_lock:
+            if not self._restore_pending or self._snapshot_store is None:
+                return
+            self._restore_pending = False
+            store = self._snapshot_store
+            try:
+                stored = self._load_stored(store)
+                if stored is None:
+                    return
+                age_s = max(0.0, store.now() - stored.fetched_at)
+                index = self._build(stored.value)
+            except Exception:
+                logger.warning("%s: could not load snapshot", type(self).__name__, exc_info=True)
+                return
+            with self._state_lock:
+                if self._index is None:  # a reload may have finished meanwhile
+                    self._index = index
+                    self._expires_at = self._clock() + self._ttl_s - age_s
+
+    def _loop_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._state_lock:
+            lock = self._async_locks.get(loop)
+            if lock is None:
+                lock = self._async_locks[loop] = asyncio.Lock()
+            return lock
+
+    @property
+    def expires_in_s(self) -> float:
+        """Seconds until the cached index expires (``0`` if none is loaded)."""
+        if self._index is None:
+            return 0.0
+        return max(0.0, self._expires_at - self._clock())
+
+    def _fresh(self) -> IndexT | None:
+        if self._index is not None and self._clock() < self._expires_at:
+            return self._index
+        return None
+
+    def _stale(self) -> IndexT | None:
+        if self._index is None or self._max_stale_s is None:
+            return None
+        if self._clock() < self._expires_at + self._max_stale_s:
+            return self._index
+        return None
+
+    def _install(self, response: ResponseT) -> IndexT:
+        index = self._build(response)
+        with self._state_lock:
+            self._index = index
+            self._expires_at = self._clock() + self._ttl_s
+            self._restore_pending = False
+        return index
+
+    def _persist(self, response: ResponseT) -> None:
+        if self._snapshot_store is None:
+            return
+        try:
+            self._save_stored(self._snapshot_store, response)
+        except Exception:
+            logger.warning("%s: could not save snapshot", type(self).__name__, exc_info=True)
+
+    def _store(self, response: ResponseT) -> IndexT:
+        index = self._install(response)
+        self._persist(response)
+        return index
+
+    async def _astore(self, response: ResponseT) -> IndexT:
+        index = self._install(response)
+        if self._snapshot_store is not None:
+            await asyncio.to_thread(self._persist, response)
+        return index
+
+    def get(self) -> IndexT:
+        """Return the cached index, reloading it first if it has expired."""
+        if self._restore_pending:
+            self._restore()
+        index = self._fresh()
+        if index is not None:
+            return index
+        stale = self._stale()
+        if stale is not None:
+            self._revalidator.in_thread(None, self.refresh)
+            return stale
+        with self._lock:
+            index = self._fresh()
+            if index is not None:
+                return index
+            return self._store(self._fetch())
+
+    async def aget(self) -> IndexT:
+        """Async variant of :meth:`get`."""
+        if self._restore_pending:
+            await asyncio.to_thread(self._restore)
+        index = self._fresh()
+        if index is not None:
+            return index
+        stale = self._stale()
+        if stale is not None:
+            self._revalidator.in_task(None, self.arefresh)
+            return stale
+        async with self._loop_lock():
+            index = self._fresh()
+            if index is not None:
+                return index
+            return await self._astore(await self._afetch())
+
+    def refresh(self) -> IndexT:
+        """Reload the table now, regardless of the TTL."""
+        with self._lock:
+            return self._store(self._fetch())
+
+    async def arefresh(self) -> IndexT:
+        """Async variant of :meth:`refresh`."""
+        async with self._loop_lock():
+            return await self._astore(await self._afetch())
@@ -0,0 +1,345 @@
+"""Breadth-first crawler for the БҮНА classification tree.
+
+``BunaResource`` returns one level per request, so materializing the tree is
+thousands of GETs. :class:`BunaCrawler` walks it level by level with bounded
+concurrency and produces a :class:`BunaSnapshot` that can be saved to disk and
+used offline. A crawl that fails part-way leaves a checkpoint (a snapshot with
+``pending`` paths) from which the next crawl resumes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .._types import HeaderTypes
+from ..resources import BunaResource, GetBunaResponse
+
+#: Classification levels, top-down. A node at depth ``n`` (1-based) is the
+#: ``n``-th level; expanding a depth-6 "БҮНА код" node lists its barcodes.
+BUNA_LEVELS: tuple[str, ...] = (
+    "Салбар",
+    "Дэд салбар",
+    "Бүлэг",
+    "Анги",
+    "Дэд анги",
+    "БҮНА код",
+)
+
+SNAPSHOT_VERSION = 1
+
+BunaPath = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class BunaNode:
+    """One classification row; ``path`` runs from the Салбар down to this code."""
+
+    path: BunaPath
+    name: str
+
+    @property
+    def code(self) -> str:
+        return self.path[-1]
+
+    @property
+    def depth(self) -> int:
+        return len(self.path)
+
+    @property
+    def level(self) -> str:
+        return BUNA_LEVELS[len(self.path) - 1]
+
+    @property
+    def parent(self) -> str | None:
+        return self.path[-2] if len(self.path) > 1 else None
+
+
+@dataclass(frozen=True)
+class BunaBarcode:
+    """A leaf barcode row registered under a БҮНА code."""
+
+    classification_code: str
+    barcode: str
+    name: str
+    registered_date: str | None = None
+
+
+@dataclass(frozen=True)
+class BunaSnapshot:
+    """A (possibly partial) copy of the БҮНА tree.
+
+    ``pending`` lists the paths that still have to be expanded; a snapshot
+    with nothing pending is complete. Nodes are ordered by path, so a parent
+    always precedes its children.
+    """
+
+    nodes: tuple[BunaNode, ...]
+    barcodes: tuple[BunaBarcode, ...] = ()
+    include_barcodes: bool = False
+    max_depth: int = len(BUNA_LEVELS)
+    pending: tuple[BunaPath, ...] = ()
+
+    @property
+    def complete(self) -> bool:
+        return not self.pending
+
+    def to_dict(self) -> dict[str, Any]:
+        # Nodes are stored as ``[parent_position, code, name]`` (``-1`` for a
+        # Салбар) rather than full paths: smaller, and much faster to parse.
+        positions: dict[BunaPath, int] = {}
+        nodes: list[list[Any]] = []
+        for position, node in enumerate(self.nodes):
+            positions[node.path] = position
+            nodes.append(
+                [positions[node.path[:-1]] if node.depth > 1 else -1, node.code, node.name]
+            )
+        return {
+            "version": SNAPSHOT_VERSION,
+            "include_barcodes": self.include_barcodes,
+            "max_depth": self.max_depth,
+            "pending": [list(path) for path in self.pending],
+            "nodes": nodes,
+            "barcodes": [
+                [b.classification_code, b.barcode, b.name, b.registered_date] for b in self.barcodes
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BunaSnapshot:
+        version = data.get("version")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"BunaSnapshot: unsupported snapshot version {version!r}")
+        nodes: list[BunaNode] = []
+        for parent, code, name in data["nodes"]:
+            if not -1 <= parent < len(nodes):
+                raise ValueError(f"BunaSnapshot: node {code!r} precedes its parent")
+            path = (*nodes[parent].path, code) if parent >= 0 else (code,)
+            nodes.append(BunaNode(path, name))
+        return cls(
+            nodes=tuple(nodes),
+            barcodes=tuple(BunaBarcode(*row) for row in data.get("barcodes", ())),
+            include_barcodes=bool(data.get("include_barcodes", False)),
+            max_depth=int(data.get("max_depth", len(BUNA_LEVELS))),
+            pending=tuple(tuple(path) for path in data.get("pending", ())),
+        )
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the snapshot as JSON, atomically replacing ``path``."""
+        target = Path(path)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(
+            json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode()
+        )
+        os.replace(tmp, target)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> BunaSnapshot:
+        return cls.from_dict(json.loads(Path(path).read_bytes()))
+
+
+class _CrawlState:
+    def __init__(self, *, include_barcodes: bool, max_depth: int) -> None:
+        self.include_barcodes = include_barcodes
+        self.max_depth = max_depth
+        self.nodes: dict[BunaPath, str] = {}
+        self.barcodes: dict[str, list[BunaBarcode]] = {}
+        # Insertion-ordered set of paths still to expand, in-flight ones included.
+        self.pending: dict[BunaPath, None] = {(): None}
+
+    @classmethod
+    def resume(cls, snapshot: BunaSnapshot) -> _CrawlState:
+        state = cls(include_barcodes=snapshot.include_barcodes, max_depth=snapshot.max_depth)
+        state.nodes = {node.path: node.name for node in snapshot.nodes}
+        for barcode in snapshot.barcodes:
+            state.barcodes.setdefault(barcode.classification_code, []).append(barcode)
+        state.pending = dict.fromkeys(snapshot.pending)
+        return state
+
+    def copy(self) -> _CrawlState:
+        """A copy to checkpoint from while the crawl goes on. Shallow is
+        enough: ``record`` replaces barcode lists rather than mutating them."""
+        state = _CrawlState(include_barcodes=self.include_barcodes, max_depth=self.max_depth)
+        state.nodes = dict(self.nodes)
+        state.barcodes = dict(self.barcodes)
+        state.pending = dict(self.pending)
+        return state
+
+    def _expandable(self, path: BunaPath) -> bool:
+        if len(path) < self.max_depth:
+            return True
+        return self.include_barcodes and len(path) == len(BUNA_LEVELS)
+
+    def frontier(self) -> list[BunaPath]:
+        """Pending paths at the shallowest pending depth."""
+        depth = min(len(path) for path in self.pending)
+        return [path for path in self.pending if len(path) == depth]
+
+    def record(self, path: BunaPath, response: GetBunaResponse) -> None:
+        if len(path) == len(BUNA_LEVELS):
+            code = path[-1]
+            self.barcodes[code] = [
+                BunaBarcode(
+                    classification_code=code,
+                    barcode=row[0].strip(),
+                    name=row[1] if len(row) > 1 else "",
+                    registered_date=row[2] if len(row) > 2 else None,
+                )
+                for row in response.root
+                if row and row[0].strip()
+            ]
+        else:
+            for row in response.root:
+                if not row or not row[0].strip():
+                    continue
+                child = (*path, row[0].strip())
+                self.nodes[child] = row[1] if len(row) > 1 else ""
+                if self._expandable(child):
+                    self.pending[child] = None
+        del self.pending[path]
+
+    def snapshot(self) -> BunaSnapshot:
+        return BunaSnapshot(
+            nodes=tuple(BunaNode(path, self.nodes[path]) for path in sorted(self.nodes)),
+            barcodes=tuple(
+                barcode for code in sorted(self.barcodes) for barcode in self.barcodes[code]
+            ),
+            include_barcodes=self.include_barcodes,
+            max_depth=self.max_depth,
+            pending=tuple(sorted(self.pending, key=lambda p: (len(p), p))),
+        )
+
+
+class BunaCrawler:
+    """Materializes the БҮНА tree through ``BunaResource``.
+
+    ``acrawl`` expands each level's nodes concurrently (at most
+    ``concurrency`` requests in flight) before descending; ``crawl`` is the
+    sequential sync variant. ``max_depth`` stops below a given level and
+    ``include_barcodes`` additionally lists the barcodes under every БҮНА
+    code — by far the largest part of the tree.
+
+    With ``checkpoint_path`` set, progress is saved at most every
+    ``checkpoint_interval_s`` seconds and when a request fails; pass the
+    loaded snapshot back as ``resume_from`` to continue where the crawl
+    stopped. The finished snapshot is written there too. ``acrawl`` copies
+    the state on the event loop and sorts, serializes and writes it in a
+    worker thread, so a checkpoint does not stall requests in flight.
+    """
+
+    def __init__(
+        self,
+        resource: BunaResource,
+        *,
+        concurrency: int = 8,
+        max_depth: int = len(BUNA_LEVELS),
+        include_barcodes: bool = False,
+        checkpoint_path: str | os.PathLike[str] | None = None,
+        checkpoint_interval_s: float = 30.0,
+        headers: HeaderTypes | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("BunaCrawler concurrency must be >= 1")
+        if not 1 <= max_depth <= len(BUNA_LEVELS):
+            raise ValueError(f"BunaCrawler max_depth must be between 1 and {len(BUNA_LEVELS)}")
+        if include_barcodes and max_depth != len(BUNA_LEVELS):
+            raise ValueError("BunaCrawler include_barcodes requires the full max_depth")
+        if checkpoint_interval_s < 0:
+            raise ValueError("BunaCrawler checkpoint_interval_s must be >= 0")
+        self._resource = resource
+        self._concurrency = concurrency
+        self._max_depth = max_depth
+        self._include_barcodes = include_barcodes
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval_s = checkpoint_interval_s
+        self._headers = headers
+        self._clock = clock
+        self._last_checkpoint = clock()
+        # Worker threads may finish writing out of order; one at a time keeps
+        # them from racing on the temporary file.
+        self._write_lock = threading.Lock()
+
+    def _start(self, resume_from: BunaSnapshot | None) -> _CrawlState:
+        self._last_checkpoint = self._clock()
+        if resume_from is None:
+            return _CrawlState(include_barcodes=self._include_barcodes, max_depth=self._max_depth)
+        if (resume_from.include_barcodes, resume_from.max_depth) != (
+            self._include_barcodes,
+            self._max_depth,
+        ):
+            raise ValueError(
+                "BunaCrawler: resume_from was taken with different include_barcodes/max_depth"
+            )
+        return _CrawlState.resume(resume_from)
+
+    def _checkpoint_due(self) -> bool:
+        return (
+            self._checkpoint_path is not None
+            and self._clock() - self._last_checkpoint >= self._checkpoint_interval_s
+        )
+
+    def _write(self, state: _CrawlState) -> BunaSnapshot:
+        snapshot = state.snapshot()
+        if self._checkpoint_path is not None:
+            with self._write_lock:
+                snapshot.save(self._checkpoint_path)
+        return snapshot
+
+    def _checkpoint(self, state: _CrawlState) -> None:
+        if self._checkpoint_path is not None:
+            self._last_checkpoint = self._clock()
+            self._write(state)
+
+    async def _acheckpoint(self, state: _CrawlState) -> None:
+        if self._checkpoint_path is not None:
+            self._last_checkpoint = self._clock()
+            await asyncio.to_thread(self._write, state.copy())
+
+    def crawl(self, *, resume_from: BunaSnapshot | None = None) -> BunaSnapshot:
+        """Walk the tree one request at a time."""
+        state = self._start(resume_from)
+        while state.pending:
+            for path in state.frontier():
+                try:
+                    response = self._resource.read(*path, headers=self._headers)
+                except BaseException:
+                    self._checkpoint(state)
+                    raise
+                state.record(path, response)
+                if self._checkpoint_due():
+                    self._checkpoint(state)
+        return self._write(state)
+
+    async def acrawl(self, *, resume_from: BunaSnapshot | None = None) -> BunaSnapshot:
+        """Walk the tree with up to ``concurrency`` requests in flight.
+
+        If any request in a level fails, the rest of that level still
+        completes, the checkpoint is written and the first error is raised.
+        """
+        state = self._start(resume_from)
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def expand(path: BunaPath) -> None:
+            async with semaphore:
+                response = await self._resource.aread(*path, headers=self._headers)
+            state.record(path, response)
+            if self._checkpoint_due():
+                await self._acheckpoint(state)
+
+        while state.pending:
+            results = await asyncio.gather(
+                *(expand(path) for path in state.frontier()), return_exceptions=True
+            )
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                await self._acheckpoint(state)
+                raise errors[0]
+        return await asyncio.to_thread(self._write, state)
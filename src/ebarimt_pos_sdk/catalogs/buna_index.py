@@ -0,0 +1,165 @@
+"""Offline lookups over a :class:`~.buna.BunaSnapshot`."""
+
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+
+from ..resources import CreateReceiptRequest
+from ._base import normalize_name
+from .buna import BUNA_LEVELS, BunaBarcode, BunaNode, BunaSnapshot
+
+
+@dataclass(frozen=True)
+class BunaIssue:
+    """An item whose ``classification_code`` is not a known БҮНА code."""
+
+    receipt: int
+    item: int
+    code: str
+    nearest: BunaNode | None
+
+
+class BunaIndex:
+    """Prefix index over the codes of a БҮНА snapshot, plus a name index.
+
+    БҮНА codes nest as prefixes (``"0"`` → ``"01"`` → … → ``"0111100"``).
+    Codes are kept in one sorted array, a flattened trie: "everything under
+    this prefix" is a contiguous slice found with two binary searches, and
+    "deepest known code this string starts with" probes at most one prefix
+    per character. Name searches ignore case and repeated whitespace; their
+    index is built on first use so loading stays cheap.
+    """
+
+    def __init__(self, snapshot: BunaSnapshot) -> None:
+        self.snapshot = snapshot
+        by_code: dict[str, BunaNode] = {}
+        children: dict[str | None, list[BunaNode]] = {}
+        for node in snapshot.nodes:
+            path = node.path
+            by_code[path[-1]] = node
+            children.setdefault(path[-2] if len(path) > 1 else None, []).append(node)
+        self._by_code = MappingProxyType(by_code)
+        self._codes = sorted(by_code)
+        self._children = MappingProxyType({k: tuple(v) for k, v in children.items()})
+
+        barcodes: dict[str, list[BunaBarcode]] = {}
+        for barcode in snapshot.barcodes:
+            barcodes.setdefault(barcode.classification_code, []).append(barcode)
+        self._barcodes_by_code = MappingProxyType({k: tuple(v) for k, v in barcodes.items()})
+        self._by_barcode = MappingProxyType({b.barcode: b for b in snapshot.barcodes})
+
+    @cached_property
+    def _names(self) -> tuple[list[str], list[int]]:
+        entries: list[tuple[str, int]] = []
+        for position, node in enumerate(self.snapshot.nodes):
+            name = normalize_name(node.name)
+            entries.append((name, position))
+            # Also index each later word so "буудай" finds "Хатуу буудай".
+            start = name.find(" ")
+            while start != -1:
+                entries.append((name[start + 1 :], position))
+                start = name.find(" ", start + 1)
+        entries.sort()
+        return [key for key, _ in entries], [position for _, position in entries]
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> BunaIndex:
+        """Build an index from a snapshot saved with :meth:`BunaSnapshot.save`."""
+        return cls(BunaSnapshot.load(path))
+
+    def __len__(self) -> int:
+        return len(self._by_code)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._by_code
+
+    def lookup(self, code: str) -> BunaNode | None:
+        """The node for ``code`` at any level, or ``None``."""
+        return self._by_code.get(code.strip())
+
+    def ancestry(self, code: str) -> tuple[BunaNode, ...]:
+        """``code`` and its ancestors, Салбар first; empty if unknown."""
+        node = self.lookup(code)
+        if node is None:
+            return ()
+        return tuple(self._by_code[c] for c in node.path)
+
+    def children(self, code: str | None = None) -> tuple[BunaNode, ...]:
+        """Direct children of ``code``; the Салбар list when ``code`` is ``None``."""
+        return self._children.get(code.strip() if code is not None else None, ())
+
+    def with_prefix(self, prefix: str) -> tuple[BunaNode, ...]:
+        """Every node whose code starts with ``prefix``, ordered by code."""
+        prefix = prefix.strip()
+        lo = bisect_left(self._codes, prefix)
+        hi = bisect_left(self._codes, prefix + "\U0010ffff", lo)
+        return tuple(self._by_code[code] for code in self._codes[lo:hi])
+
+    def nearest(self, code: str) -> BunaNode | None:
+        """The deepest known code that ``code`` starts with."""
+        code = code.strip()
+        for end in range(len(code), 0, -1):
+            node = self._by_code.get(code[:end])
+            if node is not None:
+                return node
+        return None
+
+    def search(
+        self, query: str, *, substring: bool = False, limit: int | None = None
+    ) -> tuple[BunaNode, ...]:
+        """Nodes whose name (or any word in it) starts with ``query``.
+
+        With ``substring=True`` any part of the name may match; that is a
+        linear scan, prefix search is a binary search.
+        """
+        key = normalize_name(query)
+        if not key:
+            return ()
+        positions: dict[int, None] = {}
+        if substring:
+            for position, node in enumerate(self.snapshot.nodes):
+                if key in normalize_name(node.name):
+                    positions[position] = None
+                    if limit is not None and len(positions) >= limit:
+                        break
+        else:
+            keys, key_positions = self._names
+            i = bisect_left(keys, key)
+            while i < len(keys) and keys[i].startswith(key):
+                positions[key_positions[i]] = None
+                if limit is not None and len(positions) >= limit:
+                    break
+                i += 1
+        return tuple(self.snapshot.nodes[p] for p in positions)
+
+    def barcodes(self, code: str) -> tuple[BunaBarcode, ...]:
+        """Barcodes registered under a БҮНА code (needs a snapshot with barcodes)."""
+        return self._barcodes_by_code.get(code.strip(), ())
+
+    def barcode(self, barcode: str) -> BunaBarcode | None:
+        return self._by_barcode.get(barcode.strip())
+
+    def is_classification_code(self, code: str) -> bool:
+        """Whether ``code`` is a known leaf-level БҮНА код."""
+        node = self.lookup(code)
+        return node is not None and node.depth == len(BUNA_LEVELS)
+
+    def check_receipt(self, request: CreateReceiptRequest) -> tuple[BunaIssue, ...]:
+        """Items whose ``classification_code`` is set but not a known БҮНА код.
+
+        An opt-in local pre-flight check; the SDK never rejects a receipt on
+        its own. Items without a classification code are skipped.
+        """
+        return tuple(self._issues(request))
+
+    def _issues(self, request: CreateReceiptRequest) -> Iterable[BunaIssue]:
+        for r, receipt in enumerate(request.receipts):
+            for i, item in enumerate(receipt.items):
+                code = item.classification_code
+                if code is not None and not self.is_classification_code(code):
+                    yield BunaIssue(receipt=r, item=i, code=code, nearest=self.nearest(code))
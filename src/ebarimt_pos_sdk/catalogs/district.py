@@ -0,0 +1,132 @@
+"""In-memory district (branch / sub-branch) catalog."""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from .._types import HeaderTypes
+from ..resources import BranchInfo, DistrictCodeResource, GetDistrictCodeResponse
+from ._base import Catalog, normalize_name
+from .store import SnapshotStore, Stored
+
+
+def _freeze(groups: Mapping[str, list[BranchInfo]]) -> Mapping[str, tuple[BranchInfo, ...]]:
+    return MappingProxyType({key: tuple(rows) for key, rows in groups.items()})
+
+
+@dataclass(frozen=True)
+class DistrictIndex:
+    """Immutable lookup tables over one ``getBranchInfo`` response.
+
+    A receipt's ``district_code`` is ``branch_code + sub_branch_code`` (e.g.
+    ``"2501"``); name lookups ignore case and repeated whitespace. Names are
+    not unique — the same sum name exists in several aimags — so they map to
+    tuples.
+    """
+
+    rows: tuple[BranchInfo, ...]
+    by_district_code: Mapping[str, BranchInfo]
+    by_branch_code: Mapping[str, tuple[BranchInfo, ...]]
+    by_name: Mapping[str, tuple[BranchInfo, ...]]
+    by_branch_name: Mapping[str, tuple[BranchInfo, ...]]
+
+    @classmethod
+    def build(cls, rows: Iterable[BranchInfo]) -> DistrictIndex:
+        rows = tuple(rows)
+        by_branch: defaultdict[str, list[BranchInfo]] = defaultdict(list)
+        by_name: defaultdict[str, list[BranchInfo]] = defaultdict(list)
+        by_branch_name: defaultdict[str, list[BranchInfo]] = defaultdict(list)
+        for row in rows:
+            by_branch[row.branch_code].append(row)
+            by_name[normalize_name(row.sub_branch_name)].append(row)
+            by_branch_name[normalize_name(row.branch_name)].append(row)
+        return cls(
+            rows=rows,
+            by_district_code=MappingProxyType(
+                {row.branch_code + row.sub_branch_code: row for row in rows}
+            ),
+            by_branch_code=_freeze(by_branch),
+            by_name=_freeze(by_name),
+            by_branch_name=_freeze(by_branch_name),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, district_code: object) -> bool:
+        return district_code in self.by_district_code
+
+    def lookup(self, district_code: str) -> BranchInfo | None:
+        """The sub-branch for a 4-digit ``district_code``, or ``None``."""
+        return self.by_district_code.get(district_code)
+
+    def branch(self, branch_code: str) -> tuple[BranchInfo, ...]:
+        """Every sub-branch of ``branch_code`` (an aimag or the capital)."""
+        return self.by_branch_code.get(branch_code, ())
+
+    def named(self, name: str) -> tuple[BranchInfo, ...]:
+        """Sub-branches called ``name``."""
+        return self.by_name.get(normalize_name(name), ())
+
+    def branch_named(self, name: str) -> tuple[BranchInfo, ...]:
+        """Every sub-branch of the branch called ``name``."""
+        return self.by_branch_name.get(normalize_name(name), ())
+
+
+class DistrictCatalog(Catalog[GetDistrictCodeResponse, DistrictIndex]):
+    """TTL-cached :class:`DistrictIndex` over ``client.district_code``.
+
+    The district table changes rarely; by default it is fetched at most once
+    a day, so per-receipt lookups are in-memory dict hits::
+
+        catalog = DistrictCatalog(client.district_code)
+        branch = catalog.lookup("2501")            # sync
+        index = await catalog.aget()               # async
+        index.named("Баянзүрх")
+
+    This is a convenience for callers; the SDK itself never checks a
+    receipt's ``district_code`` against the table — the server does.
+    """
+
+    def __init__(
+        self,
+        resource: DistrictCodeResource,
+        *,
+        ttl_s: float = 24 * 60 * 60,
+        max_stale_s: float | None = None,
+        snapshot_store: SnapshotStore | None = None,
+        headers: HeaderTypes | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            ttl_s=ttl_s, max_stale_s=max_stale_s, snapshot_store=snapshot_store, clock=clock
+        )
+        self._resource = resource
+        self._headers = headers
+
+    def _fetch(self) -> GetDistrictCodeResponse:
+        return self._resource.read(headers=self._headers)
+
+    async def _afetch(self) -> GetDistrictCodeResponse:
+        return await self._resource.aread(headers=self._headers)
+
+    def _load_stored(self, store: SnapshotStore) -> Stored[GetDistrictCodeResponse] | None:
+        return store.load_districts()
+
+    def _save_stored(self, store: SnapshotStore, response: GetDistrictCodeResponse) -> None:
+        store.save_districts(response)
+
+    def _build(self, response: GetDistrictCodeResponse) -> DistrictIndex:
+        return DistrictIndex.build(response.data)
+
+    def lookup(self, district_code: str) -> BranchInfo | None:
+        """Shortcut for ``get().lookup(district_code)``."""
+        return self.get().lookup(district_code)
+
+    async def alookup(self, district_code: str) -> BranchInfo | None:
+        """Shortcut for ``(await aget()).lookup(district_code)``."""
+        return (await self.aget()).lookup(district_code)
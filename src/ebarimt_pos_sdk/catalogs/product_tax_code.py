@@ -0,0 +1,182 @@
+"""Effective-date index for product tax codes."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+
+from .._types import HeaderTypes
+from ..resources import GetProductTaxCodeResponse, ProductTaxCode, ProductTaxCodeResource
+from ..resources.enum import TaxType
+from ._base import Catalog
+from .store import SnapshotStore, Stored
+
+# The table's dates are naive Ulaanbaatar wall-clock times (UTC+8, no DST).
+ULAANBAATAR = timezone(timedelta(hours=8))
+
+
+def _local(when: datetime) -> datetime:
+    """``when`` as a naive Ulaanbaatar time, comparable with the table."""
+    if when.tzinfo is None:
+        return when
+    return when.astimezone(ULAANBAATAR).replace(tzinfo=None)
+
+
+def _now() -> datetime:
+    return datetime.now(ULAANBAATAR).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class _Intervals:
+    """One code's rows sorted by ``start_date``, with the starts alongside
+    for ``bisect`` and ``reach[i]``, the latest end among rows ``0..i``
+    (``datetime.max`` once one is open-ended)."""
+
+    starts: tuple[datetime, ...]
+    ends: tuple[datetime | None, ...]
+    reach: tuple[datetime, ...]
+    rows: tuple[ProductTaxCode, ...]
+
+    def at(self, when: datetime) -> ProductTaxCode | None:
+        # Latest interval starting at or before ``when`` that has not ended.
+        # Intervals for one code normally do not overlap, so the first
+        # candidate is the answer, and ``reach`` stops the walk back at once
+        # when no earlier row is still in effect. Only overlapping rows (a
+        # newer row that ended inside an older, still-open one) walk further.
+        i = bisect_right(self.starts, when) - 1
+        while i >= 0 and when < self.reach[i]:
+            end = self.ends[i]
+            if end is None or when < end:
+                return self.rows[i]
+            i -= 1
+        return None
+
+
+@dataclass(frozen=True)
+class ProductTaxCodeIndex:
+    """Per-code sorted validity intervals over one ``getProductTaxCode``
+    response.
+
+    A row applies from ``start_date`` (inclusive) to ``end_date`` (exclusive;
+    ``None`` = open-ended). Lookups take ``O(log k)`` for the ``k`` rows of a
+    code when its rows do not overlap; overlapping rows can add a short walk
+    back. Naive ``when`` values are read as Ulaanbaatar time, like the table;
+    aware ones are converted. ``when`` defaults to now.
+    """
+
+    rows: tuple[ProductTaxCode, ...]
+    by_code: Mapping[str, _Intervals]
+
+    @classmethod
+    def build(cls, rows: Iterable[ProductTaxCode]) -> ProductTaxCodeIndex:
+        rows = tuple(rows)
+        grouped: defaultdict[str, list[tuple[datetime, datetime | None, ProductTaxCode]]] = (
+            defaultdict(list)
+        )
+        for row in rows:
+            end = _local(row.end_date) if row.end_date is not None else None
+            grouped[row.tax_product_code].append((_local(row.start_date), end, row))
+        by_code: dict[str, _Intervals] = {}
+        for code, entries in grouped.items():
+            entries.sort(key=lambda entry: entry[0])
+            reach: list[datetime] = []
+            latest = datetime.min
+            for _, end, _ in entries:
+                latest = max(latest, datetime.max if end is None else end)
+                reach.append(latest)
+            by_code[code] = _Intervals(
+                starts=tuple(entry[0] for entry in entries),
+                ends=tuple(entry[1] for entry in entries),
+                reach=tuple(reach),
+                rows=tuple(entry[2] for entry in entries),
+            )
+        return cls(rows=rows, by_code=MappingProxyType(by_code))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, tax_product_code: object) -> bool:
+        return tax_product_code in self.by_code
+
+    def at(self, tax_product_code: str, when: datetime | None = None) -> ProductTaxCode | None:
+        """The row for ``tax_product_code`` in effect at ``when``, or ``None``
+        for an unknown code or one not in effect then."""
+        intervals = self.by_code.get(tax_product_code)
+        if intervals is None:
+            return None
+        return intervals.at(_local(when) if when is not None else _now())
+
+    def tax_type(self, tax_product_code: str, when: datetime | None = None) -> TaxType | None:
+        """Tax type of ``tax_product_code`` at ``when``, or ``None``."""
+        row = self.at(tax_product_code, when)
+        return row.tax_type_name if row is not None else None
+
+    def history(self, tax_product_code: str) -> tuple[ProductTaxCode, ...]:
+        """Every row for ``tax_product_code``, oldest first."""
+        intervals = self.by_code.get(tax_product_code)
+        return intervals.rows if intervals is not None else ()
+
+    def active(self, when: datetime | None = None) -> tuple[ProductTaxCode, ...]:
+        """All rows in effect at ``when`` (one pass over the codes)."""
+        moment = _local(when) if when is not None else _now()
+        found = (intervals.at(moment) for intervals in self.by_code.values())
+        return tuple(row for row in found if row is not None)
+
+
+class ProductTaxCodeCatalog(Catalog[GetProductTaxCodeResponse, ProductTaxCodeIndex]):
+    """TTL-cached :class:`ProductTaxCodeIndex` over ``client.product_tax_code``::
+
+        catalog = ProductTaxCodeCatalog(client.product_tax_code)
+        row = catalog.lookup("0002291")                       # in effect now
+        index = await catalog.aget()
+        index.tax_type("0002291", datetime(2025, 1, 1))
+
+    A convenience for attaching ``tax_product_code`` to VAT_FREE / VAT_ZERO
+    items in bulk; the SDK itself never checks codes against the table.
+    """
+
+    def __init__(
+        self,
+        resource: ProductTaxCodeResource,
+        *,
+        ttl_s: float = 6 * 60 * 60,
+        max_stale_s: float | None = None,
+        snapshot_store: SnapshotStore | None = None,
+        headers: HeaderTypes | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            ttl_s=ttl_s, max_stale_s=max_stale_s, snapshot_store=snapshot_store, clock=clock
+        )
+        self._resource = resource
+        self._headers = headers
+
+    def _fetch(self) -> GetProductTaxCodeResponse:
+        return self._resource.read(headers=self._headers)
+
+    async def _afetch(self) -> GetProductTaxCodeResponse:
+        return await self._resource.aread(headers=self._headers)
+
+    def _load_stored(self, store: SnapshotStore) -> Stored[GetProductTaxCodeResponse] | None:
+        return store.load_product_tax_codes()
+
+    def _save_stored(self, store: SnapshotStore, response: GetProductTaxCodeResponse) -> None:
+        store.save_product_tax_codes(response)
+
+    def _build(self, response: GetProductTaxCodeResponse) -> ProductTaxCodeIndex:
+        return ProductTaxCodeIndex.build(response.data)
+
+    def lookup(self, tax_product_code: str, when: datetime | None = None) -> ProductTaxCode | None:
+        """Shortcut for ``get().at(tax_product_code, when)``."""
+        return self.get().at(tax_product_code, when)
+
+    async def alookup(
+        self, tax_product_code: str, when: datetime | None = None
+    ) -> ProductTaxCode | None:
+        """Shortcut for ``(await aget()).at(tax_product_code, when)``."""
+        return (await self.aget()).at(tax_product_code, when)
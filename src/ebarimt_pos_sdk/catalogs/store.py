@@ -0,0 +1,282 @@
+"""SQLite store for the last good copy of each reference table.
+
+A process restart otherwise re-downloads district codes, product tax codes
+and the БҮНА tree before it can answer anything. :class:`SnapshotStore` keeps
+them in one SQLite file (stdlib ``sqlite3``, WAL mode, safe to share between
+worker processes):
+
+* each table's full response, for catalogs to rebuild their index from at
+  start-up (``DistrictCatalog(..., snapshot_store=store)``);
+* the rows themselves, keyed and indexed, so a single code can be looked up
+  with one indexed query and nothing else loaded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from ..resources import (
+    BranchInfo,
+    GetDistrictCodeResponse,
+    GetProductTaxCodeResponse,
+    ProductTaxCode,
+)
+from .buna import BunaBarcode, BunaNode, BunaSnapshot
+
+T = TypeVar("T")
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    name TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS districts (
+    district_code TEXT PRIMARY KEY,
+    branch_code TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS districts_branch ON districts (branch_code);
+CREATE TABLE IF NOT EXISTS product_tax_codes (
+    code TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS product_tax_codes_code ON product_tax_codes (code, start_date);
+CREATE TABLE IF NOT EXISTS buna_nodes (
+    code TEXT PRIMARY KEY,
+    parent TEXT,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS buna_nodes_parent ON buna_nodes (parent);
+CREATE TABLE IF NOT EXISTS buna_barcodes (
+    barcode TEXT NOT NULL,
+    code TEXT NOT NULL,
+    name TEXT NOT NULL,
+    registered_date TEXT
+);
+CREATE INDEX IF NOT EXISTS buna_barcodes_barcode ON buna_barcodes (barcode);
+CREATE INDEX IF NOT EXISTS buna_barcodes_code ON buna_barcodes (code);
+"""
+
+DISTRICTS = "districts"
+PRODUCT_TAX_CODES = "product_tax_codes"
+BUNA = "buna"
+
+
+@dataclass(frozen=True)
+class Stored(Generic[T]):
+    """A value read back from the store and when it was fetched (Unix time)."""
+
+    value: T
+    fetched_at: float
+
+
+def _node(path: str, name: str) -> BunaNode:
+    return BunaNode(tuple(path.split("/")), name)
+
+
+class SnapshotStore:
+    """One SQLite file holding district codes, product tax codes and БҮНА.
+
+    Each ``save_*`` replaces that dataset atomically; ``load_*`` returns the
+    whole dataset (or ``None`` if it was never saved); the remaining methods
+    are single indexed queries.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], *, clock: Callable[[], float] = time.time
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.fspath(path), check_same_thread=False, timeout=30)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                raise ValueError(f"SnapshotStore: unsupported schema version {version}")
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> SnapshotStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def now(self) -> float:
+        """Wall-clock time used for ``fetched_at`` (Unix seconds)."""
+        return self._clock()
+
+    def fetched_at(self, name: str) -> float | None:
+        """When dataset ``name`` was last saved, or ``None``."""
+        row = self._one("SELECT fetched_at FROM snapshots WHERE name = ?", (name,))
+        return row[0] if row else None
+
+    def _one(self, sql: str, params: tuple[object, ...]) -> tuple | None:
+        with self._lock:
+            return self._db.execute(sql, params).fetchone()
+
+    def _all(self, sql: str, params: tuple[object, ...]) -> list[tuple]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _replace(
+        self,
+        name: str,
+        body: bytes,
+        table_rows: Iterable[tuple[str, str, Iterable[tuple[object, ...]]]],
+    ) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO snapshots (name, fetched_at, body) VALUES (?, ?, ?)",
+                (name, self._clock(), body),
+            )
+            for table, insert, rows in table_rows:
+                self._db.execute(f"DELETE FROM {table}")  # table names are constants
+                self._db.executemany(insert, rows)
+
+    def _load_body(self, name: str) -> tuple[bytes, float] | None:
+        row = self._one("SELECT body, fetched_at FROM snapshots WHERE name = ?", (name,))
+        return (row[0], row[1]) if row else None
+
+    # --- district codes -----------------------------------------------------
+
+    def save_districts(self, response: GetDistrictCodeResponse) -> None:
+        rows = (
+            (
+                row.branch_code + row.sub_branch_code,
+                row.branch_code,
+                row.model_dump_json(by_alias=True),
+            )
+            for row in response.data
+        )
+        insert = "INSERT OR REPLACE INTO districts VALUES (?, ?, ?)"
+        self._replace(
+            DISTRICTS,
+            response.model_dump_json(by_alias=True).encode(),
+            [("districts", insert, rows)],
+        )
+
+    def load_districts(self) -> Stored[GetDistrictCodeResponse] | None:
+        stored = self._load_body(DISTRICTS)
+        if stored is None:
+            return None
+        return Stored(GetDistrictCodeResponse.model_validate_json(stored[0]), stored[1])
+
+    def district(self, district_code: str) -> BranchInfo | None:
+        row = self._one("SELECT body FROM districts WHERE district_code = ?", (district_code,))
+        return BranchInfo.model_validate_json(row[0]) if row else None
+
+    def branch(self, branch_code: str) -> tuple[BranchInfo, ...]:
+        rows = self._all(
+            "SELECT body FROM districts WHERE branch_code = ? ORDER BY district_code",
+            (branch_code,),
+        )
+        return tuple(BranchInfo.model_validate_json(body) for (body,) in rows)
+
+    # --- product tax codes --------------------------------------------------
+
+    def save_product_tax_codes(self, response: GetProductTaxCodeResponse) -> None:
+        rows = (
+            (row.tax_product_code, row.start_date.isoformat(), row.model_dump_json(by_alias=True))
+            for row in response.data
+        )
+        self._replace(
+            PRODUCT_TAX_CODES,
+            response.model_dump_json(by_alias=True).encode(),
+            [("product_tax_codes", "INSERT INTO product_tax_codes VALUES (?, ?, ?)", rows)],
+        )
+
+    def load_product_tax_codes(self) -> Stored[GetProductTaxCodeResponse] | None:
+        stored = self._load_body(PRODUCT_TAX_CODES)
+        if stored is None:
+            return None
+        return Stored(GetProductTaxCodeResponse.model_validate_json(stored[0]), stored[1])
+
+    def product_tax_codes(self, code: str) -> tuple[ProductTaxCode, ...]:
+        """Every row for ``code``, by start date."""
+        rows = self._all(
+            "SELECT body FROM product_tax_codes WHERE code = ? ORDER BY start_date", (code,)
+        )
+        return tuple(ProductTaxCode.model_validate_json(body) for (body,) in rows)
+
+    # --- БҮНА ---------------------------------------------------------------
+
+    def save_buna(self, snapshot: BunaSnapshot) -> None:
+        meta = {
+            "include_barcodes": snapshot.include_barcodes,
+            "max_depth": snapshot.max_depth,
+            "pending": [list(path) for path in snapshot.pending],
+        }
+        self._replace(
+            BUNA,
+            json.dumps(meta).encode(),
+            [
+                (
+                    "buna_nodes",
+                    "INSERT OR REPLACE INTO buna_nodes VALUES (?, ?, ?, ?)",
+                    ((n.code, n.parent, "/".join(n.path), n.name) for n in snapshot.nodes),
+                ),
+                (
+                    "buna_barcodes",
+                    "INSERT INTO buna_barcodes VALUES (?, ?, ?, ?)",
+                    (
+                        (b.barcode, b.classification_code, b.name, b.registered_date)
+                        for b in snapshot.barcodes
+                    ),
+                ),
+            ],
+        )
+
+    def load_buna(self) -> Stored[BunaSnapshot] | None:
+        stored = self._load_body(BUNA)
+        if stored is None:
+            return None
+        meta = json.loads(stored[0])
+        nodes = self._all("SELECT path, name FROM buna_nodes", ())
+        barcodes = self._all(
+            "SELECT code, barcode, name, registered_date FROM buna_barcodes ORDER BY code, rowid",
+            (),
+        )
+        snapshot = BunaSnapshot(
+            nodes=tuple(sorted((_node(p, n) for p, n in nodes), key=lambda node: node.path)),
+            barcodes=tuple(BunaBarcode(*row) for row in barcodes),
+            include_barcodes=meta["include_barcodes"],
+            max_depth=meta["max_depth"],
+            pending=tuple(tuple(path) for path in meta["pending"]),
+        )
+        return Stored(snapshot, stored[1])
+
+    def buna_node(self, code: str) -> BunaNode | None:
+        row = self._one("SELECT path, name FROM buna_nodes WHERE code = ?", (code,))
+        return _node(*row) if row else None
+
+    def buna_children(self, code: str | None = None) -> tuple[BunaNode, ...]:
+        """Direct children of ``code``; the Салбар list when ``code`` is ``None``."""
+        if code is None:
+            rows = self._all("SELECT path, name FROM buna_nodes WHERE parent IS NULL", ())
+        else:
+            rows = self._all("SELECT path, name FROM buna_nodes WHERE parent = ?", (code,))
+        return tuple(sorted((_node(*row) for row in rows), key=lambda node: node.code))
+
+    def buna_barcode(self, barcode: str) -> BunaBarcode | None:
+        row = self._one(
+            "SELECT code, barcode, name, registered_date FROM buna_barcodes WHERE barcode = ?",
+            (barcode,),
+        )
+        return BunaBarcode(*row) if row else None
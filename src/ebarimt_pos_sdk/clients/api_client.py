@@ -4,11 +4,13 @@ from .._types import HeaderTypes
 from ..resources import (
     BunaResource,
     DistrictCodeResource,
+    LookupCache,
     MerchantInfoResource,
     ProductTaxCodeResource,
     TinInfoResource,
 )
 from ..settings import ApiClientSettings
+from ..transport import HedgeStats
 from .base_client import EbarimtBaseClient
 
 
@@ -43,6 +45,9 @@ class EbarimtApiClient(EbarimtBaseClient):
             async_client=async_client,
             headers=headers,
             proxy=proxy,
+            # Hedging is async-only: a sync caller blocked on one request
+            # cannot race a second.
+            hedge=settings.hedge,
         )
 
         # Resources
@@ -51,14 +56,17 @@ class EbarimtApiClient(EbarimtBaseClient):
             async_=self._async_transport,
         )
 
+        cache = settings.lookup_cache
         self.tin_info = TinInfoResource(
             sync=self._sync_transport,
             async_=self._async_transport,
+            cache=LookupCache(cache) if cache is not None else None,
         )
 
         self.merchant_info = MerchantInfoResource(
             sync=self._sync_transport,
             async_=self._async_transport,
+            cache=LookupCache(cache) if cache is not None else None,
         )
 
         self.product_tax_code = ProductTaxCodeResource(
@@ -70,3 +78,9 @@ class EbarimtApiClient(EbarimtBaseClient):
             sync=self._sync_transport,
             async_=self._async_transport,
         )
+
+    @property
+    def hedge_stats(self) -> HedgeStats | None:
+        """Hedging counters for the async resources (``None`` unless
+        ``settings.hedge`` is set)."""
+        return self._async_transport.hedge_stats
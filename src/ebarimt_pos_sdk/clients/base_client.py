@@ -5,9 +5,21 @@ from types import TracebackType
 import httpx
 from typing_extensions import Self
 
+from .._json import get_json_backend
 from .._types import HeaderTypes
 from ..settings.base_settings import BaseSettings
-from ..transport import AsyncTransport, SyncTransport
+from ..settings.hedge_settings import HedgeSettings
+from ..transport import (
+    AsyncTransport,
+    CircuitBreakerRegistry,
+    ConcurrencyStats,
+    ConditionalCache,
+    ConditionalStats,
+    RateLimiter,
+    RetryBudget,
+    SingleFlightStats,
+    SyncTransport,
+)
 
 
 class EbarimtBaseClient:
@@ -23,6 +35,7 @@ class EbarimtBaseClient:
         async_client: httpx.AsyncClient | None = None,
         headers: HeaderTypes | None = None,
         proxy: str | httpx.Proxy | None = None,
+        hedge: HedgeSettings | None = None,
     ) -> None:
         # A proxy can only be applied to a client the SDK builds itself. An
         # injected client is already constructed, so passing both is a
@@ -41,12 +54,27 @@ class EbarimtBaseClient:
 
         self._base_url = self._settings.base_url
 
+        # One Limits object for both owned clients: the sync and async pools are
+        # separate, but are sized identically from the settings.
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry_s,
+        )
+
+        sync_http_transport, async_http_transport = self._build_http_transports(limits)
+        trust_env = self._trust_env()
+
         self._sync_client = sync_client or httpx.Client(
             base_url=self._base_url,
             timeout=settings.timeout_s,
             verify=settings.verify_tls,
             headers=headers,
             proxy=proxy,
+            limits=limits,
+            http2=settings.http2,
+            trust_env=trust_env,
+            transport=sync_http_transport,
         )
         self._async_client = async_client or httpx.AsyncClient(
             base_url=self._base_url,
@@ -54,6 +82,10 @@ class EbarimtBaseClient:
             verify=settings.verify_tls,
             headers=headers,
             proxy=proxy,
+            limits=limits,
+            http2=settings.http2,
+            trust_env=trust_env,
+            transport=async_http_transport,
         )
 
         # When the caller injects their own client, apply the SDK-level headers
@@ -66,8 +98,97 @@ class EbarimtBaseClient:
             if not self._owns_async:
                 self._async_client.headers.update(headers)
 
-        self._sync_transport = SyncTransport(self._sync_client, retry=settings.retry)
-        self._async_transport = AsyncTransport(self._async_client, retry=settings.retry)
+        # The retry budget is per client, not per transport: sync and async
+        # traffic draw from (and refill) the same bucket.
+        self._retry_budget = RetryBudget.from_settings(settings.retry)
+
+        self._circuit_breakers = (
+            CircuitBreakerRegistry(settings.circuit_breaker)
+            if settings.circuit_breaker is not None
+            else None
+        )
+
+        # Like the retry budget, rate limits are per client: sync and async
+        # calls to the same path draw from the same bucket.
+        self._rate_limiter = RateLimiter.from_settings(settings.rate_limits)
+
+        json_backend = get_json_backend(settings.json_backend)
+
+        # One store of validators for both transports, so a table read sync
+        # can be revalidated by an async call and vice versa.
+        self._conditional = ConditionalCache() if settings.conditional_gets else None
+
+        self._sync_transport = SyncTransport(
+            self._sync_client,
+            retry=settings.retry,
+            retry_budget=self._retry_budget,
+            circuit_breakers=self._circuit_breakers,
+            deadline_s=settings.deadline_s,
+            coalesce_gets=settings.coalesce_gets,
+            rate_limiter=self._rate_limiter,
+            json_backend=json_backend,
+            conditional=self._conditional,
+        )
+        self._async_transport = AsyncTransport(
+            self._async_client,
+            retry=settings.retry,
+            retry_budget=self._retry_budget,
+            circuit_breakers=self._circuit_breakers,
+            deadline_s=settings.deadline_s,
+            coalesce_gets=settings.coalesce_gets,
+            rate_limiter=self._rate_limiter,
+            json_backend=json_backend,
+            hedge=hedge,
+            adaptive_concurrency=settings.adaptive_concurrency,
+            conditional=self._conditional,
+        )
+
+    def _build_http_transports(
+        self, limits: httpx.Limits
+    ) -> tuple[httpx.BaseTransport | None, httpx.AsyncBaseTransport | None]:
+        """Custom httpx transports for the clients the SDK builds; ``None``
+        lets httpx build its default from ``limits``/``http2``/``verify``.
+        Subclasses override this for connection-level options."""
+        return None, None
+
+    def _trust_env(self) -> bool:
+        """httpx ``trust_env`` for the clients the SDK builds; subclasses
+        turn it off when the environment must not pick the route."""
+        return self._settings.trust_env
+
+    @property
+    def circuit_breakers(self) -> CircuitBreakerRegistry | None:
+        """Per-host breaker registry (``None`` unless ``settings.circuit_breaker``
+        is set). ``client.circuit_breakers.snapshot()`` feeds dashboards."""
+        return self._circuit_breakers
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Per-path token buckets (``None`` unless ``settings.rate_limits`` is
+        set). ``client.rate_limiter.stats()`` reports requests and waits."""
+        return self._rate_limiter
+
+    @property
+    def single_flight_stats(self) -> SingleFlightStats | None:
+        """GET-coalescing counters summed over the sync and async transports
+        (``None`` unless ``settings.coalesce_gets`` is set)."""
+        sync_stats = self._sync_transport.single_flight_stats
+        async_stats = self._async_transport.single_flight_stats
+        if sync_stats is None or async_stats is None:
+            return None
+        return sync_stats + async_stats
+
+    @property
+    def conditional_stats(self) -> ConditionalStats | None:
+        """Conditional-GET counters for sync and async calls (``None`` unless
+        ``settings.conditional_gets`` is set)."""
+        return self._conditional.stats if self._conditional is not None else None
+
+    @property
+    def concurrency_stats(self) -> ConcurrencyStats | None:
+        """Adaptive concurrency limiter state for async calls (``None`` unless
+        ``settings.adaptive_concurrency`` is set)."""
+        return self._async_transport.concurrency_stats
 
     def close(self) -> None:
         if self._owns_sync:
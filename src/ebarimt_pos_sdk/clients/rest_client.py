@@ -3,7 +3,14 @@ from __future__ import annotations
 import httpx
 
 from .._types import HeaderTypes
-from ..resources import BankAccountsResource, InfoResource, ReceiptResource, SendDataResource
+from ..resources import (
+    BankAccountsResource,
+    InfoResource,
+    LookupCache,
+    ReceiptLedger,
+    ReceiptResource,
+    SendDataResource,
+)
 from ..settings.rest_client_settings import RestClientSettings
 from .base_client import EbarimtBaseClient
 
@@ -27,9 +34,13 @@ class EbarimtRestClient(EbarimtBaseClient):
         )
 
         # Resources
+        idempotency = settings.receipt_idempotency
         self.receipt = ReceiptResource(
             sync=self._sync_transport,
             async_=self._async_transport,
+            ledger=ReceiptLedger(idempotency, retry=settings.retry)
+            if idempotency is not None
+            else None,
         )
         self.info = InfoResource(
             sync=self._sync_transport,
@@ -39,7 +50,48 @@ class EbarimtRestClient(EbarimtBaseClient):
             sync=self._sync_transport,
             async_=self._async_transport,
         )
+        cache = settings.bank_account_cache
         self.bank_accounts = BankAccountsResource(
             sync=self._sync_transport,
             async_=self._async_transport,
+            cache=LookupCache(cache) if cache is not None else None,
         )
+
+    def _build_http_transports(
+        self, limits: httpx.Limits
+    ) -> tuple[httpx.BaseTransport | None, httpx.AsyncBaseTransport | None]:
+        settings = self._settings
+        if not isinstance(settings, RestClientSettings) or (
+            settings.uds is None and settings.socket_options is None
+        ):
+            return None, None
+        # A custom transport replaces httpx's default one, so the pool, TLS
+        # and HTTP/2 settings must be handed to it directly.
+        trust_env = self._trust_env()
+        return (
+            httpx.HTTPTransport(
+                verify=settings.verify_tls,
+                http2=settings.http2,
+                limits=limits,
+                trust_env=trust_env,
+                uds=settings.uds,
+                socket_options=settings.socket_options,
+            ),
+            httpx.AsyncHTTPTransport(
+                verify=settings.verify_tls,
+                http2=settings.http2,
+                limits=limits,
+                trust_env=trust_env,
+                uds=settings.uds,
+                socket_options=settings.socket_options,
+            ),
+        )
+
+    def _trust_env(self) -> bool:
+        # With trust_env, httpx mounts proxy transports from HTTP(S)_PROXY /
+        # ALL_PROXY, and requests would leave through them instead of the
+        # Unix socket.
+        settings = self._settings
+        if isinstance(settings, RestClientSettings) and settings.uds is not None:
+            return False
+        return settings.trust_env
@@ -58,6 +58,51 @@ class PosApiTransportError(PosApiError):
     """Network / timeout / DNS / TLS errors."""
 
 
+class PosApiCircuitOpenError(PosApiTransportError):
+    """The circuit breaker for the target host is open; the request was not sent."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        host: str,
+        retry_in_s: float,
+        request: httpx.Request | None = None,
+    ) -> None:
+        super().__init__(message, request=request)
+        self.host = host
+        self.retry_in_s = retry_in_s
+
+
+class PosApiDeadlineExceededError(PosApiTransportError):
+    """The call's overall deadline ran out across its attempts and backoffs."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        deadline_s: float,
+        request: httpx.Request | None = None,
+        response: httpx.Response | None = None,
+        cause: Exception | None = None,
+    ) -> None:
+        super().__init__(message, request=request, response=response, cause=cause)
+        self.deadline_s = deadline_s
+
+
+class PosApiAmbiguousReceiptError(PosApiError):
+    """An earlier attempt to issue this receipt failed after it may have reached
+    PosAPI, and nothing has established whether it was issued.
+
+    Raised by a receipt idempotency ledger instead of sending the receipt
+    again. ``cause`` is the failure of that earlier attempt.
+    """
+
+    def __init__(self, message: str, *, key: str, cause: Exception | None = None) -> None:
+        super().__init__(message, cause=cause)
+        self.key = key
+
+
 class PosApiDecodeError(PosApiError):
     """Response body was not valid JSON when JSON was expected."""
 
@@ -0,0 +1,14 @@
+"""
+Durable receipt outbox: checkout journals receipts to local SQLite and a
+background worker sends them to PosAPI, so a sale never waits on (or is lost
+to) a slow or unavailable PosAPI.
+"""
+
+from .receipt_outbox import OutboxEntry, OutboxStats, OutboxStatus, ReceiptOutbox
+
+__all__ = [
+    "OutboxEntry",
+    "OutboxStats",
+    "OutboxStatus",
+    "ReceiptOutbox",
+]
@@ -0,0 +1,563 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from ..errors import (
+    PosApiAmbiguousReceiptError,
+    PosApiCircuitOpenError,
+    PosApiError,
+    PosApiTransportError,
+)
+from ..resources import CreateReceiptRequest, CreateReceiptResponse, ItemResult, ReceiptResource
+from ..resources.idempotency import is_ambiguous
+from ..settings.outbox_settings import OutboxSettings
+from ..transport.retry import NOT_SENT_ERRORS
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS receipts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT UNIQUE,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    backoff_s REAL,
+    next_attempt_at REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    response BLOB,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS receipts_due ON receipts (status, next_attempt_at);
+"""
+
+# Statuses that leave the journal's "to do" set; never claimed again.
+_FINAL = ("sent", "failed", "needs_reconcile")
+
+
+class OutboxStatus(str, Enum):
+    """Where a journaled receipt is in its life."""
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+    NEEDS_RECONCILE = "needs_reconcile"
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """A journaled receipt, as returned by :meth:`ReceiptOutbox.status`.
+
+    ``response`` is set once PosAPI has answered: for ``SENT``, and for
+    ``FAILED`` when PosAPI answered with ``status="ERROR"``. ``error`` is the
+    last error raised while sending, if any.
+    """
+
+    id: int
+    key: str | None
+    status: OutboxStatus
+    attempts: int
+    enqueued_at: float
+    updated_at: float
+    next_attempt_at: float | None
+    response: CreateReceiptResponse | None
+    error: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxStats:
+    """Journal counts by status."""
+
+    pending: int = 0
+    sending: int = 0
+    sent: int = 0
+    failed: int = 0
+    needs_reconcile: int = 0
+
+
+# id, payload, attempts, backoff_s, and the lease expiry written by the claim.
+_Claimed = tuple[int, bytes, int, float | None, float]
+_Result = ItemResult[CreateReceiptRequest | dict[str, Any], CreateReceiptResponse]
+
+
+def _describe(error: Exception) -> str:
+    """One line for the journal; the full error (request, cause) is logged."""
+    message = error.message if isinstance(error, PosApiError) else str(error)
+    return f"{type(error).__name__}: {' / '.join(message.splitlines())}"
+
+
+class ReceiptOutbox:
+    """Durable queue between checkout and PosAPI.
+
+    ``enqueue`` writes the receipt to a local SQLite journal (WAL mode) and
+    returns its id; it never touches the network. A worker — a daemon thread
+    (``start``) or a task on the running loop (``astart``) — claims due
+    receipts in batches, sends them through ``receipts.create_many`` /
+    ``acreate_many`` and records each outcome.
+
+    ``POST /rest/receipt`` is not idempotent, so only a send that never
+    left the client (no connection, an open circuit) is retried, with
+    backoff across rounds, up to ``settings.retry.max_retries`` attempts. A
+    failure after PosAPI may have received the receipt (a read timeout, a
+    5xx) marks it ``NEEDS_RECONCILE`` — unless ``receipts`` has a
+    :class:`~ebarimt_pos_sdk.resources.ReceiptLedger` with a ``reconcile``
+    hook, which checks before each resend, in which case it is retried too.
+    Anything else fails the receipt at once, for a person to look at.
+
+    Several processes may share one journal: a claimed receipt is leased for
+    ``settings.lease_s``, and one whose worker died is claimed again when the
+    lease runs out. Such a receipt may already have been issued, so PosAPI
+    can see it twice; pair the outbox with idempotent receipt creation.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        receipts: ReceiptResource,
+        *,
+        settings: OutboxSettings | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._receipts = receipts
+        self._settings = settings or OutboxSettings()
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Autocommit: every enqueue is its own transaction, and claims use an
+        # explicit BEGIN IMMEDIATE so two workers never claim the same row.
+        self._db = sqlite3.connect(
+            os.fspath(path), check_same_thread=False, timeout=30, isolation_level=None
+        )
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(f"PRAGMA synchronous={'FULL' if self._settings.durable else 'NORMAL'}")
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                raise ValueError(f"ReceiptOutbox: unsupported schema version {version}")
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_wake: asyncio.Event | None = None
+        self._async_stopping = False
+        self._closed = False
+
+    @property
+    def settings(self) -> OutboxSettings:
+        return self._settings
+
+    def close(self) -> None:
+        """Stop the workers and close the journal.
+
+        A task worker is joined when its loop runs on another thread. Called
+        from the worker's own loop, it can only be cancelled: a receipt it
+        was sending stays claimed until its lease runs out. Async code should
+        ``await aclose()``, which lets the round finish.
+        """
+        self.stop()
+        self._stop_task()
+        with self._lock:
+            self._closed = True
+            self._db.close()
+
+    async def aclose(self) -> None:
+        """Stop the workers, letting a task worker finish its round, and
+        close the journal."""
+        await self.astop()
+        self.close()
+
+    def __enter__(self) -> ReceiptOutbox:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> ReceiptOutbox:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    # --- producer side ------------------------------------------------------
+
+    def enqueue(
+        self, payload: CreateReceiptRequest | dict[str, Any], *, key: str | None = None
+    ) -> int:
+        """Journal a receipt for sending and return its id.
+
+        ``payload`` is validated here, so a malformed receipt raises
+        ``PosApiValidationError`` at checkout rather than failing later. A
+        ``key`` (e.g. the sale id) makes the enqueue idempotent: enqueuing
+        the same key again returns the existing id.
+        """
+        body = self._receipts.to_json(payload)
+        now = self._clock()
+        with self._lock:
+            try:
+                cursor = self._db.execute(
+                    "INSERT INTO receipts (key, payload, status, next_attempt_at, enqueued_at,"
+                    " updated_at) VALUES (?, ?, 'pending', ?, ?, ?)",
+                    (key, body, now, now, now),
+                )
+                entry_id = cursor.lastrowid
+                assert entry_id is not None  # set by every successful INSERT
+            except sqlite3.IntegrityError:
+                if key is None:
+                    raise
+                row = self._db.execute("SELECT id FROM receipts WHERE key = ?", (key,)).fetchone()
+                return int(row[0])
+        self._notify()
+        return entry_id
+
+    def _notify(self) -> None:
+        self._wake.set()
+        loop, wake = self._loop, self._async_wake
+        if loop is not None and wake is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wake.set)
+
+    # --- status -------------------------------------------------------------
+
+    def status(self, entry_id: int) -> OutboxEntry | None:
+        """The journal entry ``entry_id``, or ``None``."""
+        return self._entry("id = ?", entry_id)
+
+    def status_by_key(self, key: str) -> OutboxEntry | None:
+        """The journal entry enqueued with ``key``, or ``None``."""
+        return self._entry("key = ?", key)
+
+    def _entry(self, where: str, value: object) -> OutboxEntry | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, key, status, attempts, enqueued_at, updated_at, next_attempt_at,"
+                f" response, error FROM receipts WHERE {where}",
+                (value,),
+            ).fetchone()
+        if row is None:
+            return None
+        status = OutboxStatus(row[2])
+        return OutboxEntry(
+            id=row[0],
+            key=row[1],
+            status=status,
+            attempts=row[3],
+            enqueued_at=row[4],
+            updated_at=row[5],
+            next_attempt_at=None if status.value in _FINAL else row[6],
+            response=CreateReceiptResponse.model_validate_json(row[7]) if row[7] else None,
+            error=row[8],
+        )
+
+    def failed(self, *, limit: int = 100) -> list[OutboxEntry]:
+        """Receipts that will not be retried, oldest first."""
+        with self._lock:
+            ids = self._db.execute(
+                "SELECT id FROM receipts WHERE status = 'failed' ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+        return [entry for (entry_id,) in ids if (entry := self.status(entry_id)) is not None]
+
+    def unresolved(self, *, limit: int = 100) -> list[OutboxEntry]:
+        """Receipts PosAPI may or may not have issued, oldest first. Check
+        PosAPI for each; :meth:`requeue` one that was certainly not issued."""
+        with self._lock:
+            ids = self._db.execute(
+                "SELECT id FROM receipts WHERE status = 'needs_reconcile' ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [entry for (entry_id,) in ids if (entry := self.status(entry_id)) is not None]
+
+    def requeue(self, entry_id: int) -> bool:
+        """Send a ``FAILED`` or ``NEEDS_RECONCILE`` receipt again, with its
+        attempts reset. Returns ``False`` if there is no such entry."""
+        now = self._clock()
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE receipts SET status = 'pending', attempts = 0, backoff_s = NULL,"
+                " next_attempt_at = ?, updated_at = ? WHERE id = ?"
+                " AND status IN ('failed', 'needs_reconcile')",
+                (now, now, entry_id),
+            )
+        if cursor.rowcount:
+            self._notify()
+        return bool(cursor.rowcount)
+
+    def stats(self) -> OutboxStats:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM receipts GROUP BY status"
+            ).fetchall()
+        return OutboxStats(**dict(rows))
+
+    def prune(self, older_than_s: float) -> int:
+        """Delete receipts sent more than ``older_than_s`` ago; returns how many."""
+        cutoff = self._clock() - older_than_s
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM receipts WHERE status = 'sent' AND updated_at < ?", (cutoff,)
+            )
+        return cursor.rowcount
+
+    # --- consumer side ------------------------------------------------------
+
+    def _claim(self) -> list[_Claimed]:
+        now = self._clock()
+        lease_until = now + self._settings.lease_s
+        with self._transaction() as db:
+            rows = db.execute(
+                "SELECT id, payload, attempts, backoff_s FROM receipts"
+                " WHERE status IN ('pending', 'sending') AND next_attempt_at <= ?"
+                " ORDER BY next_attempt_at, id LIMIT ?",
+                (now, self._settings.batch_size),
+            ).fetchall()
+            db.executemany(
+                "UPDATE receipts SET status = 'sending', next_attempt_at = ?, updated_at = ?"
+                " WHERE id = ?",
+                [(lease_until, now, row[0]) for row in rows],
+            )
+        return [(*row, lease_until) for row in rows]
+
+    def _outcome(self, error: Exception) -> str:
+        """Status for a failed send: ``pending`` (retry), ``needs_reconcile``
+        or ``failed``."""
+        if isinstance(error, PosApiCircuitOpenError):
+            return "pending"
+        if isinstance(error, PosApiTransportError) and isinstance(
+            error.cause or error.__cause__, NOT_SENT_ERRORS
+        ):
+            return "pending"
+        if isinstance(error, PosApiAmbiguousReceiptError) or not isinstance(error, PosApiError):
+            # An unexpected error may have come after PosAPI issued the receipt.
+            return "needs_reconcile"
+        if is_ambiguous(error):
+            ledger = self._receipts.ledger
+            reconciles = ledger is not None and ledger.settings.reconcile is not None
+            return "pending" if reconciles else "needs_reconcile"
+        return "failed"
+
+    def _record(self, claimed: _Claimed, result: _Result) -> None:
+        """Journal ``result``, unless the claim's lease was lost meanwhile
+        (another worker claimed the receipt again, or it was requeued)."""
+        entry_id, _, attempts, backoff_s, lease_until = claimed
+        attempts += 1
+        now = self._clock()
+        retry = self._settings.retry
+        if result.error is None:
+            response = result.unwrap()
+            status = "failed" if response.status == "ERROR" else "sent"
+            values: tuple[Any, ...] = (
+                status,
+                attempts,
+                backoff_s,
+                now,
+                response.model_dump_json(by_alias=True).encode(),
+                None,
+            )
+            if status == "failed":
+                logger.warning("receipt outbox: entry %d rejected by PosAPI", entry_id)
+        elif (outcome := self._outcome(result.error)) == "pending" and (
+            attempts < retry.max_retries
+        ):
+            sleep_s = retry.sleep_seconds(attempts - 1, previous=backoff_s)
+            values = ("pending", attempts, sleep_s, now + sleep_s, None, _describe(result.error))
+        elif outcome == "needs_reconcile":
+            logger.warning(
+                "receipt outbox: entry %d may have been issued, needs reconciling: %s",
+                entry_id,
+                result.error,
+            )
+            values = (outcome, attempts, backoff_s, now, None, _describe(result.error))
+        else:
+            logger.warning(
+                "receipt outbox: entry %d failed after %d attempt(s): %s",
+                entry_id,
+                attempts,
+                result.error,
+            )
+            values = ("failed", attempts, backoff_s, now, None, _describe(result.error))
+        with self._lock:
+            if self._closed:
+                # A cancelled task worker's last write; the lease expires instead.
+                return
+            cursor = self._db.execute(
+                "UPDATE receipts SET status = ?, attempts = ?, backoff_s = ?,"
+                " next_attempt_at = ?, response = ?, error = ?, updated_at = ? WHERE id = ?"
+                " AND status = 'sending' AND next_attempt_at = ?",
+                (*values, now, entry_id, lease_until),
+            )
+        if not cursor.rowcount:
+            logger.warning(
+                "receipt outbox: entry %d lease lost before its outcome was recorded", entry_id
+            )
+
+    @staticmethod
+    def _request(claimed: _Claimed) -> CreateReceiptRequest:
+        return CreateReceiptRequest.model_validate_json(claimed[1])
+
+    def run_once(self) -> int:
+        """Claim one batch of due receipts, send it, and record the outcomes.
+        Returns the number of receipts claimed (``0`` when nothing is due)."""
+        claimed = self._claim()
+        if not claimed:
+            return 0
+        by_index = dict(enumerate(claimed))
+        results = self._receipts.create_many(
+            (self._request(row) for row in claimed),
+            concurrency=self._settings.concurrency,
+            ordered=False,
+        )
+        for result in results:
+            self._record(by_index[result.index], result)
+        return len(claimed)
+
+    async def arun_once(self) -> int:
+        """Async variant of :meth:`run_once`. The journal is read and written
+        from a worker thread, so a busy or fsyncing journal never blocks the
+        event loop."""
+        claimed = await asyncio.to_thread(self._claim)
+        if not claimed:
+            return 0
+        by_index = dict(enumerate(claimed))
+        results = self._receipts.acreate_many(
+            (self._request(row) for row in claimed),
+            concurrency=self._settings.concurrency,
+            ordered=False,
+        )
+        async for result in results:
+            await asyncio.to_thread(self._record, by_index[result.index], result)
+        return len(claimed)
+
+    def drain(self) -> int:
+        """Send everything due now, round after round; returns receipts claimed."""
+        total = 0
+        while count := self.run_once():
+            total += count
+        return total
+
+    async def adrain(self) -> int:
+        """Async variant of :meth:`drain`."""
+        total = 0
+        while count := await self.arun_once():
+            total += count
+        return total
+
+    def _idle_wait_s(self) -> float:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM receipts WHERE status IN ('pending', 'sending')"
+            ).fetchone()
+        if row[0] is None:
+            return self._settings.poll_interval_s
+        return min(self._settings.poll_interval_s, max(0.0, row[0] - self._clock()))
+
+    # --- workers ------------------------------------------------------------
+
+    def start(self) -> None:
+        """Run the worker on a daemon thread until :meth:`stop`."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="receipt-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_s: float | None = None) -> None:
+        """Stop the thread worker after its current round."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception:
+                logger.warning("receipt outbox: worker round failed", exc_info=True)
+            self._wake.wait(self._idle_wait_s())
+            self._wake.clear()
+
+    def astart(self) -> None:
+        """Run the worker as a task on the running loop until :meth:`astop`."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        self._async_stopping = False
+        self._task = self._loop.create_task(self._arun(self._async_wake))
+
+    def _stop_task(self) -> None:
+        """Stop the task worker from synchronous code (see :meth:`close`)."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        self._async_stopping = True
+        loop = task.get_loop()
+        if loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop or not loop.is_running():
+            task.cancel()
+            return
+        if self._async_wake is not None:
+            loop.call_soon_threadsafe(self._async_wake.set)
+        asyncio.run_coroutine_threadsafe(asyncio.wait([task]), loop).result()
+        self._loop = None
+
+    async def astop(self) -> None:
+        """Stop the task worker after its current round.
+
+        The round is allowed to finish rather than cancelled: a receipt cut
+        off mid-request would stay claimed, with its outcome unknown, until
+        its lease ran out.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        self._async_stopping = True
+        if self._async_wake is not None:
+            self._async_wake.set()
+        await task
+        self._loop = None
+
+    async def _arun(self, wake: asyncio.Event) -> None:
+        while not self._async_stopping:
+            try:
+                if await self.arun_once():
+                    continue
+            except Exception:
+                logger.warning("receipt outbox: worker round failed", exc_info=True)
+            try:
+                await asyncio.wait_for(wake.wait(), await asyncio.to_thread(self._idle_wait_s))
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
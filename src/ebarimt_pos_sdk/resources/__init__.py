@@ -12,7 +12,10 @@ from .api.merchant.merchant import MerchantInfoResource
 from .api.merchant.schema import GetInfoResponse
 from .api.product.product import ProductTaxCodeResource
 from .api.product.schema import GetProductTaxCodeResponse, ProductTaxCode
+from .batch import BatchResult, ItemResult
+from .cache import CacheStats, LookupCache
 from .enum import BarCodeType, PaymentCode, PaymentStatus, ReceiptCreateStatus, ReceiptType, TaxType
+from .idempotency import LedgerStats, ReceiptLedger, receipt_key
 from .rest.bank_accounts.bank_accounts import BankAccountsResource
 from .rest.info.info import InfoResource
 from .rest.receipt.receipt import ReceiptResource
@@ -21,10 +24,15 @@ from .rest.receipt.schema import (
     CreateReceiptResponse,
     DeleteReceiptRequest,
     Item,
+    ItemTaxes,
     Payment,
     PaymentCardData,
     ReceiptItemData,
+    ReceiptTaxCalculator,
     SubReceipt,
+    TaxIssue,
+    TaxRates,
+    trusted_receipt_json,
 )
 from .rest.send_data.send_data import SendDataResource
 
@@ -34,7 +42,14 @@ __all__ = [
     "SendDataResource",
     "BankAccountsResource",
     "BarCodeType",
+    "BatchResult",
+    "ItemResult",
     "BunaResource",
+    "CacheStats",
+    "LookupCache",
+    "LedgerStats",
+    "ReceiptLedger",
+    "receipt_key",
     "CreateReceiptRequest",
     "GetBunaResponse",
     "GetProductTaxCodeResponse",
@@ -52,6 +67,11 @@ __all__ = [
     "ReceiptItemData",
     "ReceiptType",
     "TaxType",
+    "trusted_receipt_json",
+    "ItemTaxes",
+    "ReceiptTaxCalculator",
+    "TaxIssue",
+    "TaxRates",
     "DistrictCodeResource",
     "TinInfoResource",
     "BranchInfo",
@@ -55,18 +55,24 @@ class BunaResource(BaseResource):
             return self._path
         return self._path + "/" + "/".join(s.strip() for s in segments)
 
-    def read(self, *segments: str, headers: HeaderTypes | None = None) -> GetBunaResponse:
+    def read(
+        self, *segments: str, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetBunaResponse:
         return self._send_sync_request(
             "GET",
             path=self._build_path(segments),
             headers=headers,
+            deadline_s=deadline_s,
             response_model=GetBunaResponse,
         )
 
-    async def aread(self, *segments: str, headers: HeaderTypes | None = None) -> GetBunaResponse:
+    async def aread(
+        self, *segments: str, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetBunaResponse:
         return await self._send_async_request(
             "GET",
             path=self._build_path(segments),
             headers=headers,
+            deadline_s=deadline_s,
             response_model=GetBunaResponse,
         )
@@ -7,16 +7,22 @@ class DistrictCodeResource(BaseResource):
     def _path(self) -> str:
         return "/api/info/check/getBranchInfo"
 
-    def read(self, *, headers: HeaderTypes | None = None) -> GetDistrictCodeResponse:
+    def read(
+        self, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetDistrictCodeResponse:
         return self._send_sync_request(
             "GET",
             headers=headers,
+            deadline_s=deadline_s,
             response_model=GetDistrictCodeResponse,
         )
 
-    async def aread(self, *, headers: HeaderTypes | None = None) -> GetDistrictCodeResponse:
+    async def aread(
+        self, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetDistrictCodeResponse:
         return await self._send_async_request(
             "GET",
             headers=headers,
+            deadline_s=deadline_s,
             response_model=GetDistrictCodeResponse,
         )
@@ -1,24 +1,102 @@
+from collections.abc import Iterable
+
+from ....transport import AsyncTransport, SyncTransport
 from ...base_resource import BaseResource, HeaderTypes
+from ...batch import BatchResult, arun_many, run_many
+from ...cache import LookupCache
 from .schema import GetTinInfoResponse
 
 
+def _not_found(response: GetTinInfoResponse) -> bool:
+    return response.status != 200
+
+
 class TinInfoResource(BaseResource):
+    """TIN lookup by registration number.
+
+    With a ``cache`` (``ApiClientSettings.lookup_cache``), answers are kept in
+    memory per registration number; a non-200 ``status`` in the body and 4xx
+    errors are kept for the shorter negative TTL. A call with custom
+    ``headers`` bypasses the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        sync: SyncTransport,
+        async_: AsyncTransport,
+        cache: LookupCache[GetTinInfoResponse] | None = None,
+    ) -> None:
+        super().__init__(sync=sync, async_=async_)
+        self.cache = cache
+
     @property
     def _path(self) -> str:
         return "/api/info/check/getTinInfo"
 
-    def read(self, reg_no: str, *, headers: HeaderTypes | None = None) -> GetTinInfoResponse:
-        return self._send_sync_request(
-            "GET",
-            params={"regNo": reg_no},
-            headers=headers,
-            response_model=GetTinInfoResponse,
+    def read(
+        self, reg_no: str, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetTinInfoResponse:
+        def fetch() -> GetTinInfoResponse:
+            return self._send_sync_request(
+                "GET",
+                params={"regNo": reg_no},
+                headers=headers,
+                deadline_s=deadline_s,
+                response_model=GetTinInfoResponse,
+            )
+
+        if self.cache is None or headers:
+            return fetch()
+        return self.cache.call(reg_no, fetch, _not_found)
+
+    async def aread(
+        self, reg_no: str, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetTinInfoResponse:
+        async def fetch() -> GetTinInfoResponse:
+            return await self._send_async_request(
+                "GET",
+                params={"regNo": reg_no},
+                headers=headers,
+                deadline_s=deadline_s,
+                response_model=GetTinInfoResponse,
+            )
+
+        if self.cache is None or headers:
+            return await fetch()
+        return await self.cache.acall(reg_no, fetch, _not_found)
+
+    def read_many(
+        self,
+        reg_nos: Iterable[str],
+        *,
+        concurrency: int = 8,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> list[BatchResult[GetTinInfoResponse]]:
+        """Look up many keys, at most ``concurrency`` at a time.
+
+        Duplicates are fetched once; one ``BatchResult`` per input, in input
+        order, each holding the response or the ``PosApiError`` it raised.
+        ``deadline_s`` applies to each lookup.
+        """
+        return run_many(
+            reg_nos,
+            lambda reg_no: self.read(reg_no, headers=headers, deadline_s=deadline_s),
+            concurrency=concurrency,
         )
 
-    async def aread(self, reg_no: str, *, headers: HeaderTypes | None = None) -> GetTinInfoResponse:
-        return await self._send_async_request(
-            "GET",
-            params={"regNo": reg_no},
-            headers=headers,
-            response_model=GetTinInfoResponse,
+    async def aread_many(
+        self,
+        reg_nos: Iterable[str],
+        *,
+        concurrency: int = 8,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> list[BatchResult[GetTinInfoResponse]]:
+        """Async variant of :meth:`read_many`."""
+        return await arun_many(
+            reg_nos,
+            lambda reg_no: self.aread(reg_no, headers=headers, deadline_s=deadline_s),
+            concurrency=concurrency,
         )
@@ -1,24 +1,103 @@
+from collections.abc import Iterable
+
+from ....transport import AsyncTransport, SyncTransport
 from ...base_resource import BaseResource, HeaderTypes
+from ...batch import BatchResult, arun_many, run_many
+from ...cache import LookupCache
 from .schema import GetInfoResponse
 
 
+def _not_found(response: GetInfoResponse) -> bool:
+    return response.data is None or not response.data.found
+
+
 class MerchantInfoResource(BaseResource):
+    """Taxpayer lookup by TIN.
+
+    With a ``cache`` (``ApiClientSettings.lookup_cache``), answers are kept in
+    memory per TIN; unknown TINs (``data`` null or ``found=false``) and 4xx
+    errors are kept for the shorter negative TTL. ``cache`` is exposed so
+    callers can ``invalidate`` a TIN or read its ``stats()``. A call with
+    custom ``headers`` bypasses the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        sync: SyncTransport,
+        async_: AsyncTransport,
+        cache: LookupCache[GetInfoResponse] | None = None,
+    ) -> None:
+        super().__init__(sync=sync, async_=async_)
+        self.cache = cache
+
     @property
     def _path(self) -> str:
         return "/api/info/check/getInfo"
 
-    def read(self, tin: str, *, headers: HeaderTypes | None = None) -> GetInfoResponse:
-        return self._send_sync_request(
-            "GET",
-            params={"tin": tin},
-            response_model=GetInfoResponse,
-            headers=headers,
+    def read(
+        self, tin: str, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetInfoResponse:
+        def fetch() -> GetInfoResponse:
+            return self._send_sync_request(
+                "GET",
+                params={"tin": tin},
+                response_model=GetInfoResponse,
+                headers=headers,
+                deadline_s=deadline_s,
+            )
+
+        if self.cache is None or headers:
+            return fetch()
+        return self.cache.call(tin, fetch, _not_found)
+
+    async def aread(
+        self, tin: str, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetInfoResponse:
+        async def fetch() -> GetInfoResponse:
+            return await self._send_async_request(
+                "GET",
+                params={"tin": tin},
+                response_model=GetInfoResponse,
+                headers=headers,
+                deadline_s=deadline_s,
+            )
+
+        if self.cache is None or headers:
+            return await fetch()
+        return await self.cache.acall(tin, fetch, _not_found)
+
+    def read_many(
+        self,
+        tins: Iterable[str],
+        *,
+        concurrency: int = 8,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> list[BatchResult[GetInfoResponse]]:
+        """Look up many keys, at most ``concurrency`` at a time.
+
+        Duplicates are fetched once; one ``BatchResult`` per input, in input
+        order, each holding the response or the ``PosApiError`` it raised.
+        ``deadline_s`` applies to each lookup.
+        """
+        return run_many(
+            tins,
+            lambda tin: self.read(tin, headers=headers, deadline_s=deadline_s),
+            concurrency=concurrency,
         )
 
-    async def aread(self, tin: str, *, headers: HeaderTypes | None = None) -> GetInfoResponse:
-        return await self._send_async_request(
-            "GET",
-            params={"tin": tin},
-            response_model=GetInfoResponse,
-            headers=headers,
+    async def aread_many(
+        self,
+        tins: Iterable[str],
+        *,
+        concurrency: int = 8,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> list[BatchResult[GetInfoResponse]]:
+        """Async variant of :meth:`read_many`."""
+        return await arun_many(
+            tins,
+            lambda tin: self.aread(tin, headers=headers, deadline_s=deadline_s),
+            concurrency=concurrency,
         )
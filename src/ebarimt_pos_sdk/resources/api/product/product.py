@@ -7,16 +7,22 @@ class ProductTaxCodeResource(BaseResource):
     def _path(self) -> str:
         return "/api/receipt/receipt/getProductTaxCode"
 
-    def read(self, *, headers: HeaderTypes | None = None) -> GetProductTaxCodeResponse:
+    def read(
+        self, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetProductTaxCodeResponse:
         return self._send_sync_request(
             "GET",
             headers=headers,
+            deadline_s=deadline_s,
             response_model=GetProductTaxCodeResponse,
         )
 
-    async def aread(self, *, headers: HeaderTypes | None = None) -> GetProductTaxCodeResponse:
+    async def aread(
+        self, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> GetProductTaxCodeResponse:
         return await self._send_async_request(
             "GET",
             headers=headers,
+            deadline_s=deadline_s,
             response_model=GetProductTaxCodeResponse,
         )
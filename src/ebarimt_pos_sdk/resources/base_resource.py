@@ -8,7 +8,14 @@ import httpx
 from pydantic import BaseModel, ValidationError
 
 from ..errors import PosApiDecodeError, PosApiHttpError, PosApiValidationError
-from ..transport import AsyncTransport, HeaderTypes, HttpMethod, QueryParamTypes, SyncTransport
+from ..transport import (
+    AsyncTransport,
+    HeaderTypes,
+    HttpMethod,
+    HttpRequestResponse,
+    QueryParamTypes,
+    SyncTransport,
+)
 
 T = TypeVar("T", bound=BaseModel)
 N = TypeVar("N", bound=BaseModel)
@@ -28,14 +35,13 @@ class BaseResource:
     @abstractmethod
     def _path(self) -> str: ...
 
-    @staticmethod
-    def _decode_json(response: httpx.Response) -> Any:
+    def _decode_json(self, response: httpx.Response) -> Any:
         if response.status_code == 204:
             return None
         if not response.content:
             return None
         try:
-            return response.json()
+            return self._sync.json_backend.loads(response.content)
         except ValueError as exc:
             raise PosApiDecodeError(
                 "Failed to decode JSON response",
@@ -67,8 +73,9 @@ class BaseResource:
             ) from exc
 
     @staticmethod
-    def _model_dump(payload: BaseModel) -> dict[str, Any]:
-        return payload.model_dump(mode="json", by_alias=True, exclude_none=True)
+    def _model_dump(payload: BaseModel) -> bytes:
+        # Straight to JSON bytes in pydantic-core; no intermediate dict.
+        return payload.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
 
     def _prepare_send_kwargs(
         self,
@@ -77,20 +84,18 @@ class BaseResource:
         payload_model: type[T] | None,
         payload: T | dict[str, Any] | None,
         headers: HeaderTypes | None,
+        deadline_s: float | None = None,
     ) -> dict[str, Any]:
         """Validate payload, merge headers, build the kwargs dict for transport.send()."""
-        if payload_model is not None and payload is not None:
-            validated = self._validate_payload(model=payload_model, payload=payload)
-        elif payload_model is None and payload is None:
-            validated = None
-        else:
-            raise ValueError("Both request model and payload must have a valid value.")
-
         kwargs: dict[str, Any] = {
             "params": params,
             "headers": headers,
+            "deadline_s": deadline_s,
         }
-        if validated is not None:
+        if (payload_model is None) != (payload is None):
+            raise ValueError("Both request model and payload must have a valid value.")
+        if payload_model is not None and payload is not None:
+            validated = self._validate_payload(model=payload_model, payload=payload)
             kwargs["payload"] = self._model_dump(validated)
         return kwargs
 
@@ -102,7 +107,40 @@ class BaseResource:
         self._ensure_http_success(response)
         if response_model is None:
             return None
-        return response_model.model_validate(self._decode_json(response))
+        if response.status_code == 204 or not response.content:
+            return response_model.model_validate(None)
+        try:
+            # Bytes straight to model in pydantic-core; no intermediate dict.
+            return response_model.model_validate_json(response.content)
+        except ValidationError as exc:
+            if any(error["type"] == "json_invalid" for error in exc.errors()):
+                raise PosApiDecodeError(
+                    "Failed to decode JSON response",
+                    response=response,
+                ) from exc
+            raise
+
+    @overload
+    def _decode_result(self, result: HttpRequestResponse, response_model: None) -> None: ...
+
+    @overload
+    def _decode_result(self, result: HttpRequestResponse, response_model: type[N]) -> N: ...
+
+    def _decode_result(
+        self,
+        result: HttpRequestResponse,
+        response_model: type[N] | None,
+    ) -> N | None:
+        """Decode and validate ``result`` once. Coalesced GETs hand several
+        callers the same ``result``; the first to get here validates and the
+        rest reuse its model."""
+        if response_model is None:
+            return self._decode_and_validate(result.response, None)
+        cached = result.decoded.get(response_model)
+        if cached is None:
+            cached = self._decode_and_validate(result.response, response_model)
+            result.decoded[response_model] = cached
+        return cached
 
     def _ensure_http_success(self, response: httpx.Response) -> None:
         try:
@@ -145,6 +183,7 @@ class BaseResource:
         payload: T | dict[str, Any] | None = None,
         response_model: None = None,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> None: ...
 
     @overload
@@ -158,6 +197,7 @@ class BaseResource:
         payload: T | dict[str, Any] | None = None,
         response_model: type[N],
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> N: ...
 
     def _send_sync_request(
@@ -170,17 +210,20 @@ class BaseResource:
         payload: T | dict[str, Any] | None = None,
         response_model: type[N] | None = None,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> N | None:
         """Send sync request. `path` overrides `self._path` for resources
-        that build the URL dynamically (e.g. hierarchical drill-down)."""
+        that build the URL dynamically (e.g. hierarchical drill-down).
+        `deadline_s` overrides the client's overall per-call deadline."""
         send_kwargs = self._prepare_send_kwargs(
             params=params,
             payload_model=payload_model,
             payload=payload,
             headers=headers,
+            deadline_s=deadline_s,
         )
         result = self._sync.send(method, path or self._path, **send_kwargs)
-        return self._decode_and_validate(result.response, response_model)
+        return self._decode_result(result, response_model)
 
     @overload
     async def _send_async_request(
@@ -193,6 +236,7 @@ class BaseResource:
         payload: T | dict[str, Any] | None = None,
         response_model: None = None,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> None: ...
 
     @overload
@@ -206,6 +250,7 @@ class BaseResource:
         payload: T | dict[str, Any] | None = None,
         response_model: type[N],
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> N: ...
 
     async def _send_async_request(
@@ -218,14 +263,17 @@ class BaseResource:
         payload: T | dict[str, Any] | None = None,
         response_model: type[N] | None = None,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> N | None:
         """Send async request. `path` overrides `self._path` for resources
-        that build the URL dynamically (e.g. hierarchical drill-down)."""
+        that build the URL dynamically (e.g. hierarchical drill-down).
+        `deadline_s` overrides the client's overall per-call deadline."""
         send_kwargs = self._prepare_send_kwargs(
             params=params,
             payload_model=payload_model,
             payload=payload,
             headers=headers,
+            deadline_s=deadline_s,
         )
         result = await self._async.send(method, path or self._path, **send_kwargs)
-        return self._decode_and_validate(result.response, response_model)
+        return self._decode_result(result, response_model)
@@ -0,0 +1,235 @@
+"""Bounded-concurrency fan-out for per-key lookups and bulk writes.
+
+``read_many``/``aread_many`` on the lookup resources take a list of keys,
+drop duplicates (after stripping whitespace), run at most ``concurrency``
+lookups at a time and return one :class:`BatchResult` per *input* key, in
+input order. A failed lookup — a ``PosApiError`` or any other exception — is
+reported on its result instead of failing the batch; duplicate keys share one
+result. Cancellation is never swallowed.
+
+``create_many``/``acreate_many`` stream instead: the input is consumed lazily
+(it may be a generator over a whole shift), at most ``concurrency`` calls are
+in flight, and an :class:`ItemResult` is yielded for each item as soon as it
+is its turn — input order, or completion order. As with lookups, any
+exception an item raises is reported on its result and the stream carries
+on. Nothing is de-duplicated: every item is a separate write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Generic, TypeVar, cast
+
+V = TypeVar("V")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult(Generic[V]):
+    """Outcome of one key in a batch: ``value`` on success, else ``error``."""
+
+    key: str
+    value: V | None = None
+    # Usually a ``PosApiError``; anything else the lookup raised is kept too.
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> V:
+        """The value, or raise the lookup's error."""
+        if self.error is not None:
+            raise self.error
+        return cast(V, self.value)
+
+
+@dataclass(frozen=True, slots=True)
+class ItemResult(Generic[R, V]):
+    """Outcome of one item of a bulk call: ``value`` on success, else ``error``.
+
+    ``index`` is the item's position in the input and ``item`` the input
+    itself, so results streamed in completion order can be matched back.
+    """
+
+    index: int
+    item: R
+    value: V | None = None
+    # Usually a ``PosApiError``; anything else the call raised is kept too.
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> V:
+        """The value, or raise the call's error."""
+        if self.error is not None:
+            raise self.error
+        return cast(V, self.value)
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+
+def _unique(keys: Iterable[str], concurrency: int) -> tuple[list[str], list[str]]:
+    _check_concurrency(concurrency)
+    normalized = [key.strip() for key in keys]
+    return normalized, list(dict.fromkeys(normalized))
+
+
+def run_many(
+    keys: Iterable[str], fetch: Callable[[str], V], *, concurrency: int
+) -> list[BatchResult[V]]:
+    """Sync fan-out over a thread pool (the sync httpx client is thread-safe)."""
+    normalized, unique = _unique(keys, concurrency)
+
+    def one(key: str) -> BatchResult[V]:
+        try:
+            return BatchResult(key, value=fetch(key))
+        except Exception as exc:
+            return BatchResult(key, error=exc)
+
+    if len(unique) <= 1 or concurrency == 1:
+        results = {key: one(key) for key in unique}
+    else:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(unique))) as pool:
+            results = dict(zip(unique, pool.map(one, unique), strict=True))
+    return [results[key] for key in normalized]
+
+
+async def arun_many(
+    keys: Iterable[str], fetch: Callable[[str], Awaitable[V]], *, concurrency: int
+) -> list[BatchResult[V]]:
+    """Async fan-out with at most ``concurrency`` lookups in flight."""
+    normalized, unique = _unique(keys, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(key: str) -> BatchResult[V]:
+        async with semaphore:
+            try:
+                return BatchResult(key, value=await fetch(key))
+            except Exception as exc:
+                return BatchResult(key, error=exc)
+
+    tasks = [asyncio.ensure_future(one(key)) for key in unique]
+    try:
+        done = await asyncio.gather(*tasks)
+    except BaseException:
+        # Cancelled (or interrupted): stop the other lookups and wait for
+        # them, so none is left running unobserved.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    results = dict(zip(unique, done, strict=True))
+    return [results[key] for key in normalized]
+
+
+def stream_many(
+    items: Iterable[R],
+    call: Callable[[R], V],
+    *,
+    concurrency: int,
+    ordered: bool = True,
+) -> Iterator[ItemResult[R, V]]:
+    """Sync streaming fan-out over a thread pool.
+
+    Closing the iterator early stops reading ``items``; calls already in
+    flight run to completion before it returns.
+    """
+    _check_concurrency(concurrency)
+
+    def one(index: int, item: R) -> ItemResult[R, V]:
+        try:
+            return ItemResult(index, item, value=call(item))
+        except Exception as exc:
+            return ItemResult(index, item, error=exc)
+
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending: deque[Future[ItemResult[R, V]]] = deque()
+
+    def drain(until: int) -> Iterator[ItemResult[R, V]]:
+        while len(pending) > until:
+            if ordered:
+                yield pending.popleft().result()
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: f.result().index):
+                pending.remove(future)
+                yield future.result()
+
+    try:
+        for index, item in enumerate(items):
+            pending.append(pool.submit(one, index, item))
+            yield from drain(concurrency - 1)
+        yield from drain(0)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def _aiterate(items: Iterable[R] | AsyncIterable[R]) -> AsyncIterator[R]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def astream_many(
+    items: Iterable[R] | AsyncIterable[R],
+    call: Callable[[R], Awaitable[V]],
+    *,
+    concurrency: int,
+    ordered: bool = True,
+) -> AsyncIterator[ItemResult[R, V]]:
+    """Async streaming fan-out with at most ``concurrency`` calls in flight.
+
+    Closing the iterator early stops reading ``items``. Calls already in
+    flight are never cancelled — a write cut off mid-request leaves its
+    outcome unknown — and are awaited before it returns.
+    """
+    _check_concurrency(concurrency)
+
+    async def one(index: int, item: R) -> ItemResult[R, V]:
+        try:
+            return ItemResult(index, item, value=await call(item))
+        except Exception as exc:
+            return ItemResult(index, item, error=exc)
+
+    pending: deque[asyncio.Task[ItemResult[R, V]]] = deque()
+
+    async def next_done() -> list[ItemResult[R, V]]:
+        if ordered:
+            # Shielded: cancelling the consumer must not cancel the call.
+            result = await asyncio.shield(pending[0])
+            pending.popleft()
+            return [result]
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            pending.remove(task)
+        return sorted((task.result() for task in done), key=lambda result: result.index)
+
+    try:
+        index = 0
+        async for item in _aiterate(items):
+            pending.append(asyncio.ensure_future(one(index, item)))
+            index += 1
+            while len(pending) >= concurrency:
+                for result in await next_done():
+                    yield result
+        while pending:
+            for result in await next_done():
+                yield result
+    finally:
+        if pending:
+            # ``asyncio.wait`` (unlike ``gather``) does not cancel the tasks
+            # if this generator is itself being cancelled.
+            await asyncio.wait(pending)
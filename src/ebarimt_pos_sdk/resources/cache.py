@@ -0,0 +1,255 @@
+"""Bounded LRU + TTL cache for pure lookup resources.
+
+A cached key is served from memory until its TTL runs out. Negative answers
+(an unknown TIN, or a 4xx HTTP error for that key) are cached too, with a
+shorter TTL, so repeated lookups of a bad key do not hammer the API; each hit
+on a cached error raises a fresh copy of it. Transient failures — 408, 429, 5xx, network errors — are
+never cached.
+
+With ``CacheSettings.max_stale_s`` a positive answer outlives its TTL by that
+much: it is returned at once while a background refresh replaces it
+(stale-while-revalidate). Negative answers are never served stale.
+
+Values are kept and handed out as shallow copies (``model_copy()`` for a
+model, a new list for a list): reassigning a field of one result never changes
+what later callers get, but nested models are shared and must be treated as
+read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar, cast
+
+from pydantic import BaseModel
+
+from .._background import Revalidator
+from ..errors import PosApiHttpError
+from ..settings import CacheSettings
+
+V = TypeVar("V")
+
+_TRANSIENT_STATUSES = frozenset({408, 429})
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Lookup-cache counters.
+
+    Attributes:
+        hits: Lookups answered from memory with a positive result.
+        negative_hits: Lookups answered from memory with a negative result
+            (including re-raised errors).
+        stale_hits: Lookups answered with an expired positive result while
+            a background refresh ran.
+        misses: Lookups that went to the API (absent or expired key).
+        evictions: Entries dropped because the cache was full.
+        expirations: Entries dropped because their TTL had run out.
+        size: Entries currently held.
+    """
+
+    hits: int = 0
+    negative_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+
+class _Entry(Generic[V]):
+    __slots__ = ("value", "error", "negative", "expires_at")
+
+    def __init__(
+        self, value: V | None, error: BaseException | None, negative: bool, expires_at: float
+    ) -> None:
+        self.value = value
+        self.error = error
+        self.negative = negative
+        self.expires_at = expires_at
+
+
+def _fresh_copy(error: BaseException) -> BaseException:
+    """A new exception carrying ``error``'s data, so concurrent hits never
+    share (or rewrite the traceback of) one instance. Built without calling
+    ``__init__``: SDK errors take keyword-only arguments."""
+    clone = type(error).__new__(type(error), *error.args)
+    clone.args = error.args
+    clone.__dict__.update(error.__dict__)
+    clone.__cause__ = error.__cause__
+    clone.__suppress_context__ = error.__suppress_context__
+    return clone
+
+
+def _shallow_copy(value: Any) -> Any:
+    """A copy of ``value`` that callers may reassign fields (or items) of."""
+    if isinstance(value, BaseModel):
+        return value.model_copy()
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def is_cacheable_error(error: BaseException) -> bool:
+    """A 4xx for a specific key is an answer; anything else may be transient."""
+    if not isinstance(error, PosApiHttpError) or error.response is None:
+        return False
+    status = error.response.status_code
+    return 400 <= status < 500 and status not in _TRANSIENT_STATUSES
+
+
+class LookupCache(Generic[V]):
+    """Thread-safe LRU cache with separate positive and negative TTLs.
+
+    ``call``/``acall`` wrap a fetch: a live entry is returned (or its error
+    re-raised) without calling it; otherwise the result is stored, negative if
+    ``is_negative(result)`` says so.
+    """
+
+    def __init__(
+        self, settings: CacheSettings, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._settings = settings
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._revalidator = Revalidator(type(self).__name__)
+        self._hits = 0
+        self._negative_hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def settings(self) -> CacheSettings:
+        return self._settings
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> tuple[_Entry[V] | None, bool]:
+        """The live entry for ``key`` and whether it is stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            stale = False
+            if entry is not None:
+                now = self._clock()
+                if now >= entry.expires_at:
+                    stale = not entry.negative and (
+                        now < entry.expires_at + self._settings.max_stale_s
+                    )
+                    if not stale:
+                        del self._entries[key]
+                        self._expirations += 1
+                        entry = None
+            if entry is None:
+                self._misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if stale:
+                self._stale_hits += 1
+            elif entry.negative:
+                self._negative_hits += 1
+            else:
+                self._hits += 1
+            return entry, stale
+
+    def _put(
+        self,
+        key: Hashable,
+        value: V | None,
+        error: BaseException | None,
+        *,
+        negative: bool,
+    ) -> None:
+        ttl_s = self._settings.negative_ttl_s if negative else self._settings.ttl_s
+        if ttl_s <= 0:
+            return
+        with self._lock:
+            self._entries[key] = _Entry(
+                _shallow_copy(value), error, negative, self._clock() + ttl_s
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._settings.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    @staticmethod
+    def _unwrap(entry: _Entry[V]) -> V:
+        if entry.error is not None:
+            raise _fresh_copy(entry.error)
+        return cast(V, _shallow_copy(entry.value))
+
+    def put(self, key: Hashable, value: V, *, negative: bool = False) -> None:
+        self._put(key, value, None, negative=negative)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop ``key``, or every entry when ``key`` is ``None``."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _store(self, key: Hashable, fetch: Callable[[], V], is_negative: Callable[[V], bool]) -> V:
+        try:
+            value = fetch()
+        except Exception as exc:
+            if is_cacheable_error(exc):
+                self._put(key, None, exc, negative=True)
+            raise
+        self._put(key, value, None, negative=is_negative(value))
+        return value
+
+    async def _astore(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[V]],
+        is_negative: Callable[[V], bool],
+    ) -> V:
+        try:
+            value = await fetch()
+        except Exception as exc:
+            if is_cacheable_error(exc):
+                self._put(key, None, exc, negative=True)
+            raise
+        self._put(key, value, None, negative=is_negative(value))
+        return value
+
+    def call(self, key: Hashable, fetch: Callable[[], V], is_negative: Callable[[V], bool]) -> V:
+        entry, stale = self._lookup(key)
+        if entry is None:
+            return self._store(key, fetch, is_negative)
+        if stale:
+            self._revalidator.in_thread(key, lambda: self._store(key, fetch, is_negative))
+        return self._unwrap(entry)
+
+    async def acall(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[V]],
+        is_negative: Callable[[V], bool],
+    ) -> V:
+        entry, stale = self._lookup(key)
+        if entry is None:
+            return await self._astore(key, fetch, is_negative)
+        if stale:
+            self._revalidator.in_task(key, lambda: self._astore(key, fetch, is_negative))
+        return self._unwrap(entry)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
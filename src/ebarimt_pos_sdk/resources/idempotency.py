@@ -0,0 +1,385 @@
+"""Idempotent receipt issuing on top of a non-idempotent ``POST /rest/receipt``.
+
+PosAPI has no idempotency key and no way to look a receipt up, so when an
+attempt fails after the request may have reached it — a read timeout, a
+dropped connection, a 5xx — nobody knows whether the receipt was issued.
+Retrying blindly risks a duplicate that has to be deleted by hand.
+
+A :class:`ReceiptLedger` remembers, per key (by default a hash of the
+request, which includes ``billIdSuffix``), what happened to each receipt:
+
+* issued — a repeated create returns the recorded response and sends nothing;
+* in flight — a concurrent create with the same key waits for the first;
+* ambiguous — the outcome is unknown. The next create for the key asks
+  ``IdempotencySettings.reconcile`` first and only sends again once it has
+  confirmed nothing was issued; without a reconciler it raises
+  :class:`~ebarimt_pos_sdk.errors.PosApiAmbiguousReceiptError` until the
+  caller settles the key with :meth:`ReceiptLedger.resolve` or
+  :meth:`ReceiptLedger.forget`.
+
+Failures that prove the receipt was not issued (a 4xx, a request that never
+left the client, an open circuit) simply clear the key. The ledger lives in
+memory and covers one process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from ..errors import (
+    PosApiAmbiguousReceiptError,
+    PosApiCircuitOpenError,
+    PosApiDecodeError,
+    PosApiError,
+    PosApiHttpError,
+    PosApiTransportError,
+    PosApiValidationError,
+)
+from ..settings import IdempotencySettings, RetrySettings
+from ..transport.retry import NOT_SENT_ERRORS
+from .rest.receipt.schema import CreateReceiptRequest, CreateReceiptResponse
+
+
+def _canonical(value: Any) -> Any:
+    # ``null`` members are dropped (a model dump excludes them) and whole
+    # floats become ints, so ``1000`` and ``1000.0`` hash alike.
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def receipt_key(request: CreateReceiptRequest | bytes) -> str:
+    """Content key of a receipt request: the SHA-256 of its canonical JSON.
+
+    A model and its trusted wire JSON go through the same serialisation —
+    sorted keys, no ``null`` members, whole numbers without a fraction — so
+    an equivalent dict and model share a key whatever their key order.
+    """
+    if isinstance(request, CreateReceiptRequest):
+        request = request.model_dump_json(by_alias=True, exclude_none=True).encode()
+    canonical = json.dumps(
+        _canonical(json.loads(request)), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _as_model(request: CreateReceiptRequest | bytes) -> CreateReceiptRequest:
+    # Trusted (``validate=False``) receipts reach the ledger as wire JSON; the
+    # model is only built for the rare reconcile.
+    if isinstance(request, bytes):
+        return CreateReceiptRequest.model_validate_json(request)
+    return request
+
+
+def is_ambiguous(error: BaseException) -> bool:
+    """Whether ``error`` leaves open that the receipt was issued anyway."""
+    if isinstance(error, PosApiCircuitOpenError):
+        return False
+    if isinstance(error, PosApiTransportError):
+        cause = error.cause or error.__cause__
+        return not isinstance(cause, NOT_SENT_ERRORS)
+    if isinstance(error, PosApiHttpError):
+        # Without a response nothing shows the receipt was refused.
+        return error.response is None or error.response.status_code >= 500
+    if isinstance(error, PosApiValidationError):
+        return error.stage == "response"
+    # An unreadable 2xx most likely carried an issued receipt.
+    return isinstance(error, PosApiDecodeError)
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerStats:
+    """Receipt-ledger counters.
+
+    Attributes:
+        hits: Creates answered with a recorded receipt, nothing sent.
+        sent: Attempts sent to PosAPI.
+        ambiguous: Attempts whose outcome was left unknown.
+        reconciled: Ambiguous receipts the reconciler found issued.
+        size: Keys currently held.
+    """
+
+    hits: int = 0
+    sent: int = 0
+    ambiguous: int = 0
+    reconciled: int = 0
+    size: int = 0
+
+
+class _State(str, Enum):
+    IN_FLIGHT = "in_flight"
+    ISSUED = "issued"
+    AMBIGUOUS = "ambiguous"
+
+
+class _Entry:
+    __slots__ = ("state", "response", "error", "unsure", "expires_at", "done")
+
+    def __init__(self, expires_at: float) -> None:
+        self.state = _State.IN_FLIGHT
+        self.response: CreateReceiptResponse | None = None
+        self.error: Exception | None = None
+        # An attempt may have issued the receipt and nothing has said otherwise.
+        self.unsure = False
+        self.expires_at = expires_at
+        self.done = threading.Event()
+
+
+class ReceiptLedger:
+    """Thread-safe per-key record of receipt outcomes.
+
+    ``call``/``acall`` wrap one receipt's send; see the module docstring for
+    the states a key goes through. Shared by a client's sync and async
+    calls: the lock is never held across I/O or an ``await``.
+    """
+
+    def __init__(
+        self,
+        settings: IdempotencySettings | None = None,
+        *,
+        retry: RetrySettings | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._settings = settings or IdempotencySettings()
+        self._retry = retry or RetrySettings()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._hits = 0
+        self._sent = 0
+        self._ambiguous = 0
+        self._reconciled = 0
+
+    @property
+    def settings(self) -> IdempotencySettings:
+        return self._settings
+
+    def stats(self) -> LedgerStats:
+        with self._lock:
+            return LedgerStats(
+                hits=self._hits,
+                sent=self._sent,
+                ambiguous=self._ambiguous,
+                reconciled=self._reconciled,
+                size=len(self._entries),
+            )
+
+    def unresolved(self) -> list[str]:
+        """Keys whose outcome is unknown, oldest first."""
+        with self._lock:
+            return [k for k, e in self._entries.items() if e.state is _State.AMBIGUOUS]
+
+    def resolve(self, key: str, response: CreateReceiptResponse) -> None:
+        """Record that ``key`` was issued as ``response`` (found out of band)."""
+        with self._lock:
+            entry = self._entries.pop(key, None) or _Entry(0.0)
+            self._store(key, entry)
+            self._finish(entry, _State.ISSUED, response=response)
+        entry.done.set()
+
+    def forget(self, key: str) -> None:
+        """Drop ``key``; its next create is sent. Use once it is certain the
+        receipt was not issued (or has been deleted)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.done.set()
+
+    def call(
+        self,
+        key: str,
+        request: CreateReceiptRequest | bytes,
+        send: Callable[[], CreateReceiptResponse],
+    ) -> CreateReceiptResponse:
+        while True:
+            entry, owned = self._claim(key)
+            if owned:
+                break
+            if entry.state is _State.ISSUED:
+                assert entry.response is not None  # recorded with the ISSUED state
+                return entry.response
+            entry.done.wait()
+        try:
+            if entry.unsure:
+                found = self._reconcile_sync(request, entry)
+                if found is not None:
+                    return found
+            attempt = 0
+            while True:
+                try:
+                    self._count_sent()
+                    return self._issued(entry, send())
+                except PosApiError as exc:
+                    if not self._after_failure(entry, exc, attempt):
+                        raise
+                found = self._reconcile_sync(request, entry)
+                if found is not None:
+                    return found
+                time.sleep(self._retry.sleep_seconds(attempt))
+                attempt += 1
+        except BaseException as exc:
+            self._settle(key, entry, exc)
+            raise
+        finally:
+            entry.done.set()
+
+    async def acall(
+        self,
+        key: str,
+        request: CreateReceiptRequest | bytes,
+        send: Callable[[], Awaitable[CreateReceiptResponse]],
+    ) -> CreateReceiptResponse:
+        while True:
+            entry, owned = self._claim(key)
+            if owned:
+                break
+            if entry.state is _State.ISSUED:
+                assert entry.response is not None  # recorded with the ISSUED state
+                return entry.response
+            await asyncio.to_thread(entry.done.wait)
+        try:
+            if entry.unsure:
+                found = await self._reconcile_async(request, entry)
+                if found is not None:
+                    return found
+            attempt = 0
+            while True:
+                try:
+                    self._count_sent()
+                    return self._issued(entry, await send())
+                except PosApiError as exc:
+                    if not self._after_failure(entry, exc, attempt):
+                        raise
+                found = await self._reconcile_async(request, entry)
+                if found is not None:
+                    return found
+                await asyncio.sleep(self._retry.sleep_seconds(attempt))
+                attempt += 1
+        except BaseException as exc:
+            self._settle(key, entry, exc)
+            raise
+        finally:
+            entry.done.set()
+
+    def _count_sent(self) -> None:
+        with self._lock:
+            self._sent += 1
+
+    def _claim(self, key: str) -> tuple[_Entry, bool]:
+        """Return the key's entry and whether this caller now owns it.
+
+        A caller owns a new key, or an ambiguous one it may reconcile. An
+        owned entry is ``IN_FLIGHT`` with a fresh ``done`` event; everyone
+        else either reads an issued response or waits on ``done``.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.state is _State.ISSUED and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                entry = _Entry(now + self._settings.ttl_s)
+                self._store(key, entry)
+                return entry, True
+            if entry.state is _State.ISSUED:
+                self._hits += 1
+                return entry, False
+            if entry.state is _State.IN_FLIGHT:
+                return entry, False
+            if self._settings.reconcile is None:
+                raise PosApiAmbiguousReceiptError(
+                    f"Receipt {key[:12]} may already have been issued: an earlier attempt "
+                    "failed without an answer. Resolve or forget it in the ledger.",
+                    key=key,
+                    cause=entry.error,
+                )
+            entry.state = _State.IN_FLIGHT
+            entry.done = threading.Event()
+            return entry, True
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        overflow = len(self._entries) - self._settings.max_entries
+        if overflow <= 0:
+            return
+        issued = [k for k, e in self._entries.items() if e.state is _State.ISSUED]
+        for old_key in issued[:overflow]:
+            del self._entries[old_key]
+
+    def _after_failure(self, entry: _Entry, error: PosApiError, attempt: int) -> bool:
+        """Record a failed attempt; ``True`` means reconcile and send again."""
+        entry.unsure = is_ambiguous(error)
+        if not entry.unsure:
+            return False
+        entry.error = error
+        with self._lock:
+            self._ambiguous += 1
+        return self._settings.reconcile is not None and attempt + 1 < self._settings.max_attempts
+
+    def _reconcile_sync(
+        self, request: CreateReceiptRequest | bytes, entry: _Entry
+    ) -> CreateReceiptResponse | None:
+        reconcile = self._settings.reconcile
+        found = reconcile(_as_model(request)) if reconcile is not None else None
+        return self._after_reconcile(entry, found)
+
+    async def _reconcile_async(
+        self, request: CreateReceiptRequest | bytes, entry: _Entry
+    ) -> CreateReceiptResponse | None:
+        reconcile = self._settings.reconcile
+        found = (
+            await asyncio.to_thread(reconcile, _as_model(request))
+            if reconcile is not None
+            else None
+        )
+        return self._after_reconcile(entry, found)
+
+    def _after_reconcile(
+        self, entry: _Entry, found: CreateReceiptResponse | None
+    ) -> CreateReceiptResponse | None:
+        if found is None:
+            entry.unsure = False  # confirmed not issued: safe to send
+            return None
+        with self._lock:
+            self._reconciled += 1
+        return self._issued(entry, found)
+
+    def _issued(self, entry: _Entry, response: CreateReceiptResponse) -> CreateReceiptResponse:
+        with self._lock:
+            self._finish(entry, _State.ISSUED, response=response)
+        return response
+
+    def _finish(
+        self, entry: _Entry, state: _State, *, response: CreateReceiptResponse | None = None
+    ) -> None:
+        entry.response = response
+        entry.state = state
+        entry.unsure = False
+        entry.expires_at = self._clock() + self._settings.ttl_s
+
+    def _settle(self, key: str, entry: _Entry, error: BaseException) -> None:
+        """Leave a failed call's key ambiguous, or drop it if nothing was issued."""
+        with self._lock:
+            if not entry.unsure and isinstance(error, PosApiError):
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                return
+            # Anything else (a cancelled task, a crash mid-send) is unsure too.
+            entry.unsure = True
+            if entry.error is None and isinstance(error, Exception):
+                entry.error = error
+            entry.state = _State.AMBIGUOUS
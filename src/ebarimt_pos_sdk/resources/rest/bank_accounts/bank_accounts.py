@@ -1,44 +1,128 @@
+from collections.abc import Iterable
+
 import httpx
 
+from ....transport import AsyncTransport, SyncTransport
 from ...base_resource import BaseResource, HeaderTypes
+from ...batch import BatchResult, arun_many, run_many
+from ...cache import LookupCache
 from .schema import BankAccount
 
 
+def _no_accounts(accounts: list[BankAccount]) -> bool:
+    return not accounts
+
+
 class BankAccountsResource(BaseResource):
+    """Registered bank accounts by TIN, for ``bank_account_no``/``iban`` on
+    sub-receipts.
+
+    With a ``cache`` (``RestClientSettings.bank_account_cache``), each TIN's
+    accounts are kept in memory; a TIN with no accounts and 4xx errors are
+    kept for the shorter negative TTL. Call :meth:`invalidate` after a
+    merchant's accounts change. The cache is keyed on the TIN exactly as
+    sent, and a call with custom ``headers`` bypasses the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        sync: SyncTransport,
+        async_: AsyncTransport,
+        cache: LookupCache[list[BankAccount]] | None = None,
+    ) -> None:
+        super().__init__(sync=sync, async_=async_)
+        self.cache = cache
+
     @property
     def _path(self) -> str:
         return "/rest/bankAccounts"
 
+    def invalidate(self, tin: str | None = None) -> None:
+        """Forget the cached accounts of ``tin``, or of every TIN when ``None``."""
+        if self.cache is not None:
+            self.cache.invalidate(tin)
+
     def read(
         self,
         tin: str,
         *,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> list[BankAccount]:
-        result = self._sync.send(
-            "GET",
-            self._path,
-            params=httpx.QueryParams({"tin": tin}),
-            headers=headers,
-        )
+        def fetch() -> list[BankAccount]:
+            result = self._sync.send(
+                "GET",
+                self._path,
+                params=httpx.QueryParams({"tin": tin}),
+                headers=headers,
+                deadline_s=deadline_s,
+            )
+
+            self._ensure_http_success(result.response)
 
-        self._ensure_http_success(result.response)
+            return [BankAccount.model_validate(data) for data in self._decode_json(result.response)]
 
-        return [BankAccount.model_validate(data) for data in self._decode_json(result.response)]
+        if self.cache is None or headers:
+            return fetch()
+        # The cache hands out a new list, so a caller editing it cannot change the cached one.
+        return self.cache.call(tin, fetch, _no_accounts)
 
     async def aread(
         self,
         tin: str,
         *,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> list[BankAccount]:
-        result = await self._async.send(
-            "GET",
-            self._path,
-            params=httpx.QueryParams({"tin": tin}),
-            headers=headers,
-        )
+        async def fetch() -> list[BankAccount]:
+            result = await self._async.send(
+                "GET",
+                self._path,
+                params=httpx.QueryParams({"tin": tin}),
+                headers=headers,
+                deadline_s=deadline_s,
+            )
 
-        self._ensure_http_success(result.response)
+            self._ensure_http_success(result.response)
 
-        return [BankAccount.model_validate(data) for data in self._decode_json(result.response)]
+            return [BankAccount.model_validate(data) for data in self._decode_json(result.response)]
+
+        if self.cache is None or headers:
+            return await fetch()
+        return await self.cache.acall(tin, fetch, _no_accounts)
+
+    def read_many(
+        self,
+        tins: Iterable[str],
+        *,
+        concurrency: int = 8,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> list[BatchResult[list[BankAccount]]]:
+        """Fetch the accounts of many TINs, at most ``concurrency`` at a time.
+
+        Duplicates are fetched once; one ``BatchResult`` per input, in input
+        order, each holding the accounts or the ``PosApiError`` it raised.
+        ``deadline_s`` applies to each lookup.
+        """
+        return run_many(
+            tins,
+            lambda tin: self.read(tin, headers=headers, deadline_s=deadline_s),
+            concurrency=concurrency,
+        )
+
+    async def aread_many(
+        self,
+        tins: Iterable[str],
+        *,
+        concurrency: int = 8,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> list[BatchResult[list[BankAccount]]]:
+        """Async variant of :meth:`read_many`."""
+        return await arun_many(
+            tins,
+            lambda tin: self.aread(tin, headers=headers, deadline_s=deadline_s),
+            concurrency=concurrency,
+        )
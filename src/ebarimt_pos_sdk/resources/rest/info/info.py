@@ -7,22 +7,28 @@ class InfoResource(BaseResource):
     def _path(self) -> str:
         return "/rest/info"
 
-    def read(self, *, headers: HeaderTypes | None = None) -> ReadInfoResponse:
+    def read(
+        self, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> ReadInfoResponse:
         result = self._sync.send(
             "GET",
             self._path,
             headers=headers,
+            deadline_s=deadline_s,
         )
 
         self._ensure_http_success(result.response)
 
         return ReadInfoResponse.model_validate(self._decode_json(result.response))
 
-    async def aread(self, *, headers: HeaderTypes | None = None) -> ReadInfoResponse:
+    async def aread(
+        self, *, headers: HeaderTypes | None = None, deadline_s: float | None = None
+    ) -> ReadInfoResponse:
         result = await self._async.send(
             "GET",
             self._path,
             headers=headers,
+            deadline_s=deadline_s,
         )
 
         self._ensure_http_success(result.response)
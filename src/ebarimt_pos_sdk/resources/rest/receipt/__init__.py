@@ -4,15 +4,20 @@ from .schema import (
     CreateReceiptResponse,
     DeleteReceiptRequest,
     Item,
+    ItemTaxes,
     Payment,
     PaymentCardData,
     PaymentCode,
     PaymentStatus,
     ReceiptCreateStatus,
     ReceiptItemData,
+    ReceiptTaxCalculator,
     ReceiptType,
     SubReceipt,
+    TaxIssue,
+    TaxRates,
     TaxType,
+    trusted_receipt_json,
 )
 
 __all__ = [
@@ -30,4 +35,9 @@ __all__ = [
     "BarCodeType",
     "ReceiptType",
     "TaxType",
+    "trusted_receipt_json",
+    "ItemTaxes",
+    "ReceiptTaxCalculator",
+    "TaxIssue",
+    "TaxRates",
 ]
@@ -1,16 +1,38 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from typing import Any
 
+from ....transport import AsyncTransport, SyncTransport
 from ...base_resource import BaseResource, HeaderTypes
+from ...batch import ItemResult, astream_many, stream_many
+from ...idempotency import ReceiptLedger, receipt_key
 from .schema import (
     CreateReceiptRequest,
     CreateReceiptResponse,
     DeleteReceiptRequest,
+    trusted_receipt_json,
 )
 
 
 class ReceiptResource(BaseResource):
+    """Issue and delete receipts.
+
+    With a ``ledger`` (``RestClientSettings.receipt_idempotency``), every
+    create goes through it, keyed on ``idempotency_key`` or the request
+    content; see :class:`~ebarimt_pos_sdk.resources.ReceiptLedger`.
+    """
+
+    def __init__(
+        self,
+        *,
+        sync: SyncTransport,
+        async_: AsyncTransport,
+        ledger: ReceiptLedger | None = None,
+    ) -> None:
+        super().__init__(sync=sync, async_=async_)
+        self.ledger = ledger
+
     @property
     def _path(self) -> str:
         return "/rest/receipt"
@@ -19,46 +41,184 @@ class ReceiptResource(BaseResource):
         self,
         payload: CreateReceiptRequest | dict[str, Any],
         *,
+        validate: bool = True,
+        idempotency_key: str | None = None,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> CreateReceiptResponse:
-        return self._send_sync_request(
-            "POST",
-            payload_model=CreateReceiptRequest,
-            payload=payload,
-            response_model=CreateReceiptResponse,
-            headers=headers,
-        )
+        """Issue a receipt.
+
+        ``validate=False`` trusts a ``dict`` payload that is already valid:
+        only its structure is checked (see :func:`trusted_receipt_json`) and
+        it is sent without building the models. Model payloads are never
+        validated again either way.
+        """
+        request = self._prepare(payload, validate=validate, idempotency_key=idempotency_key)
+
+        def send() -> CreateReceiptResponse:
+            if isinstance(request, bytes):
+                return self._send_trusted(request, headers=headers, deadline_s=deadline_s)
+            return self._send_sync_request(
+                "POST",
+                payload_model=CreateReceiptRequest,
+                payload=request,
+                response_model=CreateReceiptResponse,
+                headers=headers,
+                deadline_s=deadline_s,
+            )
+
+        if self.ledger is None:
+            return send()
+        return self.ledger.call(idempotency_key or receipt_key(request), request, send)
 
     async def acreate(
         self,
         payload: CreateReceiptRequest | dict[str, Any],
         *,
+        validate: bool = True,
+        idempotency_key: str | None = None,
         headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> CreateReceiptResponse:
-        return await self._send_async_request(
-            "POST",
-            payload_model=CreateReceiptRequest,
-            payload=payload,
-            response_model=CreateReceiptResponse,
-            headers=headers,
+        request = self._prepare(payload, validate=validate, idempotency_key=idempotency_key)
+
+        async def send() -> CreateReceiptResponse:
+            if isinstance(request, bytes):
+                return await self._asend_trusted(request, headers=headers, deadline_s=deadline_s)
+            return await self._send_async_request(
+                "POST",
+                payload_model=CreateReceiptRequest,
+                payload=request,
+                response_model=CreateReceiptResponse,
+                headers=headers,
+                deadline_s=deadline_s,
+            )
+
+        if self.ledger is None:
+            return await send()
+        return await self.ledger.acall(idempotency_key or receipt_key(request), request, send)
+
+    def to_json(self, payload: CreateReceiptRequest | dict[str, Any]) -> bytes:
+        """Validate ``payload`` as :meth:`create` would and return the JSON
+        body it would send. Raises ``PosApiValidationError``; sends nothing."""
+        if isinstance(payload, dict):
+            payload = self._validate_payload(CreateReceiptRequest, payload)
+        return self._model_dump(payload)
+
+    def _prepare(
+        self,
+        payload: CreateReceiptRequest | dict[str, Any],
+        *,
+        validate: bool,
+        idempotency_key: str | None,
+    ) -> CreateReceiptRequest | bytes:
+        """The request model, or its wire JSON on the trusted path."""
+        if self.ledger is None and idempotency_key is not None:
+            raise ValueError("idempotency_key needs RestClientSettings.receipt_idempotency")
+        if not isinstance(payload, dict):
+            return payload
+        if not validate:
+            return trusted_receipt_json(payload)
+        return self._validate_payload(CreateReceiptRequest, payload)
+
+    def _send_trusted(
+        self, body: bytes, *, headers: HeaderTypes | None, deadline_s: float | None
+    ) -> CreateReceiptResponse:
+        """POST wire JSON from :func:`trusted_receipt_json` as is."""
+        result = self._sync.send(
+            "POST", self._path, payload=body, headers=headers, deadline_s=deadline_s
+        )
+        return self._decode_result(result, CreateReceiptResponse)
+
+    async def _asend_trusted(
+        self, body: bytes, *, headers: HeaderTypes | None, deadline_s: float | None
+    ) -> CreateReceiptResponse:
+        result = await self._async.send(
+            "POST", self._path, payload=body, headers=headers, deadline_s=deadline_s
+        )
+        return self._decode_result(result, CreateReceiptResponse)
+
+    def create_many(
+        self,
+        payloads: Iterable[CreateReceiptRequest | dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        validate: bool = True,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> Iterator[ItemResult[CreateReceiptRequest | dict[str, Any], CreateReceiptResponse]]:
+        """Issue many receipts, at most ``concurrency`` at a time.
+
+        ``payloads`` is read lazily and results are yielded as they are
+        ready: in input order, or as they complete with ``ordered=False``.
+        Each ``ItemResult`` carries the input ``index`` and payload, and the
+        response or the ``PosApiError`` it raised; a failed receipt never
+        stops the batch. ``validate`` and ``deadline_s`` apply to each
+        receipt as in :meth:`create`. Nothing is sent until the iterator is
+        consumed.
+        """
+        return stream_many(
+            payloads,
+            lambda payload: self.create(
+                payload, validate=validate, headers=headers, deadline_s=deadline_s
+            ),
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def acreate_many(
+        self,
+        payloads: Iterable[CreateReceiptRequest | dict[str, Any]]
+        | AsyncIterable[CreateReceiptRequest | dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        validate: bool = True,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
+    ) -> AsyncIterator[ItemResult[CreateReceiptRequest | dict[str, Any], CreateReceiptResponse]]:
+        """Async variant of :meth:`create_many`; ``payloads`` may also be an
+        async iterable. Use with ``async for``."""
+        return astream_many(
+            payloads,
+            lambda payload: self.acreate(
+                payload, validate=validate, headers=headers, deadline_s=deadline_s
+            ),
+            concurrency=concurrency,
+            ordered=ordered,
         )
 
     def delete(
-        self, payload: DeleteReceiptRequest | dict[str, Any], *, headers: HeaderTypes | None = None
+        self,
+        payload: DeleteReceiptRequest | dict[str, Any],
+        *,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> None:
+        if isinstance(payload, dict):
+            payload = self._validate_payload(DeleteReceiptRequest, payload)
         self._send_sync_request(
             "DELETE",
             payload_model=DeleteReceiptRequest,
             payload=payload,
             headers=headers,
+            deadline_s=deadline_s,
         )
 
     async def adelete(
-        self, payload: DeleteReceiptRequest | dict[str, Any], *, headers: HeaderTypes | None = None
+        self,
+        payload: DeleteReceiptRequest | dict[str, Any],
+        *,
+        headers: HeaderTypes | None = None,
+        deadline_s: float | None = None,
     ) -> None:
+        if isinstance(payload, dict):
+            payload = self._validate_payload(DeleteReceiptRequest, payload)
         await self._send_async_request(
             "DELETE",
             payload_model=DeleteReceiptRequest,
             payload=payload,
             headers=headers,
+            deadline_s=deadline_s,
         )
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import importlib.util
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Any, Literal, TypeAlias
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Literal, TypeAlias, TypeGuard
 
-from pydantic import field_serializer, field_validator
+from pydantic import ValidationError, field_serializer, field_validator
+from pydantic_core import InitErrorDetails, to_json
 
+from ....errors import PosApiValidationError
 from ...base_model import BaseEbarimtModel
 from ...enum import (
     BarCodeType,
@@ -170,7 +175,13 @@ class CreateReceiptResponse(_CreateReceiptBase):
     def parse_date(cls, v: str | datetime) -> datetime:
         if isinstance(v, datetime):
             return v if v.tzinfo else v.replace(tzinfo=timezone.utc)
-        return datetime.strptime(v, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+        try:
+            return datetime.strptime(v, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+        except ValueError:
+            # ISO 8601, as written by ``model_dump_json`` — so a stored
+            # response (e.g. in the receipt outbox) reads back.
+            parsed = datetime.fromisoformat(v.replace("Z", "+00:00"))
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
 class DeleteReceiptRequest(BaseEbarimtModel):
@@ -185,3 +196,410 @@ class DeleteReceiptRequest(BaseEbarimtModel):
         if value is None:
             return value
         return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Trusted fast path
+#
+# Pydantic validation of a large receipt dict costs about as much as sending
+# it, and rebuilding nested models by hand (``model_construct``) is slower
+# still, as it runs in Python. A caller whose pipeline already produced a
+# valid receipt can skip the models altogether: the checks below only look at
+# the shape (required keys present, lists where lists belong), and the dict is
+# then serialized straight to JSON by pydantic-core. Field validators (e.g.
+# positive ``qty``) do not run.
+
+
+def _required_aliases(model: type[BaseEbarimtModel]) -> frozenset[str]:
+    return frozenset(
+        field.alias or name for name, field in model.model_fields.items() if field.is_required()
+    )
+
+
+_RECEIPT_KEYS = _required_aliases(CreateReceiptRequest)
+_SUB_RECEIPT_KEYS = _required_aliases(SubReceipt)
+_ITEM_KEYS = _required_aliases(Item)
+_PAYMENT_KEYS = _required_aliases(Payment)
+
+
+def _check_mapping(
+    value: Any, required: frozenset[str], loc: tuple[str | int, ...], errors: list[InitErrorDetails]
+) -> TypeGuard[dict[str, Any]]:
+    if not isinstance(value, dict):
+        errors.append({"type": "dict_type", "loc": loc, "input": value})
+        return False
+    if not required <= value.keys():
+        for key in sorted(required - value.keys()):
+            errors.append({"type": "missing", "loc": (*loc, key), "input": value})
+    return True
+
+
+def _check_list(
+    value: Any, loc: tuple[str | int, ...], errors: list[InitErrorDetails], *, min_length: int
+) -> TypeGuard[list[Any]]:
+    if not isinstance(value, list):
+        errors.append({"type": "list_type", "loc": loc, "input": value})
+        return False
+    if len(value) < min_length:
+        ctx = {"field_type": "List", "min_length": min_length, "actual_length": len(value)}
+        errors.append({"type": "too_short", "loc": loc, "input": value, "ctx": ctx})
+        return False
+    return True
+
+
+def trusted_receipt_json(data: dict[str, Any]) -> bytes:
+    """Wire JSON for an already-valid receipt, without pydantic validation.
+
+    ``data`` must use the wire (camelCase) keys, as produced by
+    ``model_dump(by_alias=True, exclude_none=True)``; ``None`` values are sent
+    as ``null``. Only the structure of the receipt, its sub-receipts, items
+    and payments is checked — required keys and non-empty lists — and a bad
+    shape raises :class:`~ebarimt_pos_sdk.errors.PosApiValidationError`.
+    Values are not checked at all. For a dumped ``CreateReceiptRequest`` the
+    bytes equal those of the validated path.
+    """
+    errors: list[InitErrorDetails] = []
+    if _check_mapping(data, _RECEIPT_KEYS, (), errors):
+        receipts = data.get("receipts")
+        if _check_list(receipts, ("receipts",), errors, min_length=1):
+            for i, sub in enumerate(receipts):
+                loc: tuple[str | int, ...] = ("receipts", i)
+                if not _check_mapping(sub, _SUB_RECEIPT_KEYS, loc, errors):
+                    continue
+                items = sub.get("items")
+                if _check_list(items, (*loc, "items"), errors, min_length=1):
+                    for j, item in enumerate(items):
+                        _check_mapping(item, _ITEM_KEYS, (*loc, "items", j), errors)
+        payments = data.get("payments")
+        if payments is not None and _check_list(payments, ("payments",), errors, min_length=0):
+            for i, payment in enumerate(payments):
+                _check_mapping(payment, _PAYMENT_KEYS, ("payments", i), errors)
+    if errors:
+        raise PosApiValidationError(
+            stage="request",
+            model=CreateReceiptRequest,
+            validation_error=ValidationError.from_exception_data(
+                CreateReceiptRequest.__name__, errors
+            ),
+        )
+    return to_json(data)
+
+
+# Tax totals
+#
+# An opt-in helper: the SDK itself never recomputes or rejects taxes (that is
+# PosAPI's job), but callers that build receipts need the totals, and one
+# consistent engine beats a hand-written loop per integration.
+
+_ALL_TAX_TYPES = frozenset(t.value for t in TaxType)
+# Below this many items the NumPy screen costs more than it saves.
+_VECTOR_MIN_ITEMS = 64
+# Floats within this much (absolute, or relative for large amounts) of a
+# rounding tie or of a mismatch are re-checked in Decimal.
+_FLOAT_ABS_TOL = 1e-6
+_FLOAT_REL_TOL = 1e-12
+
+
+@dataclass(frozen=True, kw_only=True)
+class TaxRates:
+    """Rates and conventions for :class:`ReceiptTaxCalculator`.
+
+    The rates are policy, so they are yours to set; the defaults match the
+    PosAPI documentation's examples (10% VAT, 2% city tax).
+
+    Attributes:
+        vat: VAT rate, charged on ``VAT_ABLE`` sub-receipts only.
+        city_tax: City tax rate, charged on the tax types in ``city_tax_types``.
+        city_tax_types: Sub-receipt tax types that carry city tax. Only
+            ``VAT_ABLE`` by default, as in the PosAPI examples; whether
+            exempt or zero-rated goods carry city tax depends on the goods,
+            so add those types yourself where it applies.
+        prices_include_tax: ``unit_price`` already includes the taxes, which
+            are then carved out of the line total. ``False`` adds them on
+            top of ``qty * unit_price``.
+        rounding_unit: Every line amount and tax is rounded half-up to this.
+
+    A rate or unit given as a ``float`` or ``int`` is converted with
+    ``Decimal(str(value))`` here, so ``0.1`` is exactly ``Decimal("0.1")``.
+    """
+
+    vat: Decimal = Decimal("0.10")
+    city_tax: Decimal = Decimal("0.02")
+    city_tax_types: frozenset[str] = frozenset({TaxType.VAT_ABLE.value})
+    prices_include_tax: bool = True
+    rounding_unit: Decimal = Decimal("0.01")
+
+    def __post_init__(self) -> None:
+        for name in ("vat", "city_tax", "rounding_unit"):
+            value = getattr(self, name)
+            if not isinstance(value, Decimal):
+                object.__setattr__(self, name, Decimal(str(value)))
+        if self.vat < 0:
+            raise ValueError("TaxRates.vat must be >= 0")
+        if self.city_tax < 0:
+            raise ValueError("TaxRates.city_tax must be >= 0")
+        if self.rounding_unit <= 0:
+            raise ValueError("TaxRates.rounding_unit must be > 0")
+
+
+@dataclass(frozen=True, slots=True)
+class ItemTaxes:
+    """Totals of one receipt line."""
+
+    total_amount: Decimal
+    total_vat: Decimal
+    total_city_tax: Decimal
+
+
+@dataclass(frozen=True)
+class TaxIssue:
+    """A total that differs from what :class:`ReceiptTaxCalculator` derives.
+
+    ``receipt`` and ``item`` are indexes into ``receipts`` and its ``items``;
+    ``item`` is ``None`` for a sub-receipt total and both are ``None`` for a
+    receipt total. ``actual`` is ``None`` when the field is unset.
+    """
+
+    receipt: int | None
+    item: int | None
+    field: str
+    expected: Decimal
+    actual: Decimal | None
+
+
+_TOTAL_FIELDS = ("total_amount", "total_vat", "total_city_tax")
+
+
+def _decimal(value: Number) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    # repr() keeps a float's shortest round-tripping digits (0.1, not 0.1000…055).
+    return Decimal(value) if isinstance(value, int) else Decimal(repr(value))
+
+
+class ReceiptTaxCalculator:
+    """Derive ``total_amount``, ``total_vat`` and ``total_city_tax`` from
+    ``qty``, ``unit_price`` and the sub-receipt's ``tax_type``.
+
+    Lines are computed exactly in ``Decimal`` and rounded half-up to
+    ``rates.rounding_unit``; sub-receipt and receipt totals are the sums of
+    their (rounded) lines. :meth:`fill` writes the totals into a request,
+    :meth:`check_receipt` reports the ones that differ.
+
+    ``vectorize`` lets :meth:`check_receipt` screen large receipts with NumPy
+    (``None``: when it is installed and the receipt has enough items). The
+    screen only clears lines that certainly match; every other line is
+    re-checked in ``Decimal``, so the result is the same either way.
+    """
+
+    def __init__(self, rates: TaxRates | None = None, *, vectorize: bool | None = None) -> None:
+        self.rates = rates or TaxRates()
+        if vectorize and importlib.util.find_spec("numpy") is None:
+            raise ImportError("vectorize=True requires the 'numpy' package; install it.")
+        self._vectorize = vectorize
+        rates = self.rates
+        self._unit = rates.rounding_unit
+        # (vat rate, city tax rate, divisor carving both out of a gross amount)
+        self._by_type: dict[str, tuple[Decimal, Decimal, Decimal]] = {}
+        for tax_type in _ALL_TAX_TYPES:
+            vat = rates.vat if tax_type == TaxType.VAT_ABLE.value else Decimal(0)
+            city = rates.city_tax if tax_type in rates.city_tax_types else Decimal(0)
+            self._by_type[tax_type] = (vat, city, 1 + vat + city)
+
+    def _rates_for(self, tax_type: _TaxType) -> tuple[Decimal, Decimal, Decimal]:
+        return self._by_type[tax_type.value if isinstance(tax_type, TaxType) else tax_type]
+
+    def item_taxes(self, qty: Number, unit_price: Number, tax_type: _TaxType) -> ItemTaxes:
+        """Totals of one line of ``qty`` at ``unit_price`` under ``tax_type``."""
+        return ItemTaxes(*self._lines([(qty, unit_price)], tax_type)[0])
+
+    def _lines(
+        self, lines_in: Iterable[tuple[Number, Number]], tax_type: _TaxType
+    ) -> list[_Totals]:
+        """``(total_amount, total_vat, total_city_tax)`` of each ``(qty,
+        unit_price)``: the one hot loop, so everything it touches is a local."""
+        vat_rate, city_rate, divisor = self._rates_for(tax_type)
+        unit = self._unit
+        half_up = ROUND_HALF_UP
+        include = self.rates.prices_include_tax
+        lines: list[_Totals] = []
+        append = lines.append
+        for qty, price in lines_in:
+            if type(qty) is not Decimal:
+                qty = _decimal(qty)
+            if isinstance(price, float):
+                price = _decimal(price)
+            amount = (qty * price).quantize(unit, half_up)
+            if include:
+                vat = (amount * vat_rate / divisor).quantize(unit, half_up)
+                city = (amount * city_rate / divisor).quantize(unit, half_up)
+                append((amount, vat, city))
+            else:
+                vat = (amount * vat_rate).quantize(unit, half_up)
+                city = (amount * city_rate).quantize(unit, half_up)
+                append((amount + vat + city, vat, city))
+        return lines
+
+    def fill(self, request: CreateReceiptRequest) -> CreateReceiptRequest:
+        """Write the derived totals into every item, sub-receipt and the
+        receipt itself, in place, and return ``request``."""
+        total = _ZERO
+        for sub_receipt in request.receipts:
+            lines = self._lines(_pairs(sub_receipt.items), sub_receipt.tax_type)
+            for item, line in zip(sub_receipt.items, lines, strict=True):
+                _assign(item, line)
+            sub_total = _sum(lines)
+            _assign(sub_receipt, sub_total)
+            total = _sum((total, sub_total))
+        _assign(request, total)
+        return request
+
+    def check_receipt(self, request: CreateReceiptRequest) -> tuple[TaxIssue, ...]:
+        """Totals on ``request`` that differ from the derived ones.
+
+        An opt-in pre-flight check; the SDK never rejects a receipt on its
+        own. An unset VAT or city tax is only reported when the derived value
+        is not zero.
+        """
+        screen = self._screen(request)
+        issues: list[TaxIssue] = []
+        total = _ZERO
+        for r, sub_receipt in enumerate(request.receipts):
+            items = sub_receipt.items
+            if screen is None:
+                redo: list[int] = list(range(len(items)))
+                cleared = _ZERO
+            else:
+                redo, cleared = screen[r]
+            lines = self._lines(_pairs(items[i] for i in redo), sub_receipt.tax_type)
+            for i, line in zip(redo, lines, strict=True):
+                if _actual(items[i]) != line:
+                    issues.extend(_compare(items[i], line, r, i))
+            sub_total = _sum((cleared, *lines))
+            issues.extend(_compare(sub_receipt, sub_total, r, None))
+            total = _sum((total, sub_total))
+        issues.extend(_compare(request, total, None, None))
+        return tuple(issues)
+
+    def _screen(self, request: CreateReceiptRequest) -> list[tuple[list[int], _Totals]] | None:
+        """Per sub-receipt, the items NumPy could not prove right and the sum
+        of those it did; ``None`` when the screen is not used.
+
+        Amounts are compared in float64 as multiples of ``rounding_unit``.
+        An item is cleared only when its stated totals equal the derived
+        ones and no intermediate value is near a rounding tie, so float
+        error can only send an item back to ``Decimal``, never clear it.
+        """
+        sizes = [len(sub.items) for sub in request.receipts]
+        count = sum(sizes)
+        if self._vectorize is False or count == 0:
+            return None
+        if self._vectorize is None and (
+            count < _VECTOR_MIN_ITEMS or importlib.util.find_spec("numpy") is None
+        ):
+            return None
+        import numpy as np
+
+        # Unset VAT / city tax reads as 0: it only matches a derived 0.
+        table = np.array(
+            [
+                (
+                    item.qty,
+                    item.unit_price,
+                    item.total_amount,
+                    item.total_vat or 0,
+                    item.total_city_tax or 0,
+                )
+                for sub in request.receipts
+                for item in sub.items
+            ],
+            dtype=np.float64,
+        )
+        rates = np.repeat(
+            np.array([self._rates_for(sub.tax_type) for sub in request.receipts], np.float64),
+            sizes,
+            axis=0,
+        )
+        scale = float(1 / self._unit)
+
+        def tolerance(value: Any) -> Any:
+            return np.maximum(_FLOAT_ABS_TOL, np.abs(value) * _FLOAT_REL_TOL)
+
+        def rounded(raw: Any) -> tuple[Any, Any]:
+            nearest = np.floor(raw + 0.5)
+            return nearest, np.abs(raw - np.floor(raw) - 0.5) < tolerance(raw)
+
+        amount, unsure = rounded(table[:, 0] * table[:, 1] * scale)
+        if self.rates.prices_include_tax:
+            vat, vat_tie = rounded(amount * rates[:, 0] / rates[:, 2])
+            city, city_tie = rounded(amount * rates[:, 1] / rates[:, 2])
+            total = amount
+        else:
+            vat, vat_tie = rounded(amount * rates[:, 0])
+            city, city_tie = rounded(amount * rates[:, 1])
+            total = amount + vat + city
+        stated = table[:, 2:] * scale
+        derived = np.column_stack((total, vat, city))
+        ok = ~(unsure | vat_tie | city_tie) & np.all(
+            np.abs(stated - derived) < tolerance(derived), axis=1
+        )
+        unit = self._unit
+        result: list[tuple[list[int], _Totals]] = []
+        start = 0
+        for size in sizes:
+            chunk = ok[start : start + size]
+            sums = derived[start : start + size][chunk].sum(axis=0).tolist()
+            # Whole multiples of the unit below 2**53, so the float sums are exact.
+            cleared = (
+                Decimal(round(sums[0])) * unit,
+                Decimal(round(sums[1])) * unit,
+                Decimal(round(sums[2])) * unit,
+            )
+            result.append((np.flatnonzero(~chunk).tolist(), cleared))
+            start += size
+        return result
+
+
+_Totals = tuple[Decimal, Decimal, Decimal]
+_ZERO: _Totals = (Decimal(0), Decimal(0), Decimal(0))
+
+
+def _pairs(items: Iterable[Item]) -> list[tuple[Number, Number]]:
+    return [(item.qty, item.unit_price) for item in items]
+
+
+def _sum(lines: Iterable[_Totals]) -> _Totals:
+    amount = vat = city = Decimal(0)
+    for line_amount, line_vat, line_city in lines:
+        amount += line_amount
+        vat += line_vat
+        city += line_city
+    return amount, vat, city
+
+
+def _actual(model: Item | SubReceipt | CreateReceiptRequest) -> _Totals:
+    """The totals a model carries, unset VAT and city tax read as zero."""
+    return (
+        _decimal(model.total_amount),
+        _decimal(model.total_vat or 0),
+        _decimal(model.total_city_tax or 0),
+    )
+
+
+def _assign(model: Item | SubReceipt | CreateReceiptRequest, totals: _Totals) -> None:
+    for name, value in zip(_TOTAL_FIELDS, totals, strict=True):
+        setattr(model, name, value)
+
+
+def _compare(
+    model: Item | SubReceipt | CreateReceiptRequest,
+    totals: _Totals,
+    receipt: int | None,
+    item: int | None,
+) -> Iterator[TaxIssue]:
+    for name, expected in zip(_TOTAL_FIELDS, totals, strict=True):
+        value = getattr(model, name)
+        actual = None if value is None else _decimal(value)
+        if actual is None and expected == 0 and name != "total_amount":
+            continue
+        if actual != expected:
+            yield TaxIssue(receipt, item, name, expected, actual)
@@ -6,22 +6,26 @@ class SendDataResource(BaseResource):
     def _path(self) -> str:
         return "/rest/sendData"
 
-    def send(self, headers: HeaderTypes | None = None) -> None:
+    def send(self, headers: HeaderTypes | None = None, *, deadline_s: float | None = None) -> None:
         result = self._sync.send(
             "GET",
             self._path,
             headers=headers,
+            deadline_s=deadline_s,
         )
 
         self._ensure_http_success(result.response)
 
         return None
 
-    async def asend(self, headers: HeaderTypes | None = None) -> None:
+    async def asend(
+        self, headers: HeaderTypes | None = None, *, deadline_s: float | None = None
+    ) -> None:
         result = await self._async.send(
             "GET",
             self._path,
             headers=headers,
+            deadline_s=deadline_s,
         )
 
         self._ensure_http_success(result.response)
@@ -1,11 +1,25 @@
 """Settings for Ebarimt clients."""
 
 from .api_client_settings import ApiClientSettings
+from .cache_settings import CacheSettings
+from .circuit_breaker_settings import CircuitBreakerSettings
+from .concurrency_settings import AdaptiveConcurrencySettings
+from .hedge_settings import HedgeSettings
+from .idempotency_settings import IdempotencySettings
+from .outbox_settings import OutboxSettings
+from .rate_limit_settings import RateLimitSettings
 from .rest_client_settings import RestClientSettings
 from .retry_settings import RetrySettings
 
 __all__ = [
+    "AdaptiveConcurrencySettings",
     "ApiClientSettings",
+    "CacheSettings",
+    "CircuitBreakerSettings",
+    "HedgeSettings",
+    "IdempotencySettings",
+    "OutboxSettings",
+    "RateLimitSettings",
     "RestClientSettings",
     "RetrySettings",
 ]
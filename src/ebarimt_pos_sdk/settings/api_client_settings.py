@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from .base_settings import BaseSettings
+from .cache_settings import CacheSettings
+from .hedge_settings import HedgeSettings
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -13,6 +15,13 @@ class ApiClientSettings(BaseSettings):
     info, product tax codes, BÜNA classification) do not require auth, so
     every credential field below is optional. They remain for forward
     compatibility with endpoints that may require OAuth2 in the future.
+
+    ``hedge`` enables hedged GETs on the async resources: a lookup slower
+    than a recent latency percentile is raced against a second request.
+
+    ``lookup_cache`` keeps ``merchant_info`` and ``tin_info`` answers in a
+    bounded in-memory LRU with a TTL (and a shorter one for unknown TINs);
+    each resource gets its own cache.
     """
 
     token_url: str | None = None
@@ -23,8 +32,11 @@ class ApiClientSettings(BaseSettings):
     password: str | None = None
     scope: str | None = None
     skew_seconds: float = 30
+    hedge: HedgeSettings | None = None
+    lookup_cache: CacheSettings | None = None
 
     def __post_init__(self) -> None:
+        super().__post_init__()
         # Only validate fields when supplied — empty / whitespace strings are
         # always a misconfiguration regardless of whether auth is in use.
         for field_name in ("token_url", "client_id", "username", "password"):
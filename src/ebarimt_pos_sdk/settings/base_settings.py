@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
+from .._json import JSON_BACKEND_NAMES, JsonBackendName
+from .circuit_breaker_settings import CircuitBreakerSettings
+from .concurrency_settings import AdaptiveConcurrencySettings
+from .rate_limit_settings import RateLimitSettings
 from .retry_settings import RetrySettings
 
 
@@ -9,6 +14,10 @@ from .retry_settings import RetrySettings
 class BaseSettings:
     """
     Base settings class for Ebarimt SDK clients.
+
+    The connection-pool fields only apply to clients the SDK builds itself;
+    an injected ``sync_client``/``async_client`` keeps its own pool. ``None``
+    for a limit means "unbounded", matching ``httpx.Limits``.
     """
 
     base_url: str
@@ -18,6 +27,59 @@ class BaseSettings:
 
     retry: RetrySettings = field(default_factory=RetrySettings)
 
+    # New fields go below, after the original positional ones.
+
+    # Overall budget for one call across all attempts and backoffs; each
+    # attempt's timeout shrinks to what is left. ``None`` means no deadline.
+    deadline_s: float | None = None
+    # Per-host fail-fast; ``None`` disables it.
+    circuit_breaker: CircuitBreakerSettings | None = None
+    # Share one in-flight request (and decoded result) between identical
+    # concurrent GETs.
+    coalesce_gets: bool = False
+    # Revalidate GETs whose last 200 carried an ETag/Last-Modified with
+    # If-None-Match/If-Modified-Since; a 304 is answered with a copy of the
+    # model decoded from the stored 200.
+    conditional_gets: bool = False
+    # AIMD cap on in-flight requests for the async transport; ``None`` leaves
+    # concurrency to the caller (and the pool limits below).
+    adaptive_concurrency: AdaptiveConcurrencySettings | None = None
+    # Client-side token buckets keyed by request path prefix, e.g.
+    # ``{"/api/info/check/getInfo": RateLimitSettings(rate_per_s=5, burst=10)}``.
+    # A request uses the bucket of its longest matching prefix.
+    rate_limits: Mapping[str, RateLimitSettings] = field(default_factory=dict)
+
+    # JSON library for non-model bodies ("stdlib", "orjson", "msgspec" or
+    # "auto"). Models always serialize/validate through pydantic-core.
+    json_backend: JsonBackendName = "stdlib"
+
+    # Connection pool (httpx defaults: 100 / 20 / 5s, HTTP/1.1 only).
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry_s: float | None = 5.0
+    # Requires the ``httpx[http2]`` extra (the ``h2`` package).
+    http2: bool = False
+    # Read proxy/netrc/SSL settings from the environment (httpx ``trust_env``).
+    # Turn off for a local service so a system proxy is never consulted.
+    trust_env: bool = True
+
+    def __post_init__(self) -> None:
+        if self.deadline_s is not None and self.deadline_s <= 0:
+            raise ValueError(f"{type(self).__name__}.deadline_s must be > 0 or None")
+        if self.max_connections is not None and self.max_connections < 1:
+            raise ValueError(f"{type(self).__name__}.max_connections must be >= 1 or None")
+        # 0 keeps no idle connections: every request opens a fresh one.
+        if self.max_keepalive_connections is not None and self.max_keepalive_connections < 0:
+            raise ValueError(
+                f"{type(self).__name__}.max_keepalive_connections must be >= 0 or None"
+            )
+        if self.keepalive_expiry_s is not None and self.keepalive_expiry_s < 0:
+            raise ValueError(f"{type(self).__name__}.keepalive_expiry_s must be >= 0 or None")
+        if self.json_backend not in JSON_BACKEND_NAMES:
+            raise ValueError(
+                f"{type(self).__name__}.json_backend must be one of {sorted(JSON_BACKEND_NAMES)}"
+            )
+
     @property
     def normalized_base_url(self) -> str:
         """Normalizes base_url for clients to use.
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class CacheSettings:
+    """Configuration for a bounded, in-memory lookup cache.
+
+    Attributes:
+        max_entries: Entries kept before the least recently used is evicted.
+        ttl_s: How long a positive answer is served from memory.
+        negative_ttl_s: How long a negative answer (unknown TIN, a 4xx for
+            that key) is served. Kept short so a freshly registered
+            taxpayer shows up soon. ``0`` disables negative caching.
+        max_stale_s: Stale-while-revalidate window. A positive answer past
+            its TTL is still returned for up to this long while it is
+            refreshed in the background (a thread for sync reads, a task for
+            async ones). ``0`` (the default) always refetches in line.
+    """
+
+    max_entries: int = 1024
+    ttl_s: float = 300.0
+    negative_ttl_s: float = 30.0
+    max_stale_s: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError("CacheSettings.max_entries must be >= 1")
+        if self.ttl_s <= 0:
+            raise ValueError("CacheSettings.ttl_s must be > 0")
+        if self.negative_ttl_s < 0:
+            raise ValueError("CacheSettings.negative_ttl_s must be >= 0")
+        if self.max_stale_s < 0:
+            raise ValueError("CacheSettings.max_stale_s must be >= 0")
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class CircuitBreakerSettings:
+    """Configuration for the per-host circuit breaker in the transports.
+
+    Attributes:
+        failure_threshold: Consecutive failed attempts (network errors,
+            timeouts, retryable statuses) that open the circuit.
+        recovery_timeout_s: How long an open circuit fails fast before letting
+            a single probe request through (half-open). A probe that has not
+            reported back within this window is presumed lost and replaced.
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout_s: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1:
+            raise ValueError("CircuitBreakerSettings.failure_threshold must be >= 1")
+        if self.recovery_timeout_s <= 0:
+            raise ValueError("CircuitBreakerSettings.recovery_timeout_s must be > 0")
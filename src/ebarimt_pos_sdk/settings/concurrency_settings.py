@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class AdaptiveConcurrencySettings:
+    """Configuration for the adaptive (AIMD) concurrency limiter on the async
+    transport.
+
+    The limiter caps how many requests are on the wire at once. Each success
+    observed while the window is in use grows the limit by roughly one per
+    round trip (additive increase); a timeout, network error, retryable status
+    or latency spike multiplies it by ``decrease_factor`` (multiplicative
+    decrease). Callers over the limit wait in FIFO order.
+
+    Attributes:
+        initial_limit: Starting window.
+        min_limit: The window never shrinks below this.
+        max_limit: The window never grows above this.
+        decrease_factor: Multiplier applied on overload (0 < f < 1).
+        latency_tolerance: A success slower than ``latency_tolerance`` × the
+            fastest recent latency counts as overload. ``None`` reacts to
+            errors only.
+        window: Number of recent latencies the baseline is taken over.
+    """
+
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 200
+    decrease_factor: float = 0.5
+    latency_tolerance: float | None = 2.0
+    window: int = 100
+
+    def __post_init__(self) -> None:
+        if self.min_limit < 1:
+            raise ValueError("AdaptiveConcurrencySettings.min_limit must be >= 1")
+        if self.max_limit < self.min_limit:
+            raise ValueError("AdaptiveConcurrencySettings.max_limit must be >= min_limit")
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                "AdaptiveConcurrencySettings.initial_limit must be between min_limit and max_limit"
+            )
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError("AdaptiveConcurrencySettings.decrease_factor must be between 0 and 1")
+        if self.latency_tolerance is not None and self.latency_tolerance <= 1:
+            raise ValueError("AdaptiveConcurrencySettings.latency_tolerance must be > 1 or None")
+        if self.window < 1:
+            raise ValueError("AdaptiveConcurrencySettings.window must be >= 1")
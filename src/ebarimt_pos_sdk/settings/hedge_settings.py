@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class HedgeSettings:
+    """Configuration for hedged GETs on the async transport.
+
+    When a GET has not answered within the hedge delay, a second identical
+    request is sent and whichever answers first wins; the other is cancelled.
+
+    Attributes:
+        percentile: Latency percentile (0 < p < 1) of recent successful GETs
+            used as the hedge delay, e.g. ``0.95`` hedges the slowest ~5%.
+        initial_delay_s: Hedge delay used until ``min_samples`` latencies have
+            been observed.
+        min_delay_s: Lower bound on the delay, so a fast, bursty sample never
+            turns every call into two.
+        min_samples: Observations needed before the percentile is trusted.
+        window: Number of recent latencies the percentile is computed over.
+        budget_ratio: Hedge budget — every GET earns ``budget_ratio`` tokens
+            and every hedge spends one, so hedges stay below that fraction
+            of traffic.
+        budget_burst: Token capacity of the hedge budget.
+    """
+
+    percentile: float = 0.95
+    initial_delay_s: float = 0.5
+    min_delay_s: float = 0.01
+    min_samples: int = 20
+    window: int = 200
+    budget_ratio: float = 0.05
+    budget_burst: int = 5
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 1:
+            raise ValueError("HedgeSettings.percentile must be between 0 and 1")
+        if self.initial_delay_s <= 0:
+            raise ValueError("HedgeSettings.initial_delay_s must be > 0")
+        if self.min_delay_s < 0:
+            raise ValueError("HedgeSettings.min_delay_s must be >= 0")
+        if self.min_samples < 1:
+            raise ValueError("HedgeSettings.min_samples must be >= 1")
+        if self.window < self.min_samples:
+            raise ValueError("HedgeSettings.window must be >= min_samples")
+        if self.budget_ratio <= 0:
+            raise ValueError("HedgeSettings.budget_ratio must be > 0")
+        if self.budget_burst < 1:
+            raise ValueError("HedgeSettings.budget_burst must be >= 1")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..resources.rest.receipt.schema import CreateReceiptRequest, CreateReceiptResponse
+
+
+@dataclass(frozen=True, kw_only=True)
+class IdempotencySettings:
+    """Configuration for the receipt idempotency ledger.
+
+    Attributes:
+        ttl_s: How long the outcome of a receipt is remembered. PosAPI only
+            requires ``billIdSuffix`` to be unique within a day, so a key
+            older than that no longer identifies one receipt.
+        max_entries: Outcomes kept before the oldest is dropped. Unresolved
+            (ambiguous) receipts are never dropped to make room.
+        max_attempts: Sends per ``create`` call, counting the first. Only
+            used with ``reconcile``: a receipt is sent again only after it
+            has confirmed that the failed attempt issued nothing.
+        reconcile: Called with the request after an attempt failed in a way
+            that leaves its outcome unknown (a read timeout, a dropped
+            connection, a 5xx). Return the receipt if it was issued, or
+            ``None`` if it certainly was not. Async calls run it in a worker
+            thread. Without it an ambiguous receipt raises
+            :class:`~ebarimt_pos_sdk.errors.PosApiAmbiguousReceiptError`
+            until resolved through the ledger.
+    """
+
+    ttl_s: float = 86_400.0
+    max_entries: int = 10_000
+    max_attempts: int = 3
+    reconcile: Callable[[CreateReceiptRequest], CreateReceiptResponse | None] | None = None
+
+    def __post_init__(self) -> None:
+        if self.ttl_s <= 0:
+            raise ValueError("IdempotencySettings.ttl_s must be > 0")
+        if self.max_entries < 1:
+            raise ValueError("IdempotencySettings.max_entries must be >= 1")
+        if self.max_attempts < 1:
+            raise ValueError("IdempotencySettings.max_attempts must be >= 1")
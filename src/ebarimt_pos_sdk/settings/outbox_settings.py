@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .retry_settings import RetrySettings
+
+
+def _default_retry() -> RetrySettings:
+    return RetrySettings(
+        max_retries=20, backoff_base_seconds=1.0, max_backoff_seconds=300.0, jitter=True
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class OutboxSettings:
+    """Configuration for a :class:`~ebarimt_pos_sdk.outbox.ReceiptOutbox`.
+
+    Attributes:
+        batch_size: Receipts claimed from the journal per round.
+        concurrency: Receipts sent at once within a round.
+        poll_interval_s: Longest the worker sleeps while idle; an enqueue in
+            the same process wakes it at once.
+        lease_s: How long a claimed receipt is reserved for the worker that
+            claimed it. A receipt still ``sending`` after that (its worker
+            died) is claimed again. Must exceed the client's deadline.
+        retry: Attempts per receipt (``max_retries``, across rounds) and the
+            backoff between them. Only sends that never reached PosAPI are
+            retried (and, with a reconciling ledger, ambiguous ones); see
+            :class:`~ebarimt_pos_sdk.outbox.ReceiptOutbox`.
+        durable: ``PRAGMA synchronous=FULL`` — an enqueued receipt survives a
+            power cut. ``False`` uses ``NORMAL``: faster enqueues, and the
+            journal still never corrupts, but the last few may be lost.
+    """
+
+    batch_size: int = 50
+    concurrency: int = 4
+    poll_interval_s: float = 1.0
+    lease_s: float = 120.0
+    retry: RetrySettings = field(default_factory=_default_retry)
+    durable: bool = True
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError("OutboxSettings.batch_size must be >= 1")
+        if self.concurrency < 1:
+            raise ValueError("OutboxSettings.concurrency must be >= 1")
+        if self.poll_interval_s <= 0:
+            raise ValueError("OutboxSettings.poll_interval_s must be > 0")
+        if self.lease_s <= 0:
+            raise ValueError("OutboxSettings.lease_s must be > 0")
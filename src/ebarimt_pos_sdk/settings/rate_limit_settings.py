@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class RateLimitSettings:
+    """A client-side token bucket for one endpoint path (see
+    ``BaseSettings.rate_limits``).
+
+    Attributes:
+        rate_per_s: Sustained requests per second.
+        burst: Requests that may go out back-to-back after an idle spell
+            (the bucket's capacity).
+    """
+
+    rate_per_s: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate_per_s <= 0:
+            raise ValueError("RateLimitSettings.rate_per_s must be > 0")
+        if self.burst < 1:
+            raise ValueError("RateLimitSettings.burst must be >= 1")
@@ -3,12 +3,46 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from .base_settings import BaseSettings
+from .cache_settings import CacheSettings
+from .idempotency_settings import IdempotencySettings
+
+SocketOption = tuple[int, int, int]
 
 
 @dataclass(frozen=True, kw_only=True)
 class RestClientSettings(BaseSettings):
     """
     Settings for REST client.
+
+    The PosAPI service usually runs on the same machine as the POS, so the
+    transport can be tuned for a local peer:
+
+    * ``uds`` — path of a Unix domain socket the service listens on. Requests
+      skip the TCP stack entirely; ``base_url`` still supplies the ``Host``
+      header and URL path (e.g. ``"http://localhost"``). ``trust_env`` is
+      ignored (off), so a proxy from the environment never takes over.
+    * ``socket_options`` — extra ``(level, option, value)`` tuples applied to
+      every new socket, e.g. larger ``SO_SNDBUF`` for big receipts.
+      ``TCP_NODELAY`` is always set by httpcore on TCP sockets.
+
+    Both only apply to clients the SDK builds itself.
+
+    ``bank_account_cache`` keeps ``bank_accounts`` answers per TIN in a
+    bounded in-memory LRU with a TTL, so multi-merchant receipts do not pay
+    a round trip per sub-receipt.
+
+    ``receipt_idempotency`` puts ``receipt.create`` behind a
+    :class:`~ebarimt_pos_sdk.resources.ReceiptLedger`, so the same receipt is
+    never issued twice by this client, even when an attempt fails without
+    an answer.
     """
 
-    pass
+    uds: str | None = None
+    socket_options: tuple[SocketOption, ...] | None = None
+    bank_account_cache: CacheSettings | None = None
+    receipt_idempotency: IdempotencySettings | None = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if self.uds is not None and not self.uds.strip():
+            raise ValueError("RestClientSettings.uds cannot be empty or whitespace")
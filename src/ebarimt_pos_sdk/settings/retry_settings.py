@@ -1,24 +1,83 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 
 _DEFAULT_RETRYABLE_STATUSES: frozenset[int] = frozenset({500, 502, 503, 504})
+# RFC 9110 idempotent methods: repeating one has the same effect as sending it once.
+_DEFAULT_RETRY_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
 
 @dataclass(frozen=True, kw_only=True)
 class RetrySettings:
-    """Configuration for transport retry behaviour."""
+    """Configuration for transport retry behaviour.
+
+    Attributes:
+        max_retries: Total attempts per call, including the first.
+        retryable_statuses: HTTP statuses that trigger a retry.
+        retry_methods: Methods retried after the request may have reached the
+            server (a retryable status, a read timeout, a dropped connection).
+            Other methods — ``POST`` by default, so a receipt is never issued
+            twice — are only retried when the request provably was not sent
+            (connect errors, connect and pool timeouts).
+        backoff_base_seconds: Base of the exponential backoff.
+        max_backoff_seconds: Upper bound on any single backoff sleep, including
+            one requested by ``Retry-After``.
+        jitter: Use decorrelated jitter (``uniform(base, previous * 3)``) instead
+            of the deterministic ``base * 2**attempt`` so that many workers
+            hitting the same outage do not retry in lockstep.
+        respect_retry_after: Sleep for the server's ``Retry-After`` (seconds or
+            HTTP-date) when a retryable response carries one.
+        budget_ratio: Enables a retry budget shared by the client's transports:
+            every call earns ``budget_ratio`` tokens and every retry spends one,
+            so retries stay below that fraction of traffic. ``None`` disables it.
+        budget_burst: Token capacity of the budget; also the number of retries
+            allowed before any traffic has been seen.
+    """
 
     max_retries: int = 3
     retryable_statuses: frozenset[int] = field(default_factory=lambda: _DEFAULT_RETRYABLE_STATUSES)
+    retry_methods: frozenset[str] = field(default_factory=lambda: _DEFAULT_RETRY_METHODS)
     backoff_base_seconds: float = 1.0
+    max_backoff_seconds: float = 30.0
+    jitter: bool = False
+    respect_retry_after: bool = True
+    budget_ratio: float | None = None
+    budget_burst: int = 10
 
     def __post_init__(self) -> None:
         if self.max_retries < 1:
             raise ValueError("RetrySettings.max_retries must be >= 1")
+        if any(method != method.upper() for method in self.retry_methods):
+            raise ValueError("RetrySettings.retry_methods must be upper-case method names")
         if self.backoff_base_seconds < 0:
             raise ValueError("RetrySettings.backoff_base_seconds must be >= 0")
+        if self.max_backoff_seconds < 0:
+            raise ValueError("RetrySettings.max_backoff_seconds must be >= 0")
+        if self.budget_ratio is not None and self.budget_ratio <= 0:
+            raise ValueError("RetrySettings.budget_ratio must be > 0 or None")
+        if self.budget_burst < 1:
+            raise ValueError("RetrySettings.budget_burst must be >= 1")
+
+    def sleep_seconds(
+        self,
+        attempt: int,
+        *,
+        previous: float | None = None,
+        retry_after: float | None = None,
+    ) -> float:
+        """Return the sleep duration before the next retry.
 
-    def sleep_seconds(self, attempt: int) -> float:
-        """Return the sleep duration before the next retry (exponential backoff)."""
-        return float(self.backoff_base_seconds * (2**attempt))
+        ``attempt`` is the 0-based index of the attempt that just failed and
+        ``previous`` the sleep used before it (decorrelated jitter grows from
+        it). A ``retry_after`` hint wins over the computed backoff when
+        ``respect_retry_after`` is set. The result never exceeds
+        ``max_backoff_seconds``.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return float(min(self.max_backoff_seconds, max(0.0, retry_after)))
+        base = self.backoff_base_seconds
+        if self.jitter:
+            upper = max(base, (previous if previous is not None else base) * 3)
+            return float(min(self.max_backoff_seconds, random.uniform(base, upper)))
+        return float(min(self.max_backoff_seconds, base * (2**attempt)))
@@ -2,20 +2,45 @@
 HTTP transport layer. It concerns with:
 * send request
 * handle network errors
+* retry with backoff, bounded by a per-client retry budget
+* fail fast per host while a circuit breaker is open
+* coalesce identical in-flight GETs (single-flight)
+* revalidate GETs with ETag/Last-Modified and reuse the parsed result on 304
+* hedge slow GETs on the async transport, bounded by a hedge budget
+* adapt the async in-flight window to the service's capacity (AIMD)
+* pace requests per endpoint with client-side token buckets
 * handle non-2xx HTTP errors
 * decode JSON (or 204/empty)
 * produce structured context (request/response + metadata)
 """
 
 from .async_transport import AsyncTransport
+from .circuit_breaker import CircuitBreakerRegistry, CircuitSnapshot, CircuitState
+from .concurrency import ConcurrencyStats
+from .conditional import ConditionalCache, ConditionalStats
+from .hedge import HedgeStats
 from .http import HeaderTypes, HttpMethod, HttpRequestResponse, QueryParamTypes
+from .rate_limit import RateLimiter, RateLimitStats
+from .retry import RetryBudget
+from .single_flight import SingleFlightStats
 from .sync_transport import SyncTransport
 
 __all__ = [
     "AsyncTransport",
+    "CircuitBreakerRegistry",
+    "CircuitSnapshot",
+    "CircuitState",
+    "ConcurrencyStats",
+    "ConditionalCache",
+    "ConditionalStats",
+    "HedgeStats",
     "SyncTransport",
     "HttpMethod",
     "HttpRequestResponse",
     "HeaderTypes",
     "QueryParamTypes",
+    "RateLimiter",
+    "RateLimitStats",
+    "RetryBudget",
+    "SingleFlightStats",
 ]
@@ -5,16 +5,31 @@ from typing import Any
 
 import httpx
 
-from .._logging import log_request, log_response, log_retry, new_request_id
+from .._json import STDLIB_JSON, JsonBackend
+from .._logging import log_request, log_response, new_request_id
 from ..errors import PosApiTransportError
+from ..settings.concurrency_settings import AdaptiveConcurrencySettings
+from ..settings.hedge_settings import HedgeSettings
 from ..settings.retry_settings import RetrySettings
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .concurrency import AdaptiveConcurrencyLimiter, ConcurrencyStats, Outcome
+from .conditional import ConditionalCache, ConditionalStats
+from .deadline import Deadline
+from .hedge import Hedger, HedgeStats
 from .http import (
     HeaderTypes,
     HttpMethod,
     HttpRequestResponse,
+    JsonPayload,
     QueryParamTypes,
+    build_circuit_open_error,
+    build_deadline_error,
     build_transport_error,
+    encode_json_body,
 )
+from .rate_limit import RateLimiter
+from .retry import NOT_SENT_ERRORS, RetryBudget, RetryState
+from .single_flight import AsyncSingleFlight, JoinTimeoutError, SingleFlightStats, request_key
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +41,65 @@ class AsyncTransport:
         self,
         client: httpx.AsyncClient,
         retry: RetrySettings | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        deadline_s: float | None = None,
+        coalesce_gets: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        json_backend: JsonBackend = STDLIB_JSON,
+        hedge: HedgeSettings | None = None,
+        adaptive_concurrency: AdaptiveConcurrencySettings | None = None,
+        conditional: ConditionalCache | None = None,
     ) -> None:
         self._client = client
         self._retry = retry or RetrySettings()
+        # A client passes one budget to both of its transports; a standalone
+        # transport builds its own when the settings ask for one.
+        self._retry_budget = (
+            retry_budget if retry_budget is not None else RetryBudget.from_settings(self._retry)
+        )
+        self._circuit_breakers = circuit_breakers
+        self._deadline_s = deadline_s
+        self._rate_limiter = rate_limiter
+        self._json = json_backend
+        self._single_flight = AsyncSingleFlight() if coalesce_gets else None
+        self._conditional = conditional
+        self._hedger = Hedger(hedge) if hedge is not None else None
+        self._limiter = (
+            AdaptiveConcurrencyLimiter(adaptive_concurrency)
+            if adaptive_concurrency is not None
+            else None
+        )
+
+    @property
+    def json_backend(self) -> JsonBackend:
+        """Encoder/decoder for non-model JSON bodies."""
+        return self._json
+
+    @property
+    def single_flight_stats(self) -> SingleFlightStats | None:
+        """Coalescing counters, or ``None`` when GET coalescing is off."""
+        return self._single_flight.stats if self._single_flight is not None else None
+
+    @property
+    def conditional_stats(self) -> ConditionalStats | None:
+        """Revalidation counters, or ``None`` when conditional GETs are off."""
+        return self._conditional.stats if self._conditional is not None else None
+
+    @property
+    def hedge_stats(self) -> HedgeStats | None:
+        """Hedging counters, or ``None`` when hedging is off."""
+        return self._hedger.stats if self._hedger is not None else None
+
+    @property
+    def concurrency_stats(self) -> ConcurrencyStats | None:
+        """Adaptive limiter state, or ``None`` when the limiter is off."""
+        return self._limiter.stats if self._limiter is not None else None
+
+    def _breaker_for(self, request: httpx.Request) -> CircuitBreaker | None:
+        if self._circuit_breakers is None:
+            return None
+        return self._circuit_breakers.for_host(request.url.host)
 
     async def send(
         self,
@@ -37,62 +108,268 @@ class AsyncTransport:
         *,
         params: QueryParamTypes | None = None,
         headers: HeaderTypes | None = None,
-        payload: dict[str, Any] | None = None,
+        payload: JsonPayload | None = None,
+        deadline_s: float | None = None,
+        **kwargs: Any,
+    ) -> HttpRequestResponse:
+        """Send a request, retrying per the retry settings.
+
+        ``deadline_s`` bounds the whole call — every attempt and backoff —
+        and defaults to the transport's configured deadline. Running out
+        raises ``PosApiDeadlineExceededError``. With GET coalescing enabled,
+        identical concurrent GETs share one request and one result; with
+        hedging enabled, a slow GET is raced against a second copy; with
+        conditional GETs enabled, a GET answered ``304`` returns the stored
+        body of the previous 200.
+        """
+        if method == "GET" and not kwargs:
+            if self._single_flight is not None:
+                return await self._send_coalesced(
+                    self._single_flight, url, params=params, headers=headers, deadline_s=deadline_s
+                )
+            return await self._send_get(url, params=params, headers=headers, deadline_s=deadline_s)
+        return await self._send(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            payload=payload,
+            deadline_s=deadline_s,
+            **kwargs,
+        )
+
+    async def _send_coalesced(
+        self,
+        single_flight: AsyncSingleFlight,
+        url: httpx.URL | str,
+        *,
+        params: QueryParamTypes | None,
+        headers: HeaderTypes | None,
+        deadline_s: float | None,
+    ) -> HttpRequestResponse:
+        """A GET that joins an identical one in flight. The deadline is not part
+        of the key, so a joiner waits only until its own deadline."""
+        budget_s = deadline_s if deadline_s is not None else self._deadline_s
+        try:
+            return await single_flight.do(
+                request_key("GET", url, params, headers),
+                lambda: self._send_get(url, params=params, headers=headers, deadline_s=deadline_s),
+                timeout=budget_s,
+            )
+        except JoinTimeoutError:
+            assert budget_s is not None  # an unbounded join never times out
+            request = self._client.build_request("GET", url, params=params, headers=headers)
+            raise build_deadline_error(request, budget_s) from None
+
+    async def _send_get(
+        self,
+        url: httpx.URL | str,
+        *,
+        params: QueryParamTypes | None,
+        headers: HeaderTypes | None,
+        deadline_s: float | None,
+    ) -> HttpRequestResponse:
+        """A plain GET, revalidated against the conditional cache if enabled."""
+        cache = self._conditional
+        if cache is None or not cache.applies(headers):
+            return await self._send(
+                "GET", url, params=params, headers=headers, deadline_s=deadline_s
+            )
+        key = request_key("GET", url, params, headers)
+        # One deadline for the conditional GET and any plain re-send.
+        deadline = Deadline.start(deadline_s if deadline_s is not None else self._deadline_s)
+        result = await self._send(
+            "GET",
+            url,
+            params=params,
+            headers=cache.headers_for(key, headers),
+            deadline=deadline,
+        )
+        resolved = cache.resolve(key, result)
+        if resolved is not None:
+            return resolved
+        # A 304 whose stored entry was evicted meanwhile: fetch the body.
+        result = await self._send("GET", url, params=params, headers=headers, deadline=deadline)
+        return cache.resolve(key, result) or result
+
+    async def _wait_for_rate_limit(
+        self, limiter: RateLimiter, request: httpx.Request, deadline: Deadline | None
+    ) -> None:
+        """Sleep until the request's rate-limit reservation comes up."""
+        if deadline is None:
+            wait_s = limiter.reserve(request.url.path)
+        else:
+            wait_s = limiter.reserve(request.url.path, deadline.remaining())
+            if wait_s is None:
+                raise build_deadline_error(request, deadline.budget_s)
+        if wait_s:
+            await asyncio.sleep(wait_s)
+            if deadline is not None:
+                deadline.clamp_request(request)
+
+    async def _send_attempt(
+        self, request: httpx.Request, deadline: Deadline | None
+    ) -> httpx.Response:
+        """Send one attempt, holding an adaptive-concurrency slot if enabled."""
+        if self._limiter is None:
+            return await self._client.send(request)
+        if deadline is None:
+            permit = await self._limiter.acquire()
+        else:
+            try:
+                permit = await asyncio.wait_for(self._limiter.acquire(), deadline.remaining())
+            except asyncio.TimeoutError:
+                raise build_deadline_error(request, deadline.budget_s) from None
+            # Time spent queued for the slot comes out of this attempt's timeout.
+            deadline.clamp_request(request)
+        outcome = Outcome.IGNORE
+        try:
+            response = await self._client.send(request)
+            outcome = (
+                Outcome.OVERLOAD
+                if response.status_code in self._retry.retryable_statuses
+                else Outcome.SUCCESS
+            )
+            return response
+        except (httpx.TimeoutException, httpx.NetworkError):
+            outcome = Outcome.OVERLOAD
+            raise
+        finally:
+            self._limiter.release(permit, outcome)
+
+    async def _send_hedged(
+        self, hedger: Hedger, request: httpx.Request, deadline: Deadline | None
+    ) -> httpx.Response:
+        """Send one GET attempt, raced against a delayed copy by the hedger.
+
+        Both copies share the call's ``deadline``; the copy is rate limited
+        and admitted by the circuit breaker like any attempt. Whichever
+        answers first is returned and the other is cancelled.
+        """
+        copies = 0
+
+        async def copy() -> httpx.Response:
+            nonlocal copies
+            copies += 1
+            if copies == 1:
+                return await self._send_attempt(request, deadline)
+            hedge = httpx.Request(
+                request.method,
+                request.url,
+                headers=request.headers,
+                extensions=dict(request.extensions),
+            )
+            if deadline is not None:
+                deadline.clamp_request(hedge)
+            if self._rate_limiter is not None:
+                await self._wait_for_rate_limit(self._rate_limiter, hedge, deadline)
+            breaker = self._breaker_for(hedge)
+            if breaker is not None and not breaker.allow():
+                raise build_circuit_open_error(hedge, breaker.snapshot().retry_in_s)
+            log_request(logger, hedge, hedge.extensions["request_id"])
+            return await self._send_attempt(hedge, deadline)
+
+        return await hedger.run(copy)
+
+    async def _send(
+        self,
+        method: HttpMethod,
+        url: httpx.URL | str,
+        *,
+        params: QueryParamTypes | None = None,
+        headers: HeaderTypes | None = None,
+        payload: JsonPayload | None = None,
+        deadline_s: float | None = None,
+        deadline: Deadline | None = None,
         **kwargs: Any,
     ) -> HttpRequestResponse:
         request_id = new_request_id()
         # Carried on the request so the error path (PosApiError) can read it
         # back and stay correlatable with the emitted log lines.
         extensions = {**kwargs.pop("extensions", {}), "request_id": request_id}
+        if deadline is None:
+            deadline = Deadline.start(deadline_s if deadline_s is not None else self._deadline_s)
+        retry_state = RetryState(
+            self._retry,
+            self._retry_budget,
+            logger=logger,
+            request_id=request_id,
+            method=method,
+            deadline=deadline,
+        )
+        content: bytes | None = None
+        if payload is not None:
+            content, headers = encode_json_body(payload, headers, self._json)
+        timeout = kwargs.pop("timeout", self._client.timeout)
         last_request: httpx.Request | None = None
         response: httpx.Response | None = None
         for attempt in range(self._retry.max_retries):
+            # Shrink each attempt's timeout to what is left of the budget.
+            attempt_timeout = (
+                deadline.clamp(httpx.Timeout(timeout)) if deadline is not None else timeout
+            )
             request = self._client.build_request(
                 method=method,
                 url=url,
                 params=params,
                 headers=headers,
-                json=payload,
+                content=content,
+                timeout=attempt_timeout,
                 extensions=extensions,
                 **kwargs,
             )
             last_request = request
+            if deadline is not None and deadline.expired:
+                raise build_deadline_error(request, deadline.budget_s, response=response)
+            if self._rate_limiter is not None:
+                await self._wait_for_rate_limit(self._rate_limiter, request, deadline)
+            breaker = self._breaker_for(request)
+            if breaker is not None and not breaker.allow():
+                raise build_circuit_open_error(request, breaker.snapshot().retry_in_s)
             log_request(logger, request, request_id)
             started = time.perf_counter()
             try:
-                response = await self._client.send(request)
+                if self._hedger is not None and method == "GET" and attempt == 0:
+                    # Only the first attempt is hedged: retries are not raced.
+                    response = await self._send_hedged(self._hedger, request, deadline)
+                else:
+                    response = await self._send_attempt(request, deadline)
             except (httpx.TimeoutException, httpx.NetworkError) as exc:
-                if attempt < self._retry.max_retries - 1:
-                    sleep_s = self._retry.sleep_seconds(attempt)
-                    log_retry(
-                        logger,
-                        request_id,
-                        attempt + 1,
-                        self._retry.max_retries,
-                        type(exc).__name__,
-                        sleep_s,
-                    )
-                    await asyncio.sleep(sleep_s)
-                    continue
-                raise build_transport_error(request, exc) from exc
+                if breaker is not None:
+                    breaker.record_failure()
+                sleep_s = retry_state.next_sleep(
+                    attempt,
+                    type(exc).__name__,
+                    breaker=breaker,
+                    sent=not isinstance(exc, NOT_SENT_ERRORS),
+                )
+                if sleep_s is None:
+                    if deadline is not None and (retry_state.deadline_exceeded or deadline.expired):
+                        raise build_deadline_error(request, deadline.budget_s, cause=exc) from exc
+                    raise build_transport_error(request, exc) from exc
+                await asyncio.sleep(sleep_s)
+                continue
             except httpx.HTTPError as exc:
+                if breaker is not None:
+                    breaker.record_failure()
                 raise build_transport_error(request, exc) from exc
 
             log_response(logger, response, request_id, (time.perf_counter() - started) * 1000)
 
             if response.status_code not in self._retry.retryable_statuses:
+                if breaker is not None:
+                    breaker.record_success()
                 return HttpRequestResponse(request=request, response=response)
-            if attempt < self._retry.max_retries - 1:
-                sleep_s = self._retry.sleep_seconds(attempt)
-                log_retry(
-                    logger,
-                    request_id,
-                    attempt + 1,
-                    self._retry.max_retries,
-                    str(response.status_code),
-                    sleep_s,
-                )
-                await asyncio.sleep(sleep_s)
+            if breaker is not None:
+                breaker.record_failure()
+            sleep_s = retry_state.next_sleep(
+                attempt, str(response.status_code), response, breaker=breaker
+            )
+            if sleep_s is None:
+                if deadline is not None and retry_state.deadline_exceeded:
+                    raise build_deadline_error(request, deadline.budget_s, response=response)
+                break
+            await asyncio.sleep(sleep_s)
 
         if response is None or last_request is None:
             raise PosApiTransportError("retry loop exited without sending a request")
@@ -0,0 +1,151 @@
+"""Per-host circuit breaker shared by a client's sync and async transports.
+
+Classic three-state breaker:
+
+* **closed** — requests flow; consecutive failures are counted.
+* **open** — after ``failure_threshold`` consecutive failures every request to
+  the host fails fast with ``PosApiCircuitOpenError`` for
+  ``recovery_timeout_s``.
+* **half-open** — once the timeout elapses exactly one probe request is let
+  through; its success closes the circuit, its failure re-opens it.
+
+State is guarded by a ``threading.Lock`` that is never held across I/O, so one
+registry serves both threads and the event loop.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from ..settings.circuit_breaker_settings import CircuitBreakerSettings
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitSnapshot:
+    """Point-in-time view of one host's breaker, for dashboards."""
+
+    host: str
+    state: CircuitState
+    consecutive_failures: int
+    # Seconds until an open circuit admits a probe; 0 when not open.
+    retry_in_s: float
+    times_opened: int
+
+
+class CircuitBreaker:
+    """Breaker for a single host. Obtain instances from ``CircuitBreakerRegistry``."""
+
+    def __init__(
+        self,
+        host: str,
+        settings: CircuitBreakerSettings,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._host = host
+        self._settings = settings
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: float | None = None
+        self._times_opened = 0
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._state is CircuitState.OPEN
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now. In half-open state the
+        caller that gets ``True`` owns the single probe."""
+        with self._lock:
+            now = self._clock()
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.OPEN:
+                if now - self._opened_at < self._settings.recovery_timeout_s:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._probe_started_at = now
+                return True
+            # HALF_OPEN: admit a replacement only if the probe went missing.
+            if (
+                self._probe_started_at is not None
+                and now - self._probe_started_at < self._settings.recovery_timeout_s
+            ):
+                return False
+            self._probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED
+                and self._failures >= self._settings.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._probe_started_at = None
+                self._times_opened += 1
+
+    def snapshot(self) -> CircuitSnapshot:
+        with self._lock:
+            retry_in = 0.0
+            if self._state is CircuitState.OPEN:
+                elapsed = self._clock() - self._opened_at
+                retry_in = max(0.0, self._settings.recovery_timeout_s - elapsed)
+            return CircuitSnapshot(
+                host=self._host,
+                state=self._state,
+                consecutive_failures=self._failures,
+                retry_in_s=retry_in,
+                times_opened=self._times_opened,
+            )
+
+
+class CircuitBreakerRegistry:
+    """Lazily creates one ``CircuitBreaker`` per host."""
+
+    def __init__(
+        self,
+        settings: CircuitBreakerSettings,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._settings = settings
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def for_host(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host, self._settings, clock=self._clock)
+                self._breakers[host] = breaker
+            return breaker
+
+    def snapshot(self) -> dict[str, CircuitSnapshot]:
+        """State of every host seen so far, keyed by host."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {snap.host: snap for snap in (b.snapshot() for b in breakers)}
@@ -0,0 +1,144 @@
+"""Adaptive (AIMD) concurrency limiting for the async transport.
+
+Fanning thousands of coroutines at the local PosAPI service with
+``asyncio.gather`` overwhelms it: latency climbs, requests time out, retries
+add more load. The limiter keeps only ``limit`` requests on the wire and
+lets the rest queue in the SDK, growing ``limit`` additively while the
+service keeps up and halving it when it shows distress — so callers can
+submit everything and the window settles near the sustainable throughput.
+
+A slot covers one HTTP attempt, not the whole call: retry backoffs are slept
+without holding one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from ..settings.concurrency_settings import AdaptiveConcurrencySettings
+
+
+class Outcome(str, Enum):
+    """How an attempt ended, as far as the limiter is concerned."""
+
+    SUCCESS = "success"
+    # Timeout, network error or retryable status: the service is struggling.
+    OVERLOAD = "overload"
+    # Says nothing about load (e.g. a malformed request); just frees the slot.
+    IGNORE = "ignore"
+
+
+@dataclass(frozen=True, slots=True)
+class ConcurrencyStats:
+    """Limiter state.
+
+    Attributes:
+        limit: Current window.
+        in_flight: Attempts holding a slot.
+        queued: Attempts waiting for one.
+        decreases: Times the window has been cut.
+    """
+
+    limit: int
+    in_flight: int
+    queued: int
+    decreases: int
+
+
+@dataclass(frozen=True, slots=True)
+class Permit:
+    started: float
+    # Limiter epoch at acquire time; a cut only counts once per epoch so a
+    # burst of failures from one overloaded window halves it once, not N times.
+    epoch: int
+    # In-flight count including this permit, to tell a saturated window
+    # (worth growing) from an idle one.
+    in_flight: int
+
+
+class AdaptiveConcurrencyLimiter:
+    """FIFO slot limiter whose window follows additive-increase /
+    multiplicative-decrease. Bound to the event loop it is used from."""
+
+    def __init__(
+        self,
+        settings: AdaptiveConcurrencySettings,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._settings = settings
+        self._clock = clock
+        self._limit = float(settings.initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: deque[float] = deque(maxlen=settings.window)
+        self._epoch = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        return ConcurrencyStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            queued=sum(1 for w in self._waiters if not w.done()),
+            decreases=self._decreases,
+        )
+
+    async def acquire(self) -> Permit:
+        """Wait for a slot. Cancellation while queued gives up the place in
+        line (or hands an already granted slot to the next waiter)."""
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()  # cancelled while queued
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._in_flight -= 1
+                    self._wake()
+                raise
+        return Permit(started=self._clock(), epoch=self._epoch, in_flight=self._in_flight)
+
+    def release(self, permit: Permit, outcome: Outcome) -> None:
+        """Free ``permit``'s slot and adapt the window to ``outcome``."""
+        self._in_flight -= 1
+        if outcome is Outcome.SUCCESS:
+            latency = self._clock() - permit.started
+            self._latencies.append(latency)
+            tolerance = self._settings.latency_tolerance
+            if tolerance is not None and latency > tolerance * min(self._latencies):
+                self._decrease(permit)
+            elif permit.in_flight * 2 >= self._limit:
+                # ~+1 per full window of successes, i.e. per round trip.
+                self._limit = min(self._settings.max_limit, self._limit + 1 / self._limit)
+        elif outcome is Outcome.OVERLOAD:
+            self._decrease(permit)
+        self._wake()
+
+    def _decrease(self, permit: Permit) -> None:
+        if permit.epoch != self._epoch:
+            return
+        self._epoch += 1
+        self._decreases += 1
+        self._limit = max(self._settings.min_limit, self._limit * self._settings.decrease_factor)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
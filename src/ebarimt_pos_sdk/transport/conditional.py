@@ -0,0 +1,179 @@
+"""Conditional GETs (``ETag`` / ``Last-Modified`` revalidation).
+
+A GET whose 200 carries a validator is remembered together with its
+response. The next identical GET sends ``If-None-Match`` /
+``If-Modified-Since``; on ``304 Not Modified`` the transport hands back the
+remembered body instead, so the table is not downloaded again. The model
+decoded from the 200 is kept with the entry and a 304 returns a shallow
+``model_copy()`` of it without validating again: reassigning a field of one
+result never changes what later callers get, but nested models and lists are
+shared and must be treated as read-only. If the entry is evicted while the
+conditional GET is in flight, the transport sends the GET again without
+validators.
+
+A call that sets its own ``If-None-Match`` / ``If-Modified-Since`` header is
+left alone. Responses marked ``Cache-Control: no-store`` are never kept.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from .http import HeaderTypes, HttpRequestResponse
+
+DEFAULT_MAX_ENTRIES = 256
+
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionalStats:
+    """Revalidation counters.
+
+    Attributes:
+        revalidated: GETs sent with a stored validator.
+        not_modified: Of those, the ones answered ``304`` and served from memory.
+        entries: Responses currently remembered.
+    """
+
+    revalidated: int = 0
+    not_modified: int = 0
+    entries: int = 0
+
+
+@dataclass(slots=True)
+class _Entry:
+    etag: str | None
+    last_modified: str | None
+    response: httpx.Response
+    # Models decoded from ``response``, by model class; never handed out.
+    models: dict[Any, Any] = field(default_factory=dict)
+
+
+class _StoredModels(dict[Any, Any]):
+    """``HttpRequestResponse.decoded`` of a result backed by an entry.
+
+    The first model decoded for a class is copied into the entry; each result
+    then hands its callers one shallow copy of it, so a 304 skips validation.
+    """
+
+    __slots__ = ("_stored",)
+
+    def __init__(self, stored: dict[Any, Any]) -> None:
+        super().__init__()
+        self._stored = stored
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        model = super().get(key)
+        if model is None:
+            stored = self._stored.get(key)
+            if stored is None:
+                return default
+            model = stored.model_copy()
+            super().__setitem__(key, model)
+        return model
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._stored.setdefault(key, value.model_copy())
+        super().__setitem__(key, value)
+
+
+class ConditionalCache:
+    """Validators and last 200 per GET, bounded LRU, shared by a client's
+    sync and async transports."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("ConditionalCache max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._revalidated = 0
+        self._not_modified = 0
+
+    @property
+    def stats(self) -> ConditionalStats:
+        with self._lock:
+            return ConditionalStats(
+                revalidated=self._revalidated,
+                not_modified=self._not_modified,
+                entries=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def applies(headers: HeaderTypes | None) -> bool:
+        """``False`` when the caller already manages its own validators."""
+        if not headers:
+            return True
+        merged = httpx.Headers(headers)
+        return not any(name in merged for name in _CONDITIONAL_HEADERS)
+
+    def headers_for(self, key: Hashable, headers: HeaderTypes | None) -> HeaderTypes | None:
+        """``headers`` plus the stored validators for ``key``, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return headers
+            self._revalidated += 1
+        merged = httpx.Headers(headers)
+        if entry.etag is not None:
+            merged["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            merged["If-Modified-Since"] = entry.last_modified
+        return merged
+
+    def resolve(self, key: Hashable, result: HttpRequestResponse) -> HttpRequestResponse | None:
+        """Swap a ``304`` for the remembered response; remember a new 200.
+
+        Returns ``None`` for a ``304`` whose entry is gone (evicted while the
+        request was in flight): the caller must send the GET again without
+        validators.
+        """
+        response = result.response
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return None
+                self._entries.move_to_end(key)
+                self._not_modified += 1
+                if "etag" in response.headers:
+                    entry.etag = response.headers["etag"]
+                stored = entry.response
+                models = entry.models
+            # The fresh request (and its request id) with the stored body and
+            # copies of the models already decoded from it.
+            return HttpRequestResponse(
+                request=result.request, response=stored, decoded=_StoredModels(models)
+            )
+
+        if response.status_code != 200:
+            # Errors say nothing about the stored representation; keep it.
+            return result
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        cacheable = (
+            etag is not None or last_modified is not None
+        ) and "no-store" not in response.headers.get("cache-control", "").lower()
+        with self._lock:
+            if not cacheable:
+                self._entries.pop(key, None)
+                return result
+            entry = _Entry(etag, last_modified, response)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return HttpRequestResponse(
+            request=result.request, response=response, decoded=_StoredModels(entry.models)
+        )
@@ -0,0 +1,54 @@
+"""Overall per-call deadline shared across retry attempts and backoffs."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import httpx
+
+
+class Deadline:
+    """A fixed point in (monotonic) time by which a call must finish.
+
+    Each attempt's httpx timeout is clamped to the remaining budget, so a
+    slow attempt cannot outlive the call, and a backoff that would end past
+    the deadline is not slept at all.
+    """
+
+    def __init__(self, budget_s: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.budget_s = budget_s
+        self._clock = clock
+        self._expires_at = clock() + budget_s
+
+    @classmethod
+    def start(cls, budget_s: float | None) -> Deadline | None:
+        return cls(budget_s) if budget_s is not None else None
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def clamp(self, timeout: httpx.Timeout) -> httpx.Timeout:
+        """Return ``timeout`` with every phase capped at the remaining budget.
+        Phases without a limit (``None``) get the remaining budget."""
+        remaining = self.remaining()
+
+        def cap(value: float | None) -> float:
+            return remaining if value is None else min(value, remaining)
+
+        return httpx.Timeout(
+            connect=cap(timeout.connect),
+            read=cap(timeout.read),
+            write=cap(timeout.write),
+            pool=cap(timeout.pool),
+        )
+
+    def clamp_request(self, request: httpx.Request) -> None:
+        """Re-clamp an already built request's timeout, after time spent
+        waiting (for a rate-limit token or a concurrency slot) before sending."""
+        timeout = httpx.Timeout(**request.extensions["timeout"])
+        request.extensions["timeout"] = self.clamp(timeout).as_dict()
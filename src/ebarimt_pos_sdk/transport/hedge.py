@@ -0,0 +1,123 @@
+"""Hedged GETs for the async transport.
+
+A GET whose first attempt has not answered within the hedge delay — a
+latency percentile of recent attempts — gets a second, identical request;
+the first to succeed wins and the other is cancelled. Only that attempt is
+hedged: both copies share the call's deadline, and retries are not raced. Hedges draw from a token bucket (the same shape
+as the retry budget), so under a slow upstream they stay a bounded fraction
+of traffic instead of doubling the load.
+
+Only idempotent reads may be hedged; the transport enforces GET-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from ..settings.hedge_settings import HedgeSettings
+from .retry import RetryBudget
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, slots=True)
+class HedgeStats:
+    """Hedging counters.
+
+    Attributes:
+        calls: GET attempts that went through the hedger.
+        hedged: Calls for which a second request was sent.
+        hedge_wins: Hedged calls that the second request answered first.
+        delay_s: Current hedge delay.
+    """
+
+    calls: int
+    hedged: int
+    hedge_wins: int
+    delay_s: float
+
+
+def _consume_result(task: asyncio.Future) -> None:
+    # A cancelled or failed loser is nobody's concern; retrieve its exception
+    # so asyncio does not log "exception was never retrieved".
+    if not task.cancelled():
+        task.exception()
+
+
+class Hedger:
+    """Runs a request factory with a single delayed hedge."""
+
+    def __init__(
+        self,
+        settings: HedgeSettings,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._settings = settings
+        self._clock = clock
+        self._latencies: deque[float] = deque(maxlen=settings.window)
+        self._budget = RetryBudget(ratio=settings.budget_ratio, burst=settings.budget_burst)
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    @property
+    def stats(self) -> HedgeStats:
+        return HedgeStats(
+            calls=self._calls,
+            hedged=self._hedged,
+            hedge_wins=self._hedge_wins,
+            delay_s=self.delay(),
+        )
+
+    def delay(self) -> float:
+        """Seconds to wait for the first request before hedging."""
+        settings = self._settings
+        if len(self._latencies) < settings.min_samples:
+            return max(settings.min_delay_s, settings.initial_delay_s)
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(settings.percentile * len(ordered)))
+        return max(settings.min_delay_s, ordered[index])
+
+    def record(self, latency_s: float) -> None:
+        self._latencies.append(latency_s)
+
+    async def run(self, fn: Callable[[], Awaitable[R]]) -> R:
+        """Await ``fn()``, racing a second ``fn()`` against it if the first is
+        slower than the hedge delay and the budget allows. Both failing
+        re-raises the primary's error."""
+        self._calls += 1
+        self._budget.deposit()
+        started = self._clock()
+        primary = asyncio.ensure_future(fn())
+        primary.add_done_callback(_consume_result)
+        hedge: asyncio.Future[R] | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.delay())
+            if done or not self._budget.try_withdraw():
+                result = await primary
+                self.record(self._clock() - started)
+                return result
+
+            self._hedged += 1
+            hedge = asyncio.ensure_future(fn())
+            hedge.add_done_callback(_consume_result)
+            pending: set[asyncio.Future[R]] = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        if task is hedge:
+                            self._hedge_wins += 1
+                        self.record(self._clock() - started)
+                        return task.result()
+            return await primary
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
@@ -1,28 +1,53 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
-from typing import Literal, TypeAlias
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal, TypeAlias
 
 import httpx
 
+from .._json import JsonBackend
 from .._redaction import redact_url
 from ..errors import (
+    PosApiCircuitOpenError,
+    PosApiDeadlineExceededError,
     PosApiTransportError,
 )
 
 HttpMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
+# A JSON body: a dict for the transport's JSON backend to encode, or bytes
+# already encoded by the caller (e.g. ``model_dump_json``).
+JsonPayload: TypeAlias = dict[str, Any] | bytes
 
 
 @dataclass(frozen=True)
 class HttpRequestResponse:
     request: httpx.Request
     response: httpx.Response
+    # Validated models keyed by model class. Coalesced callers receive the same
+    # instance, so the resource layer decodes it once and they all reuse it.
+    decoded: dict[Any, Any] = field(default_factory=dict, compare=False, repr=False)
 
     def as_tuple(self) -> tuple[httpx.Request, httpx.Response]:
         return (self.request, self.response)
 
 
+def encode_json_body(
+    payload: JsonPayload,
+    headers: HeaderTypes | None,
+    backend: JsonBackend,
+) -> tuple[bytes, httpx.Headers]:
+    """Encode ``payload`` once per call (attempts reuse the bytes) and add a
+    JSON ``Content-Type`` unless the caller set one."""
+    content = payload if isinstance(payload, bytes) else backend.dumps(payload)
+    merged = httpx.Headers(headers)
+    if "content-type" not in merged:
+        merged["Content-Type"] = "application/json"
+    return content, merged
+
+
 def build_transport_error(
     request: httpx.Request,
     exc: httpx.HTTPError,
@@ -34,6 +59,58 @@ def build_transport_error(
     )
 
 
+def build_circuit_open_error(request: httpx.Request, retry_in_s: float) -> PosApiCircuitOpenError:
+    """Build the fail-fast error raised while a host's circuit is open."""
+    host = request.url.host
+    return PosApiCircuitOpenError(
+        f"Circuit open for {host}; not sending {request.method} {redact_url(request.url)} "
+        f"(next probe in {retry_in_s:.1f}s)",
+        host=host,
+        retry_in_s=retry_in_s,
+        request=request,
+    )
+
+
+def build_deadline_error(
+    request: httpx.Request,
+    deadline_s: float,
+    *,
+    response: httpx.Response | None = None,
+    cause: Exception | None = None,
+) -> PosApiDeadlineExceededError:
+    """Build the error raised when a call's overall deadline runs out."""
+    if response is not None:
+        last = f"HTTP {response.status_code}"
+    elif cause is not None:
+        last = type(cause).__name__
+    else:
+        last = "no attempt completed"
+    return PosApiDeadlineExceededError(
+        f"Deadline of {deadline_s:g}s exceeded for {request.method} "
+        f"{redact_url(request.url)} (last outcome: {last})",
+        deadline_s=deadline_s,
+        request=request,
+        response=response,
+        cause=cause,
+    )
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Return the ``Retry-After`` delay in seconds, or ``None`` when the header
+    is absent or unparseable. Accepts both delta-seconds and HTTP-date forms."""
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
 PrimitiveData = str | int | float | bool | None
 
 QueryParamTypes: TypeAlias = (
@@ -0,0 +1,127 @@
+"""Client-side token-bucket rate limiting per endpoint path.
+
+Buckets hand out *reservations*: taking a token always succeeds and returns
+how long the caller must wait before its slot comes up, so the sync
+transport ``time.sleep``s and the async one ``asyncio.sleep``s exactly that
+long — no polling. Reservations are ordered, so waiting callers go out at
+the configured rate in the order they arrived.
+
+One limiter is shared by a client's sync and async transports. It is guarded
+by a ``threading.Lock`` that is never held across a sleep or an await.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from ..settings.rate_limit_settings import RateLimitSettings
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitStats:
+    """Per-bucket counters.
+
+    Attributes:
+        requests: Requests that took a token from this bucket.
+        throttled: Requests that had to wait for theirs.
+        waited_s: Total time those requests were told to wait.
+    """
+
+    requests: int
+    throttled: int
+    waited_s: float
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate_per_s`` up to ``burst`` tokens."""
+
+    def __init__(
+        self,
+        settings: RateLimitSettings,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = settings.rate_per_s
+        self._burst = float(settings.burst)
+        self._clock = clock
+        self._tokens = float(settings.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._throttled = 0
+        self._waited_s = 0.0
+
+    @property
+    def stats(self) -> RateLimitStats:
+        with self._lock:
+            return RateLimitStats(
+                requests=self._requests, throttled=self._throttled, waited_s=self._waited_s
+            )
+
+    def reserve(self, max_wait_s: float | None = None) -> float | None:
+        """Take a token and return the seconds to wait before using it.
+
+        The balance may go negative: that is the queue of callers already
+        waiting. When the wait would exceed ``max_wait_s`` nothing is taken
+        and ``None`` is returned.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            wait_s = max(0.0, (1 - self._tokens) / self._rate)
+            if max_wait_s is not None and wait_s > max_wait_s:
+                return None
+            self._tokens -= 1
+            self._requests += 1
+            if wait_s > 0:
+                self._throttled += 1
+                self._waited_s += wait_s
+            return wait_s
+
+
+class RateLimiter:
+    """Routes each request path to the bucket of its longest configured
+    prefix. Paths with no matching prefix are not limited."""
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimitSettings],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # Longest prefix first, so "/rest/receipt" wins over "/rest" and "/".
+        self._buckets = {
+            prefix: TokenBucket(settings, clock=clock)
+            for prefix, settings in sorted(limits.items(), key=lambda kv: -len(kv[0]))
+        }
+
+    @classmethod
+    def from_settings(cls, limits: Mapping[str, RateLimitSettings]) -> RateLimiter | None:
+        return cls(limits) if limits else None
+
+    def bucket_for(self, path: str) -> TokenBucket | None:
+        for prefix, bucket in self._buckets.items():
+            if _matches(path, prefix):
+                return bucket
+        return None
+
+    def reserve(self, path: str, max_wait_s: float | None = None) -> float | None:
+        """Wait (in seconds) before a request to ``path`` may go out; ``0``
+        for unlimited paths, ``None`` if longer than ``max_wait_s``."""
+        bucket = self.bucket_for(path)
+        if bucket is None:
+            return 0.0
+        return bucket.reserve(max_wait_s)
+
+    def stats(self) -> dict[str, RateLimitStats]:
+        """Counters per configured path prefix."""
+        return {prefix: bucket.stats for prefix, bucket in self._buckets.items()}
+
+
+def _matches(path: str, prefix: str) -> bool:
+    base = prefix.rstrip("/")
+    return path == prefix or path == base or path.startswith(base + "/")
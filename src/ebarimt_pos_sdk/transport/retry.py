@@ -0,0 +1,143 @@
+"""Retry decisions shared by the sync and async transports.
+
+The transports own the I/O (send, sleep); everything that decides *whether*
+and *how long* to back off lives here so the two loops cannot drift.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import httpx
+
+from .._logging import log_retry, log_retry_skipped
+from ..settings.retry_settings import RetrySettings
+from .circuit_breaker import CircuitBreaker
+from .deadline import Deadline
+from .http import parse_retry_after
+
+# Failures that happen before any byte of the request leaves the client, so
+# retrying them cannot duplicate a side effect whatever the method.
+NOT_SENT_ERRORS: tuple[type[httpx.HTTPError], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of total traffic.
+
+    Every logical call deposits ``ratio`` tokens (up to ``burst``) and every
+    retry withdraws one, so over time retries cannot exceed ``ratio`` × calls
+    plus the initial ``burst``. One instance is shared by a client's sync and
+    async transports; it is guarded by a ``threading.Lock`` and never awaits
+    while holding it, so it is safe from both threads and the event loop.
+    """
+
+    def __init__(self, *, ratio: float, burst: int) -> None:
+        self._ratio = ratio
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: RetrySettings) -> RetryBudget | None:
+        """Build a budget when ``settings.budget_ratio`` enables one."""
+        if settings.budget_ratio is None:
+            return None
+        return cls(ratio=settings.budget_ratio, burst=settings.budget_burst)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (one per retry)."""
+        with self._lock:
+            return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryState:
+    """Per-call retry bookkeeping: attempt limits, budget, backoff and logging."""
+
+    def __init__(
+        self,
+        settings: RetrySettings,
+        budget: RetryBudget | None,
+        *,
+        logger: logging.Logger,
+        request_id: str,
+        method: str = "GET",
+        deadline: Deadline | None = None,
+    ) -> None:
+        self._settings = settings
+        self._idempotent = method.upper() in settings.retry_methods
+        self._budget = budget
+        self._logger = logger
+        self._request_id = request_id
+        self._deadline = deadline
+        self._previous_sleep: float | None = None
+        # Set when the loop stopped because the deadline could not fit another
+        # attempt, so the transport raises a deadline error, not the last failure.
+        self.deadline_exceeded = False
+        if budget is not None:
+            budget.deposit()
+
+    def next_sleep(
+        self,
+        attempt: int,
+        reason: str,
+        response: httpx.Response | None = None,
+        *,
+        breaker: CircuitBreaker | None = None,
+        sent: bool = True,
+    ) -> float | None:
+        """Return how long to sleep before retrying, or ``None`` to stop.
+
+        ``attempt`` is the 0-based index of the attempt that just failed. A
+        ``breaker`` that the failure has just opened stops the loop at once —
+        sleeping only to be refused by the open circuit would waste the wait.
+        So does a backoff that would end at or past the call's deadline.
+        ``sent=False`` marks a failure that happened before the request left
+        the client; only those are retried for methods outside
+        ``retry_methods``.
+        """
+        max_retries = self._settings.max_retries
+        if attempt >= max_retries - 1:
+            return None
+        if sent and not self._idempotent:
+            log_retry_skipped(
+                self._logger, self._request_id, attempt + 1, reason, "method is not idempotent"
+            )
+            return None
+        if breaker is not None and breaker.is_open:
+            log_retry_skipped(self._logger, self._request_id, attempt + 1, reason, "circuit open")
+            return None
+        retry_after = parse_retry_after(response) if response is not None else None
+        sleep_s = self._settings.sleep_seconds(
+            attempt, previous=self._previous_sleep, retry_after=retry_after
+        )
+        if self._deadline is not None and sleep_s >= self._deadline.remaining():
+            self.deadline_exceeded = True
+            log_retry_skipped(
+                self._logger, self._request_id, attempt + 1, reason, "deadline would be exceeded"
+            )
+            return None
+        if self._budget is not None and not self._budget.try_withdraw():
+            log_retry_skipped(
+                self._logger, self._request_id, attempt + 1, reason, "retry budget exhausted"
+            )
+            return None
+        self._previous_sleep = sleep_s
+        log_retry(self._logger, self._request_id, attempt + 1, max_retries, reason, sleep_s)
+        return sleep_s
@@ -0,0 +1,167 @@
+"""Request coalescing ("single-flight") for identical in-flight GETs.
+
+While a GET for a given method/URL/query/headers is in flight, further
+identical calls wait for it instead of sending their own request, and all of
+them receive the same ``HttpRequestResponse``. Because the resource layer
+memoizes the validated model on that object, joiners also share one decoded
+result — which means they share one model *instance*; treat it as read-only.
+
+Only the in-flight window is shared. Nothing is cached once the leader
+finishes, so a call that starts afterwards always goes to the network.
+
+A joiner waits at most its own ``timeout`` (its deadline), which is not part
+of the key: when it runs out the joiner gets :class:`JoinTimeoutError` and
+the leader's request carries on for everyone else.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar, cast
+
+import httpx
+
+from .http import HeaderTypes, QueryParamTypes
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, slots=True)
+class SingleFlightStats:
+    """Coalescing counters.
+
+    Attributes:
+        leaders: Calls that actually went to the network.
+        shared: Calls that joined an identical in-flight call instead.
+    """
+
+    leaders: int = 0
+    shared: int = 0
+
+    def __add__(self, other: SingleFlightStats) -> SingleFlightStats:
+        return SingleFlightStats(
+            leaders=self.leaders + other.leaders, shared=self.shared + other.shared
+        )
+
+
+def request_key(
+    method: str,
+    url: httpx.URL | str,
+    params: QueryParamTypes | None,
+    headers: HeaderTypes | None,
+) -> Hashable:
+    """Identity of a request for coalescing purposes. Per-call headers are
+    part of the key so callers with different credentials never share."""
+    query = str(httpx.QueryParams(params)) if params is not None else ""
+    header_items = tuple(sorted(httpx.Headers(headers).multi_items())) if headers else ()
+    return (method, str(url), query, header_items)
+
+
+class JoinTimeoutError(TimeoutError):
+    """A joiner's ``timeout`` ran out before the shared call finished."""
+
+
+class _Call(Generic[R]):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: R | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-based single-flight for the sync transport."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._leaders = 0
+        self._shared = 0
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(leaders=self._leaders, shared=self._shared)
+
+    def do(self, key: Hashable, fn: Callable[[], R], *, timeout: float | None = None) -> R:
+        """Run ``fn`` or join an identical call already running; a joiner
+        waits at most ``timeout`` seconds."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._leaders += 1
+                leader = True
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise JoinTimeoutError(f"shared call still running after {timeout:g}s")
+            if call.error is not None:
+                raise call.error
+            # ``done`` is set after ``result``; ``R`` itself may include ``None``.
+            return cast(R, call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Task-based single-flight for the async transport.
+
+    The shared request runs in its own task and every caller (the first one
+    included) awaits it through ``asyncio.shield``, so cancelling one caller
+    never cancels the request the others are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self._leaders = 0
+        self._shared = 0
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(leaders=self._leaders, shared=self._shared)
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[R]], *, timeout: float | None = None
+    ) -> R:
+        """Run ``fn`` or join an identical call already running; a joiner
+        waits at most ``timeout`` seconds."""
+        task = self._calls.get(key)
+        if task is None:
+            self._leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+            return await asyncio.shield(task)
+        self._shared += 1
+        if timeout is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            raise JoinTimeoutError(f"shared call still running after {timeout:g}s") from None
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved: if every waiter was cancelled nobody
+        # else will, and asyncio would log "exception was never retrieved".
+        if not task.cancelled():
+            task.exception()
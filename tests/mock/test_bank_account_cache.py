@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import EbarimtRestClient, PosApiHttpError, RestClientSettings
+from ebarimt_pos_sdk.settings import CacheSettings, RetrySettings
+
+from ..data.bank_accounts import SUCCESS_RESPONSE
+from ..helpers import BASE_REST_URL, TIN
+
+URL = f"{BASE_REST_URL}/rest/bankAccounts"
+OTHER_TIN = "12345678901"
+DEFAULT_CACHE = CacheSettings(ttl_s=60)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(cache: CacheSettings | None = DEFAULT_CACHE) -> EbarimtRestClient:
+    return EbarimtRestClient(
+        RestClientSettings(
+            base_url=BASE_REST_URL,
+            bank_account_cache=cache,
+            retry=RetrySettings(retryable_statuses=frozenset()),
+        )
+    )
+
+
+def _by_tin(request: httpx.Request) -> httpx.Response:
+    tin = request.url.params["tin"]
+    if tin == "bad":
+        return httpx.Response(400, json={"message": "invalid tin"})
+    return httpx.Response(200, json=SUCCESS_RESPONSE if tin == TIN else [])
+
+
+@respx.mock
+def test_accounts_are_cached_per_tin_until_the_ttl() -> None:
+    route = respx.get(URL).mock(side_effect=_by_tin)
+    clock = FakeClock()
+    with _client() as client:
+        cache = client.bank_accounts.cache
+        assert cache is not None
+        cache._clock = clock
+
+        first = client.bank_accounts.read(TIN)
+        first.clear()  # callers get a copy
+        assert len(client.bank_accounts.read(TIN)) == len(SUCCESS_RESPONSE)
+        assert route.call_count == 1
+
+        clock.now = 61
+        client.bank_accounts.read(TIN)
+        assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_key_is_what_is_sent_and_custom_headers_bypass() -> None:
+    route = respx.get(URL).mock(side_effect=_by_tin)
+    async with _client() as client:
+        assert await client.bank_accounts.aread(TIN)
+        assert route.calls[-1].request.url.params["tin"] == TIN
+        client.bank_accounts.read(TIN)
+        assert route.call_count == 1
+
+        client.bank_accounts.read(TIN, headers={"X-Trace": "1"})
+        await client.bank_accounts.aread(OTHER_TIN, headers={"X-Trace": "1"})
+        assert route.call_count == 3
+        assert client.bank_accounts.cache.stats().size == 1  # type: ignore[union-attr]
+
+
+@respx.mock
+def test_invalidate_drops_one_tin_or_all() -> None:
+    route = respx.get(URL).mock(side_effect=_by_tin)
+    with _client() as client:
+        client.bank_accounts.read(TIN)
+        client.bank_accounts.read(OTHER_TIN)
+        client.bank_accounts.invalidate(TIN)
+        client.bank_accounts.read(TIN)
+        client.bank_accounts.read(OTHER_TIN)
+        assert route.call_count == 3
+
+        client.bank_accounts.invalidate()
+        client.bank_accounts.read(OTHER_TIN)
+        assert route.call_count == 4
+
+
+@respx.mock
+def test_no_accounts_and_4xx_use_the_negative_ttl() -> None:
+    route = respx.get(URL).mock(side_effect=_by_tin)
+    clock = FakeClock()
+    with _client(CacheSettings(ttl_s=600, negative_ttl_s=5)) as client:
+        client.bank_accounts.cache._clock = clock  # type: ignore[union-attr]
+        assert client.bank_accounts.read(OTHER_TIN) == []
+        with pytest.raises(PosApiHttpError):
+            client.bank_accounts.read("bad")
+        with pytest.raises(PosApiHttpError):
+            client.bank_accounts.read("bad")
+        assert route.call_count == 2
+
+        clock.now = 6
+        client.bank_accounts.read(OTHER_TIN)
+        assert route.call_count == 3
+        assert client.bank_accounts.cache.stats().negative_hits == 1  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_aread_many_fetches_each_tin_once() -> None:
+    route = respx.get(URL).mock(side_effect=_by_tin)
+    async with _client() as client:
+        results = await client.bank_accounts.aread_many([TIN, OTHER_TIN, TIN, "bad"])
+        assert [r.key for r in results] == [TIN, OTHER_TIN, TIN, "bad"]
+        assert results[0].unwrap()[0].tin == TIN
+        assert results[1].unwrap() == []
+        assert isinstance(results[3].error, PosApiHttpError)
+        assert route.call_count == 3
+
+        await client.bank_accounts.aread(OTHER_TIN)
+        assert route.call_count == 3
+
+
+@respx.mock
+def test_read_many_without_a_cache() -> None:
+    route = respx.get(URL).mock(side_effect=_by_tin)
+    with _client(cache=None) as client:
+        assert client.bank_accounts.cache is None
+        results = client.bank_accounts.read_many([TIN, OTHER_TIN], concurrency=2)
+        assert all(r.ok for r in results)
+        client.bank_accounts.invalidate(TIN)  # a no-op without a cache
+        client.bank_accounts.read(TIN)
+    assert route.call_count == 3
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient, PosApiHttpError
+from ebarimt_pos_sdk.catalogs import BunaCrawler, BunaSnapshot
+
+from ..helpers import BASE_API_URL
+
+PREFIX = f"{BASE_API_URL}/api/info/check/barcode/v2"
+
+# Two Салбар, one full branch down to barcodes and one that ends early.
+TREE: dict[tuple[str, ...], list[list[str]]] = {
+    (): [["0", "Хөдөө аж ахуй"], ["1", "Хүдэр"]],
+    ("0",): [["01", "Ургамал"], ["02", "Мал"]],
+    ("1",): [],
+    ("0", "01"): [["011", "Үр тариа"]],
+    ("0", "02"): [],
+    ("0", "01", "011"): [["0111", "Улаан буудай"]],
+    ("0", "01", "011", "0111"): [["01111", "Хатуу буудай"]],
+    ("0", "01", "011", "0111", "01111"): [["0111100", "Буудай"]],
+    ("0", "01", "011", "0111", "01111", "0111100"): [
+        ["800888883000", "Тест", "2022-07-17"],
+        ["8101888888000", "Тест1", "2022-07-17"],
+    ],
+}
+
+
+class FakeBuna:
+    def __init__(self, *, fail: set[tuple[str, ...]] = frozenset(), delay_s: float = 0.0) -> None:
+        self.fail = set(fail)
+        self.delay_s = delay_s
+        self.calls: list[tuple[str, ...]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _path(self, request: httpx.Request) -> tuple[str, ...]:
+        rest = str(request.url)[len(PREFIX) :].strip("/")
+        return tuple(rest.split("/")) if rest else ()
+
+    def _respond(self, path: tuple[str, ...]) -> httpx.Response:
+        self.calls.append(path)
+        if path in self.fail:
+            return httpx.Response(400, json={"message": "boom"})
+        return httpx.Response(200, json=TREE[path])
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(self._path(request))
+
+    async def async_side_effect(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_s)
+            return self._respond(self._path(request))
+        finally:
+            self.in_flight -= 1
+
+
+def _client() -> EbarimtApiClient:
+    return EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL))
+
+
+@respx.mock
+def test_sync_crawl_builds_full_tree() -> None:
+    fake = FakeBuna()
+    respx.get(url__startswith=PREFIX).mock(side_effect=fake)
+    with _client() as client:
+        snapshot = BunaCrawler(client.buna).crawl()
+
+    assert snapshot.complete
+    assert [n.code for n in snapshot.nodes] == [
+        "0", "01", "011", "0111", "01111", "0111100", "02", "1",
+    ]  # fmt: skip
+    leaf = snapshot.nodes[5]
+    assert leaf.level == "БҮНА код" and leaf.parent == "01111" and leaf.name == "Буудай"
+    assert snapshot.barcodes == ()
+    # Breadth-first: every level is finished before the next one starts.
+    assert [len(p) for p in fake.calls] == sorted(len(p) for p in fake.calls)
+    assert ("0", "01", "011", "0111", "01111", "0111100") not in fake.calls
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_crawl_is_bounded_and_includes_barcodes() -> None:
+    fake = FakeBuna(delay_s=0.01)
+    respx.get(url__startswith=PREFIX).mock(side_effect=fake.async_side_effect)
+    async with _client() as client:
+        crawler = BunaCrawler(client.buna, concurrency=2, include_barcodes=True)
+        snapshot = await crawler.acrawl()
+
+    assert snapshot.complete and len(snapshot.nodes) == 8
+    assert [b.barcode for b in snapshot.barcodes] == ["800888883000", "8101888888000"]
+    assert snapshot.barcodes[0].classification_code == "0111100"
+    assert snapshot.barcodes[0].registered_date == "2022-07-17"
+    assert fake.max_in_flight == 2
+    assert len(fake.calls) == len(TREE)
+
+
+@respx.mock
+def test_max_depth_stops_early() -> None:
+    fake = FakeBuna()
+    respx.get(url__startswith=PREFIX).mock(side_effect=fake)
+    with _client() as client:
+        snapshot = BunaCrawler(client.buna, max_depth=2).crawl()
+    assert [n.code for n in snapshot.nodes] == ["0", "01", "02", "1"]
+    assert fake.calls == [(), ("0",), ("1",)]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failed_crawl_checkpoints_and_resumes(tmp_path: Path) -> None:
+    checkpoint = tmp_path / "buna.json"
+    fake = FakeBuna(fail={("0", "01", "011")})
+    respx.get(url__startswith=PREFIX).mock(side_effect=fake.async_side_effect)
+    async with _client() as client:
+        crawler = BunaCrawler(client.buna, checkpoint_path=checkpoint, checkpoint_interval_s=1000)
+        with pytest.raises(PosApiHttpError):
+            await crawler.acrawl()
+
+        partial = BunaSnapshot.load(checkpoint)
+        assert not partial.complete
+        assert partial.pending == (("0", "01", "011"),)
+        assert len(partial.nodes) == 5
+
+        fake.fail.clear()
+        fake.calls.clear()
+        snapshot = await crawler.acrawl(resume_from=partial)
+
+    # Only the unexpanded part of the tree is fetched again.
+    assert fake.calls[0] == ("0", "01", "011")
+    assert () not in fake.calls
+    assert snapshot.complete and len(snapshot.nodes) == 8
+    assert BunaSnapshot.load(checkpoint) == snapshot
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_checkpoints_are_timed_and_written_off_the_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    respx.get(url__startswith=PREFIX).mock(side_effect=FakeBuna().async_side_effect)
+    writers: list[threading.Thread] = []
+    save = BunaSnapshot.save
+
+    def recording_save(self: BunaSnapshot, path: Path) -> None:
+        writers.append(threading.current_thread())
+        save(self, path)
+
+    monkeypatch.setattr(BunaSnapshot, "save", recording_save)
+    now, step = [0.0], [0.0]
+
+    def clock() -> float:
+        now[0] += step[0]
+        return now[0]
+
+    async with _client() as client:
+        crawler = BunaCrawler(
+            client.buna,
+            checkpoint_path=tmp_path / "buna.json",
+            checkpoint_interval_s=10,
+            clock=clock,
+        )
+        await crawler.acrawl()
+        assert len(writers) == 1  # the interval never passed: only the final snapshot
+
+        writers.clear()
+        step[0] = 20.0  # every expansion is now past the interval
+        await crawler.acrawl()
+    assert len(writers) > 1
+    assert threading.main_thread() not in writers
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    with respx.mock:
+        respx.get(url__startswith=PREFIX).mock(side_effect=FakeBuna())
+        with _client() as client:
+            snapshot = BunaCrawler(client.buna, include_barcodes=True).crawl()
+    path = tmp_path / "snapshot.json"
+    snapshot.save(path)
+    assert BunaSnapshot.load(path) == snapshot
+    assert "Хөдөө аж ахуй".encode() in path.read_bytes()
+
+
+def test_rejects_mismatched_resume_and_bad_arguments() -> None:
+    with _client() as client:
+        with pytest.raises(ValueError, match="concurrency"):
+            BunaCrawler(client.buna, concurrency=0)
+        with pytest.raises(ValueError, match="checkpoint_interval_s"):
+            BunaCrawler(client.buna, checkpoint_interval_s=-1)
+        with pytest.raises(ValueError, match="include_barcodes"):
+            BunaCrawler(client.buna, max_depth=3, include_barcodes=True)
+        partial = BunaSnapshot(nodes=(), pending=((),), max_depth=3)
+        with pytest.raises(ValueError, match="resume_from"):
+            BunaCrawler(client.buna).crawl(resume_from=partial)
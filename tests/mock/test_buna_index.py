@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ebarimt_pos_sdk import CreateReceiptRequest, Item, SubReceipt
+from ebarimt_pos_sdk.catalogs import BunaBarcode, BunaIndex, BunaNode, BunaSnapshot
+
+LEAF = ("0", "01", "011", "0111", "01111", "0111100")
+
+SNAPSHOT = BunaSnapshot(
+    nodes=(
+        BunaNode(("0",), "Хөдөө аж ахуй"),
+        *(
+            BunaNode(LEAF[:depth], name)
+            for depth, name in [
+                (2, "Ургамал"),
+                (3, "Үр тариа"),
+                (4, "Улаан буудай"),
+                (5, "Хатуу  БУУДАЙ"),
+                (6, "Буудай"),
+            ]
+        ),
+        BunaNode(("0", "01", "011", "0111", "01111", "0111101"), "Буудайн гурил"),
+        BunaNode(("0", "02"), "Мал"),
+        BunaNode(("1",), "Хүдэр"),
+    ),
+    barcodes=(BunaBarcode("0111100", "800888883000", "Тест", "2022-07-17"),),
+    include_barcodes=True,
+)
+
+
+@pytest.fixture
+def index() -> BunaIndex:
+    return BunaIndex(SNAPSHOT)
+
+
+def test_code_lookups(index: BunaIndex) -> None:
+    assert len(index) == 9
+    assert "0111100" in index and "9" not in index
+    assert [n.code for n in index.ancestry("0111100")] == list(LEAF)
+    assert index.ancestry("9") == ()
+    assert [n.code for n in index.children()] == ["0", "1"]
+    assert [n.code for n in index.children("01111")] == ["0111100", "0111101"]
+    assert index.children("0111100") == ()
+
+
+def test_prefix_queries(index: BunaIndex) -> None:
+    assert [n.code for n in index.with_prefix("0111")] == ["0111", "01111", "0111100", "0111101"]
+    assert index.with_prefix("05") == ()
+    assert len(index.with_prefix("")) == len(index)
+    assert index.nearest("0111199").code == "01111"  # type: ignore[union-attr]
+    assert index.nearest("9") is None
+
+
+def test_name_search(index: BunaIndex) -> None:
+    # Prefix of the name or of any word in it, case-insensitive.
+    assert {n.code for n in index.search("буудай")} == {"0111", "01111", "0111100", "0111101"}
+    assert [n.code for n in index.search("хатуу буу")] == ["01111"]
+    assert index.search("удай") == ()
+    assert {n.code for n in index.search("удай", substring=True)} == {
+        "0111", "01111", "0111100", "0111101",
+    }  # fmt: skip
+    assert len(index.search("буудай", limit=2)) == 2
+    assert index.search("  ") == ()
+
+
+def test_barcodes_and_classification_codes(index: BunaIndex) -> None:
+    assert index.barcode("800888883000").classification_code == "0111100"  # type: ignore[union-attr]
+    assert [b.barcode for b in index.barcodes("0111100")] == ["800888883000"]
+    assert index.is_classification_code("0111100")
+    assert not index.is_classification_code("01111")  # not a leaf level
+    assert not index.is_classification_code("0111199")
+
+
+def test_check_receipt(index: BunaIndex) -> None:
+    def item(code: str | None) -> Item:
+        return Item(
+            name="x",
+            measure_unit="ш",
+            qty=1,
+            unit_price=1,
+            total_amount=1,
+            classification_code=code,
+        )
+
+    request = CreateReceiptRequest(
+        branch_no="001",
+        total_amount=3,
+        merchant_tin="12345678901",
+        pos_no="001",
+        type="B2C_RECEIPT",
+        bill_id_suffix="01",
+        receipts=[
+            SubReceipt(
+                total_amount=3,
+                tax_type="VAT_ABLE",
+                merchant_tin="12345678901",
+                items=[item("0111100"), item(None), item("0111199")],
+            )
+        ],
+    )
+    [issue] = index.check_receipt(request)
+    assert (issue.receipt, issue.item, issue.code) == (0, 2, "0111199")
+    assert issue.nearest is not None and issue.nearest.code == "01111"
+
+
+def test_load_from_disk(tmp_path: Path) -> None:
+    path = tmp_path / "buna.json"
+    SNAPSHOT.save(path)
+    loaded = BunaIndex.load(path)
+    assert loaded.snapshot == SNAPSHOT
+    assert [n.code for n in loaded.ancestry("0111101")] == [*LEAF[:5], "0111101"]
+
+
+def test_snapshot_rejects_orphan_nodes() -> None:
+    data = SNAPSHOT.to_dict()
+    data["nodes"][0][0] = 3
+    with pytest.raises(ValueError, match="parent"):
+        BunaSnapshot.from_dict(data)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import EbarimtRestClient, PosApiCircuitOpenError, RestClientSettings
+from ebarimt_pos_sdk.errors import PosApiTransportError
+from ebarimt_pos_sdk.settings import CircuitBreakerSettings, RetrySettings
+from ebarimt_pos_sdk.transport import CircuitBreakerRegistry, CircuitState
+from ebarimt_pos_sdk.transport.async_transport import AsyncTransport
+from ebarimt_pos_sdk.transport.sync_transport import SyncTransport
+
+BASE = "https://example.com"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+
+    async def _fast_async_sleep(_s: float) -> None:
+        return None
+
+    monkeypatch.setattr(asyncio, "sleep", _fast_async_sleep)
+
+
+def _registry(clock: FakeClock, threshold: int = 2) -> CircuitBreakerRegistry:
+    settings = CircuitBreakerSettings(failure_threshold=threshold, recovery_timeout_s=10.0)
+    return CircuitBreakerRegistry(settings, clock=clock)
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_timeout() -> None:
+    clock = FakeClock()
+    breaker = _registry(clock).for_host("example.com")
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.snapshot().state is CircuitState.OPEN
+    assert not breaker.allow()
+
+    clock.now += 10.0
+    # Exactly one probe is admitted in half-open.
+    assert breaker.allow()
+    assert breaker.snapshot().state is CircuitState.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    snap = breaker.snapshot()
+    assert snap.state is CircuitState.CLOSED
+    assert snap.consecutive_failures == 0
+    assert snap.times_opened == 1
+
+
+def test_failed_probe_reopens_circuit() -> None:
+    clock = FakeClock()
+    breaker = _registry(clock, threshold=1).for_host("example.com")
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow()
+    breaker.record_failure()
+    snap = breaker.snapshot()
+    assert snap.state is CircuitState.OPEN
+    assert snap.retry_in_s == 10.0
+    assert snap.times_opened == 2
+
+
+def test_lost_probe_is_replaced_after_timeout() -> None:
+    clock = FakeClock()
+    breaker = _registry(clock, threshold=1).for_host("example.com")
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow()
+    clock.now += 10.0
+    assert breaker.allow()
+
+
+def test_success_resets_consecutive_failures() -> None:
+    breaker = _registry(FakeClock(), threshold=2).for_host("example.com")
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.snapshot().state is CircuitState.CLOSED
+
+
+def test_registry_keys_breakers_by_host() -> None:
+    registry = _registry(FakeClock(), threshold=1)
+    registry.for_host("a.example").record_failure()
+    snapshot = registry.snapshot()
+    assert snapshot["a.example"].state is CircuitState.OPEN
+    assert registry.for_host("b.example").allow()
+
+
+@respx.mock
+def test_sync_open_circuit_fails_fast_without_sending() -> None:
+    route = respx.get(f"{BASE}/x").mock(return_value=httpx.Response(503))
+    transport = SyncTransport(
+        httpx.Client(base_url=BASE),
+        retry=RetrySettings(max_retries=3),
+        circuit_breakers=_registry(FakeClock(), threshold=2),
+    )
+
+    # Two failures open the circuit mid-loop: the third attempt is skipped.
+    assert transport.send("GET", "/x").response.status_code == 503
+    assert route.call_count == 2
+
+    with pytest.raises(PosApiCircuitOpenError) as exc_info:
+        transport.send("GET", "/x")
+    assert isinstance(exc_info.value, PosApiTransportError)
+    assert exc_info.value.host == "example.com"
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_sync_network_errors_open_circuit() -> None:
+    route = respx.get(f"{BASE}/x").mock(side_effect=httpx.ConnectError("down"))
+    transport = SyncTransport(
+        httpx.Client(base_url=BASE),
+        retry=RetrySettings(max_retries=5),
+        circuit_breakers=_registry(FakeClock(), threshold=3),
+    )
+    with pytest.raises(PosApiTransportError):
+        transport.send("GET", "/x")
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_half_open_probe_closes_circuit() -> None:
+    clock = FakeClock()
+    route = respx.get(f"{BASE}/x").mock(
+        side_effect=[httpx.Response(502), httpx.Response(200, json={})]
+    )
+    registry = _registry(clock, threshold=1)
+    transport = AsyncTransport(
+        httpx.AsyncClient(base_url=BASE),
+        retry=RetrySettings(max_retries=1),
+        circuit_breakers=registry,
+    )
+    await transport.send("GET", "/x")
+    with pytest.raises(PosApiCircuitOpenError):
+        await transport.send("GET", "/x")
+
+    clock.now += 10.0
+    result = await transport.send("GET", "/x")
+    assert result.response.status_code == 200
+    assert registry.snapshot()["example.com"].state is CircuitState.CLOSED
+    assert route.call_count == 2
+
+
+def test_client_exposes_shared_registry() -> None:
+    settings = RestClientSettings(base_url=BASE, circuit_breaker=CircuitBreakerSettings())
+    with EbarimtRestClient(settings) as client:
+        assert client.circuit_breakers is not None
+        assert client._sync_transport._circuit_breakers is client.circuit_breakers
+        assert client._async_transport._circuit_breakers is client.circuit_breakers
+
+    with EbarimtRestClient(RestClientSettings(base_url=BASE)) as client:
+        assert client.circuit_breakers is None
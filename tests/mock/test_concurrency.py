@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import EbarimtRestClient, RestClientSettings
+from ebarimt_pos_sdk.settings import AdaptiveConcurrencySettings, RetrySettings
+from ebarimt_pos_sdk.transport.async_transport import AsyncTransport
+from ebarimt_pos_sdk.transport.concurrency import AdaptiveConcurrencyLimiter, Outcome
+
+BASE = "https://example.com"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(clock: FakeClock | None = None, **kwargs: object) -> AdaptiveConcurrencyLimiter:
+    settings = AdaptiveConcurrencySettings(**{"latency_tolerance": None, **kwargs})
+    return AdaptiveConcurrencyLimiter(settings, clock=clock or FakeClock())
+
+
+@pytest.mark.asyncio
+async def test_waiters_queue_in_order_beyond_the_limit() -> None:
+    limiter = _limiter(initial_limit=1)
+    first = await limiter.acquire()
+    order: list[int] = []
+
+    async def wait(n: int) -> None:
+        permit = await limiter.acquire()
+        order.append(n)
+        limiter.release(permit, Outcome.IGNORE)
+
+    waiters = [asyncio.create_task(wait(n)) for n in range(3)]
+    await asyncio.sleep(0)
+    assert limiter.stats.queued == 3
+
+    limiter.release(first, Outcome.IGNORE)
+    await asyncio.gather(*waiters)
+    assert order == [0, 1, 2]
+    assert limiter.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_overload_halves_once_per_window() -> None:
+    limiter = _limiter(initial_limit=8)
+    permits = [await limiter.acquire() for _ in range(4)]
+    for permit in permits:
+        limiter.release(permit, Outcome.OVERLOAD)
+    stats = limiter.stats
+    assert stats.limit == 4
+    assert stats.decreases == 1
+
+    limiter.release(await limiter.acquire(), Outcome.OVERLOAD)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_saturated_successes_grow_the_window_additively() -> None:
+    limiter = _limiter(initial_limit=4, max_limit=5)
+    for _ in range(3):
+        permits = [await limiter.acquire() for _ in range(limiter.limit)]
+        for permit in permits:
+            limiter.release(permit, Outcome.SUCCESS)
+    assert limiter.limit == 5
+
+    # An idle window (one call at a time) does not grow.
+    idle = _limiter(initial_limit=4)
+    for _ in range(20):
+        idle.release(await idle.acquire(), Outcome.SUCCESS)
+    assert idle.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_latency_spike_counts_as_overload() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock, initial_limit=4, latency_tolerance=2.0)
+    permit = await limiter.acquire()
+    clock.now += 0.010
+    limiter.release(permit, Outcome.SUCCESS)
+
+    permit = await limiter.acquire()
+    clock.now += 0.050
+    limiter.release(permit, Outcome.SUCCESS)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    limiter = _limiter(initial_limit=1)
+    held = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release(held, Outcome.IGNORE)
+
+    permit = await asyncio.wait_for(limiter.acquire(), 1.0)
+    limiter.release(permit, Outcome.IGNORE)
+    assert limiter.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_transport_caps_in_flight_requests() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def respond(_request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    respx.post(f"{BASE}/x").mock(side_effect=respond)
+    settings = AdaptiveConcurrencySettings(initial_limit=5, max_limit=5, latency_tolerance=None)
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), adaptive_concurrency=settings)
+
+    await asyncio.gather(*(transport.send("POST", "/x", payload={}) for _ in range(50)))
+    assert peak == 5
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_retryable_statuses_shrink_the_window() -> None:
+    respx.post(f"{BASE}/x").mock(return_value=httpx.Response(503))
+    settings = AdaptiveConcurrencySettings(initial_limit=16, latency_tolerance=None)
+    transport = AsyncTransport(
+        httpx.AsyncClient(base_url=BASE),
+        retry=RetrySettings(max_retries=1),
+        adaptive_concurrency=settings,
+    )
+    for _ in range(3):
+        await transport.send("POST", "/x", payload={})
+    assert transport.concurrency_stats is not None
+    assert transport.concurrency_stats.limit == 2
+
+
+def test_settings_validation_and_client_wiring() -> None:
+    with pytest.raises(ValueError, match="initial_limit"):
+        AdaptiveConcurrencySettings(initial_limit=500)
+    with pytest.raises(ValueError, match="decrease_factor"):
+        AdaptiveConcurrencySettings(decrease_factor=1.0)
+
+    settings = RestClientSettings(
+        base_url=BASE, adaptive_concurrency=AdaptiveConcurrencySettings(initial_limit=3)
+    )
+    with EbarimtRestClient(settings) as client:
+        assert client.concurrency_stats is not None
+        assert client.concurrency_stats.limit == 3
+    with EbarimtRestClient(RestClientSettings(base_url=BASE)) as client:
+        assert client.concurrency_stats is None
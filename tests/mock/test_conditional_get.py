@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient
+from ebarimt_pos_sdk.catalogs import DistrictCatalog
+from ebarimt_pos_sdk.resources import GetDistrictCodeResponse
+from ebarimt_pos_sdk.transport import ConditionalStats
+from ebarimt_pos_sdk.transport.conditional import ConditionalCache
+from ebarimt_pos_sdk.transport.sync_transport import SyncTransport
+
+from ..data.district_code import SUCCESS_RESPONSE as DISTRICTS
+from ..data.product_tax_code import SUCCESS_RESPONSE as TAX_CODES
+from ..helpers import BASE_API_URL
+
+DISTRICT_URL = f"{BASE_API_URL}/api/info/check/getBranchInfo"
+TAX_CODE_URL = f"{BASE_API_URL}/api/receipt/receipt/getProductTaxCode"
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 Oct 2025 00:00:00 GMT"
+
+
+def _client(**kwargs: object) -> EbarimtApiClient:
+    return EbarimtApiClient(
+        settings=ApiClientSettings(base_url=BASE_API_URL, conditional_gets=True, **kwargs)  # type: ignore[arg-type]
+    )
+
+
+def _revalidating(body: object, **validators: str):
+    """200 with ``validators`` first, then 304 whenever they are sent back."""
+    headers = {k.replace("_", "-"): v for k, v in validators.items()}
+    seen: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        sent = (request.headers.get("if-none-match"), request.headers.get("if-modified-since"))
+        if sent != (None, None) and sent in (
+            (headers.get("etag"), None),
+            (None, headers.get("last-modified")),
+        ):
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json=body, headers=headers)
+
+    return handler, seen
+
+
+@respx.mock
+def test_304_returns_a_copy_of_the_stored_model_without_validating(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    handler, seen = _revalidating(DISTRICTS, etag=ETAG)
+    respx.get(DISTRICT_URL).mock(side_effect=handler)
+    with _client() as client:
+        first = client.district_code.read()
+
+        def validate(*args: object, **kwargs: object) -> None:
+            raise AssertionError("a 304 must not validate the body again")
+
+        monkeypatch.setattr(GetDistrictCodeResponse, "model_validate_json", validate)
+        second = client.district_code.read()
+
+        assert second == first and second is not first
+        assert "if-none-match" not in seen[0]
+        assert seen[1]["if-none-match"] == ETAG
+        assert client.conditional_stats == ConditionalStats(
+            revalidated=1, not_modified=1, entries=1
+        )
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_last_modified_is_shared_between_sync_and_async() -> None:
+    handler, seen = _revalidating(TAX_CODES, last_modified=LAST_MODIFIED)
+    route = respx.get(TAX_CODE_URL).mock(side_effect=handler)
+    async with _client() as client:
+        first = client.product_tax_code.read()
+        assert await client.product_tax_code.aread() == first
+    assert route.call_count == 2
+    assert seen[1]["if-modified-since"] == LAST_MODIFIED
+
+
+@respx.mock
+def test_changed_representation_replaces_the_stored_one() -> None:
+    route = respx.get(DISTRICT_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=DISTRICTS, headers={"ETag": ETAG}),
+            httpx.Response(200, json=DISTRICTS, headers={"ETag": '"v2"'}),
+            httpx.Response(304),
+        ]
+    )
+    with _client() as client:
+        first = client.district_code.read()
+        second = client.district_code.read()
+        assert second is not first
+        assert client.district_code.read() == second
+    assert route.calls[2].request.headers["if-none-match"] == '"v2"'
+
+
+@respx.mock
+def test_reassigning_a_field_does_not_leak_into_later_results() -> None:
+    handler, _seen = _revalidating(DISTRICTS, etag=ETAG)
+    respx.get(DISTRICT_URL).mock(side_effect=handler)
+    with _client() as client:
+        first = client.district_code.read()
+        first.data = []
+        second = client.district_code.read()
+        second.msg = "changed"
+        assert client.district_code.read() == GetDistrictCodeResponse.model_validate(DISTRICTS)
+
+
+@respx.mock
+def test_304_after_eviction_is_sent_again_without_validators() -> None:
+    cache = ConditionalCache()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "if-none-match" in request.headers:
+            cache.clear()  # evicted while the conditional GET is in flight
+            return httpx.Response(304, headers={"ETag": ETAG})
+        return httpx.Response(200, json=DISTRICTS, headers={"ETag": ETAG})
+
+    route = respx.get(DISTRICT_URL).mock(side_effect=handler)
+    transport = SyncTransport(httpx.Client(base_url=BASE_API_URL), conditional=cache)
+    transport.send("GET", "/api/info/check/getBranchInfo")
+    result = transport.send("GET", "/api/info/check/getBranchInfo")
+
+    assert result.response.status_code == 200
+    assert result.response.json() == DISTRICTS
+    assert route.call_count == 3
+    assert "if-none-match" not in route.calls[2].request.headers
+    assert cache.stats.entries == 1
+
+
+@respx.mock
+def test_responses_without_validators_or_with_no_store_are_not_kept() -> None:
+    route = respx.get(DISTRICT_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=DISTRICTS),
+            httpx.Response(
+                200, json=DISTRICTS, headers={"ETag": ETAG, "Cache-Control": "no-store"}
+            ),
+            httpx.Response(200, json=DISTRICTS),
+        ]
+    )
+    with _client() as client:
+        for _ in range(3):
+            client.district_code.read()
+        assert client.conditional_stats == ConditionalStats()
+    assert all("if-none-match" not in call.request.headers for call in route.calls)
+
+
+@respx.mock
+def test_caller_supplied_validators_are_left_alone() -> None:
+    route = respx.get(DISTRICT_URL).mock(
+        return_value=httpx.Response(200, json=DISTRICTS, headers={"ETag": ETAG})
+    )
+    with _client() as client:
+        client.district_code.read()
+        client.district_code.read(headers={"If-None-Match": '"mine"'})
+    assert route.calls[1].request.headers["if-none-match"] == '"mine"'
+
+
+@respx.mock
+def test_off_by_default() -> None:
+    route = respx.get(DISTRICT_URL).mock(
+        return_value=httpx.Response(200, json=DISTRICTS, headers={"ETag": ETAG})
+    )
+    with EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL)) as client:
+        client.district_code.read()
+        client.district_code.read()
+        assert client.conditional_stats is None
+    assert "if-none-match" not in route.calls[1].request.headers
+
+
+@respx.mock
+def test_catalog_reload_is_served_by_a_304() -> None:
+    handler, _seen = _revalidating(DISTRICTS, etag=ETAG)
+    route = respx.get(DISTRICT_URL).mock(side_effect=handler)
+    with _client() as client:
+        catalog = DistrictCatalog(client.district_code)
+        first = catalog.get()
+        assert catalog.refresh() == first
+        assert client.conditional_stats.not_modified == 1  # type: ignore[union-attr]
+    assert route.call_count == 2
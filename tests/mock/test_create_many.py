@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import (
+    EbarimtRestClient,
+    PosApiHttpError,
+    PosApiValidationError,
+    RestClientSettings,
+)
+from ebarimt_pos_sdk.resources.batch import astream_many, stream_many
+from ebarimt_pos_sdk.settings import RetrySettings
+
+from ..data.receipt import SUCCESS_RESPONSE
+from ..helpers import BASE_REST_URL
+from .test_receipt import create_receipt_payload
+
+URL = f"{BASE_REST_URL}/rest/receipt"
+
+
+def _client() -> EbarimtRestClient:
+    return EbarimtRestClient(
+        RestClientSettings(
+            base_url=BASE_REST_URL, retry=RetrySettings(retryable_statuses=frozenset())
+        )
+    )
+
+
+def _payloads(n: int) -> list[dict]:
+    base = create_receipt_payload.model_dump(by_alias=True, exclude_none=True)
+    return [{**base, "billIdSuffix": f"{i:02d}"} for i in range(n)]
+
+
+class InFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.now = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+
+    def __exit__(self, *exc_info: object) -> None:
+        with self._lock:
+            self.now -= 1
+
+
+def _respond(suffix: str) -> httpx.Response:
+    if suffix == "bad":
+        return httpx.Response(400, json={"message": "duplicate bill id"})
+    return httpx.Response(200, json={**SUCCESS_RESPONSE, "id": suffix})
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_acreate_many_yields_in_input_order_within_the_limit() -> None:
+    in_flight = InFlight()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        suffix = json.loads(request.content)["billIdSuffix"]
+        with in_flight:
+            await asyncio.sleep(0.001 * (10 - int(suffix)))  # later items finish first
+        return _respond(suffix)
+
+    respx.post(URL).mock(side_effect=handler)
+    async with _client() as client:
+        results = [r async for r in client.receipt.acreate_many(_payloads(10), concurrency=3)]
+
+    assert [r.index for r in results] == list(range(10))
+    assert [r.unwrap().id for r in results] == [f"{i:02d}" for i in range(10)]
+    assert in_flight.peak == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_acreate_many_as_completed_from_an_async_iterable() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        suffix = json.loads(request.content)["billIdSuffix"]
+        await asyncio.sleep(0.05 if suffix == "00" else 0)
+        return _respond(suffix)
+
+    async def payloads() -> AsyncIterator[dict]:
+        for payload in _payloads(3):
+            yield payload
+
+    respx.post(URL).mock(side_effect=handler)
+    async with _client() as client:
+        results = [
+            r async for r in client.receipt.acreate_many(payloads(), concurrency=3, ordered=False)
+        ]
+
+    assert [r.index for r in results][-1] == 0
+    assert sorted(r.index for r in results) == [0, 1, 2]
+    assert all(r.item["billIdSuffix"] == f"{r.index:02d}" for r in results)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failures_are_reported_per_receipt() -> None:
+    respx.post(URL).mock(
+        side_effect=lambda request: _respond(json.loads(request.content)["billIdSuffix"])
+    )
+    payloads = _payloads(3)
+    payloads[1] = {**payloads[1], "billIdSuffix": "bad"}
+    payloads.insert(2, {"totalAmount": "not a receipt"})
+
+    async with _client() as client:
+        results = [r async for r in client.receipt.acreate_many(payloads)]
+
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert isinstance(results[1].error, PosApiHttpError)
+    assert isinstance(results[2].error, PosApiValidationError)
+    with pytest.raises(PosApiHttpError):
+        results[1].unwrap()
+
+
+@respx.mock
+def test_create_many_runs_on_threads_in_input_order() -> None:
+    in_flight = InFlight()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        suffix = json.loads(request.content)["billIdSuffix"]
+        with in_flight:
+            time.sleep(0.002 * (8 - int(suffix)))
+        return _respond(suffix)
+
+    route = respx.post(URL).mock(side_effect=handler)
+    with _client() as client:
+        results = list(client.receipt.create_many(_payloads(8), concurrency=4))
+
+    assert [r.value.id for r in results] == [f"{i:02d}" for i in range(8)]  # type: ignore[union-attr]
+    assert route.call_count == 8
+    assert 1 < in_flight.peak <= 4
+
+
+@respx.mock
+def test_stopping_early_stops_reading_the_input() -> None:
+    route = respx.post(URL).mock(
+        side_effect=lambda request: _respond(json.loads(request.content)["billIdSuffix"])
+    )
+    consumed = 0
+
+    def payloads() -> Iterator[dict]:
+        nonlocal consumed
+        for payload in _payloads(100):
+            consumed += 1
+            yield payload
+
+    with _client() as client:
+        stream = client.receipt.create_many(payloads(), concurrency=2)
+        assert consumed == 0  # lazy until iterated
+        first = next(stream)
+        stream.close()
+
+    assert first.index == 0
+    assert consumed <= 3
+    assert route.call_count == consumed
+
+
+def test_unexpected_errors_do_not_stop_the_stream() -> None:
+    def call(item: int) -> int:
+        if item == 1:
+            raise TypeError("odd body")
+        return item * 10
+
+    results = list(stream_many(range(3), call, concurrency=2))
+    assert [r.value for r in results] == [0, None, 20]
+    assert isinstance(results[1].error, TypeError)
+
+
+@pytest.mark.asyncio
+async def test_async_unexpected_errors_do_not_stop_the_stream() -> None:
+    async def call(item: int) -> int:
+        if item == 1:
+            raise ValueError("odd body")
+        return item * 10
+
+    results = [r async for r in astream_many(range(3), call, concurrency=2)]
+    assert [r.value for r in results] == [0, None, 20]
+    assert isinstance(results[1].error, ValueError)
+
+
+def test_rejects_non_positive_concurrency() -> None:
+    with _client() as client, pytest.raises(ValueError, match="concurrency"):
+        next(client.receipt.create_many(_payloads(1), concurrency=0))
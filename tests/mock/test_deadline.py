@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import (
+    EbarimtRestClient,
+    PosApiDeadlineExceededError,
+    PosApiTransportError,
+    RestClientSettings,
+)
+from ebarimt_pos_sdk.settings import RetrySettings
+from ebarimt_pos_sdk.settings.base_settings import BaseSettings
+from ebarimt_pos_sdk.transport.async_transport import AsyncTransport
+from ebarimt_pos_sdk.transport.deadline import Deadline
+from ebarimt_pos_sdk.transport.sync_transport import SyncTransport
+
+from ..data.bank_accounts import SUCCESS_RESPONSE
+from ..helpers import BASE_REST_URL, TIN
+
+BASE = "https://example.com"
+
+
+def test_deadline_clamps_every_timeout_phase() -> None:
+    deadline = Deadline(2.0)
+    clamped = deadline.clamp(httpx.Timeout(10.0, connect=1.0, pool=None))
+    assert clamped.connect == 1.0
+    assert 0 < clamped.read <= 2.0
+    assert 0 < clamped.write <= 2.0
+    assert 0 < clamped.pool <= 2.0
+
+
+@respx.mock
+def test_sync_attempt_timeout_is_shrunk_to_deadline() -> None:
+    seen: list[dict[str, float]] = []
+
+    def capture(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    respx.get(f"{BASE}/x").mock(side_effect=capture)
+    transport = SyncTransport(httpx.Client(base_url=BASE, timeout=10.0), deadline_s=3.0)
+    transport.send("GET", "/x")
+    assert 0 < seen[0]["read"] <= 3.0
+
+    # A per-call deadline overrides the transport default.
+    transport.send("GET", "/x", deadline_s=0.5)
+    assert 0 < seen[1]["read"] <= 0.5
+
+
+@respx.mock
+def test_sync_backoff_that_would_overrun_is_skipped(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", lambda s: sleeps.append(s))
+    route = respx.get(f"{BASE}/x").mock(return_value=httpx.Response(503))
+    transport = SyncTransport(
+        httpx.Client(base_url=BASE),
+        retry=RetrySettings(max_retries=3, backoff_base_seconds=5.0),
+    )
+
+    with pytest.raises(PosApiDeadlineExceededError) as exc_info:
+        transport.send("GET", "/x", deadline_s=1.0)
+
+    assert sleeps == []
+    assert route.call_count == 1
+    err = exc_info.value
+    assert isinstance(err, PosApiTransportError)
+    assert err.deadline_s == 1.0
+    assert err.response is not None and err.response.status_code == 503
+    assert "Deadline of 1s exceeded" in err.message
+
+
+@respx.mock
+def test_sync_timeout_after_deadline_raises_deadline_error() -> None:
+    def slow(_request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        raise httpx.ReadTimeout("slow")
+
+    respx.get(f"{BASE}/x").mock(side_effect=slow)
+    transport = SyncTransport(httpx.Client(base_url=BASE), retry=RetrySettings(max_retries=3))
+    with pytest.raises(PosApiDeadlineExceededError) as exc_info:
+        transport.send("GET", "/x", deadline_s=0.03)
+    assert "ReadTimeout" in exc_info.value.message
+
+
+@respx.mock
+def test_sync_without_deadline_keeps_plain_transport_error() -> None:
+    respx.get(f"{BASE}/x").mock(side_effect=httpx.ConnectError("down"))
+    transport = SyncTransport(httpx.Client(base_url=BASE), retry=RetrySettings(max_retries=1))
+    with pytest.raises(PosApiTransportError) as exc_info:
+        transport.send("GET", "/x")
+    assert not isinstance(exc_info.value, PosApiDeadlineExceededError)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_backoff_that_would_overrun_is_skipped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(s: float) -> None:
+        sleeps.append(s)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    route = respx.get(f"{BASE}/x").mock(side_effect=httpx.ConnectError("down"))
+    transport = AsyncTransport(
+        httpx.AsyncClient(base_url=BASE),
+        retry=RetrySettings(max_retries=3, backoff_base_seconds=2.0),
+        deadline_s=1.0,
+    )
+    with pytest.raises(PosApiDeadlineExceededError):
+        await transport.send("GET", "/x")
+    assert sleeps == []
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_settings_deadline_and_per_call_override_reach_transport() -> None:
+    seen: list[dict[str, float]] = []
+
+    def capture(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json=SUCCESS_RESPONSE)
+
+    respx.get(f"{BASE_REST_URL}/rest/bankAccounts").mock(side_effect=capture)
+    settings = RestClientSettings(base_url=BASE_REST_URL, deadline_s=4.0)
+    with EbarimtRestClient(settings) as client:
+        client.bank_accounts.read(TIN)
+        client.bank_accounts.read(TIN, deadline_s=0.25)
+
+    assert 0 < seen[0]["read"] <= 4.0
+    assert seen[0]["read"] > 0.25
+    assert 0 < seen[1]["read"] <= 0.25
+
+
+def test_settings_rejects_non_positive_deadline() -> None:
+    with pytest.raises(ValueError, match="deadline_s"):
+        RestClientSettings(base_url=BASE_REST_URL, deadline_s=0)
+
+
+def test_base_settings_positional_fields_keep_their_meaning() -> None:
+    retry = RetrySettings(max_retries=1)
+    settings = BaseSettings(BASE_REST_URL, 5.0, False, retry)
+    assert settings.retry is retry
+    assert settings.deadline_s is None
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient, PosApiHttpError
+from ebarimt_pos_sdk.catalogs import DistrictCatalog
+
+from ..data.district_code import SUCCESS_RESPONSE
+from ..helpers import BASE_API_URL
+
+URL = f"{BASE_API_URL}/api/info/check/getBranchInfo"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client() -> EbarimtApiClient:
+    return EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL))
+
+
+@respx.mock
+def test_index_lookups() -> None:
+    respx.get(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    with _client() as client:
+        index = DistrictCatalog(client.district_code).get()
+
+    assert len(index) == len(SUCCESS_RESPONSE["data"])
+    row = index.lookup("0102")
+    assert row is not None and row.sub_branch_name == "Чулуут"
+    assert "0102" in index and "9999" not in index
+    assert index.lookup("9999") is None
+
+    arkhangai = index.branch("01")
+    assert arkhangai and all(r.branch_code == "01" for r in arkhangai)
+    assert index.branch_named("  архангай ") == arkhangai
+
+    # Sum names repeat across aimags.
+    bulgan = index.named("Булган")
+    assert len(bulgan) > 1
+    assert {r.branch_code for r in bulgan} > {"01"}
+    assert index.named("no such place") == ()
+
+
+@respx.mock
+def test_network_is_hit_only_on_expiry() -> None:
+    route = respx.get(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    clock = FakeClock()
+    with _client() as client:
+        catalog = DistrictCatalog(client.district_code, ttl_s=60, clock=clock)
+        first = catalog.get()
+        assert catalog.lookup("0102") is not None
+        assert catalog.get() is first
+        assert route.call_count == 1
+        assert catalog.expires_in_s == 60
+
+        clock.now += 60
+        assert catalog.get() is not first
+        assert route.call_count == 2
+
+        catalog.refresh()
+        assert route.call_count == 3
+
+
+@respx.mock
+def test_failed_reload_keeps_previous_index() -> None:
+    route = respx.get(URL).mock(
+        side_effect=[httpx.Response(200, json=SUCCESS_RESPONSE), httpx.Response(400, json={})]
+    )
+    clock = FakeClock()
+    with _client() as client:
+        catalog = DistrictCatalog(client.district_code, ttl_s=60, clock=clock)
+        first = catalog.get()
+        clock.now += 61
+        with pytest.raises(PosApiHttpError):
+            catalog.get()
+        assert catalog._index is first
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_async_misses_fetch_once() -> None:
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=SUCCESS_RESPONSE)
+
+    route = respx.get(URL).mock(side_effect=slow)
+    async with _client() as client:
+        catalog = DistrictCatalog(client.district_code)
+        results = await asyncio.gather(*(catalog.alookup("0102") for _ in range(10)))
+        assert all(r is results[0] for r in results)
+        assert route.call_count == 1
+
+        await catalog.arefresh()
+        assert route.call_count == 2
+
+
+@respx.mock
+def test_async_reads_work_from_more_than_one_event_loop() -> None:
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=SUCCESS_RESPONSE)
+
+    route = respx.get(URL).mock(side_effect=slow)
+    clock = FakeClock()
+    with _client() as client:
+        catalog = DistrictCatalog(client.district_code, clock=clock)
+
+        async def contended() -> None:
+            # Two callers on an expired catalog: the second waits on the lock.
+            await asyncio.gather(catalog.aget(), catalog.aget())
+
+        asyncio.run(contended())
+        clock.now += 10 * 24 * 3600
+        asyncio.run(contended())
+    assert route.call_count == 2
+
+
+def test_rejects_non_positive_ttl() -> None:
+    with _client() as client, pytest.raises(ValueError, match="ttl_s"):
+        DistrictCatalog(client.district_code, ttl_s=0)
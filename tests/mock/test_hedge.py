@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient, PosApiDeadlineExceededError
+from ebarimt_pos_sdk.settings import HedgeSettings, RetrySettings
+from ebarimt_pos_sdk.transport.async_transport import AsyncTransport
+from ebarimt_pos_sdk.transport.hedge import Hedger
+
+from ..data.merchant_info import SUCCESS_RESPONSE
+from ..helpers import BASE_API_URL
+
+BASE = "https://example.com"
+INFO_URL = f"{BASE_API_URL}/api/info/check/getInfo"
+FAST_HEDGE = HedgeSettings(initial_delay_s=0.02, min_delay_s=0.0)
+
+
+class SlowThenFast:
+    """First request hangs for ``slow_s``; later ones answer at once. Counts
+    calls itself — respx does not record a request whose response was
+    cancelled."""
+
+    def __init__(self, slow_s: float) -> None:
+        self.slow_s = slow_s
+        self.calls = 0
+
+    async def __call__(self, _request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.calls == 1:
+            await asyncio.sleep(self.slow_s)
+        return httpx.Response(200, json=SUCCESS_RESPONSE)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_slow_lookup_is_hedged_and_hedge_wins() -> None:
+    responder = SlowThenFast(5.0)
+    respx.get(INFO_URL).mock(side_effect=responder)
+    settings = ApiClientSettings(base_url=BASE_API_URL, hedge=FAST_HEDGE)
+    async with EbarimtApiClient(settings=settings) as client:
+        resp = await asyncio.wait_for(client.merchant_info.aread("01234567891"), 1.0)
+        assert resp.data.name == "Test"
+        assert responder.calls == 2
+        stats = client.hedge_stats
+        assert stats is not None
+        assert (stats.calls, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fast_lookup_is_not_hedged() -> None:
+    route = respx.get(INFO_URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    settings = ApiClientSettings(base_url=BASE_API_URL, hedge=FAST_HEDGE)
+    async with EbarimtApiClient(settings=settings) as client:
+        await client.merchant_info.aread("01234567891")
+        assert route.call_count == 1
+        assert client.hedge_stats is not None and client.hedge_stats.hedged == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_exhausted_hedge_budget_waits_for_primary() -> None:
+    calls = 0
+
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    respx.get(f"{BASE}/x").mock(side_effect=slow)
+    hedge = HedgeSettings(initial_delay_s=0.01, min_delay_s=0.0, budget_burst=1)
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), hedge=hedge)
+
+    await transport.send("GET", "/x")
+    await transport.send("GET", "/x")
+
+    assert transport.hedge_stats is not None
+    assert transport.hedge_stats.hedged == 1
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_post_is_never_hedged() -> None:
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    route = respx.post(f"{BASE}/x").mock(side_effect=slow)
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), hedge=FAST_HEDGE)
+    await transport.send("POST", "/x", payload={})
+    assert route.call_count == 1
+    assert transport.hedge_stats is not None and transport.hedge_stats.calls == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_hedge_shares_the_call_deadline() -> None:
+    read_timeouts: list[float] = []
+
+    async def hang(request: httpx.Request) -> httpx.Response:
+        # respx does not enforce timeouts: honour the attempt's read timeout.
+        read_timeouts.append(request.extensions["timeout"]["read"])
+        await asyncio.sleep(read_timeouts[-1])
+        raise httpx.ReadTimeout("slow", request=request)
+
+    respx.get(f"{BASE}/x").mock(side_effect=hang)
+    hedge = HedgeSettings(initial_delay_s=0.15, min_delay_s=0.0)
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), hedge=hedge)
+
+    started = time.perf_counter()
+    with pytest.raises(PosApiDeadlineExceededError):
+        await transport.send("GET", "/x", deadline_s=0.25)
+    assert time.perf_counter() - started < 0.4
+    assert len(read_timeouts) == 2 and read_timeouts[1] < 0.15
+    assert transport.hedge_stats is not None and transport.hedge_stats.hedged == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_only_the_first_attempt_is_hedged() -> None:
+    calls = 0
+
+    async def unavailable(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.03)
+        return httpx.Response(503)
+
+    respx.get(f"{BASE}/x").mock(side_effect=unavailable)
+    transport = AsyncTransport(
+        httpx.AsyncClient(base_url=BASE),
+        retry=RetrySettings(max_retries=3, backoff_base_seconds=0),
+        hedge=FAST_HEDGE,
+    )
+    result = await transport.send("GET", "/x")
+
+    assert result.response.status_code == 503
+    assert calls == 4  # one hedged attempt (two requests) and two plain retries
+    assert transport.hedge_stats is not None
+    assert (transport.hedge_stats.calls, transport.hedge_stats.hedged) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_primary_error_is_raised_when_both_copies_fail() -> None:
+    hedger = Hedger(FAST_HEDGE)
+    attempts = 0
+
+    async def failing() -> None:
+        nonlocal attempts
+        attempts += 1
+        label = f"attempt {attempts}"
+        await asyncio.sleep(0.05)
+        raise RuntimeError(label)
+
+    with pytest.raises(RuntimeError, match="attempt 1"):
+        await hedger.run(failing)
+    assert attempts == 2
+
+
+def test_delay_tracks_latency_percentile() -> None:
+    hedger = Hedger(HedgeSettings(percentile=0.9, min_samples=10, min_delay_s=0.0))
+    assert hedger.delay() == 0.5
+    for ms in range(1, 11):
+        hedger.record(ms / 1000)
+    assert hedger.delay() == pytest.approx(0.010)
+
+
+def test_hedging_is_off_by_default_and_validates() -> None:
+    with EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL)) as client:
+        assert client.hedge_stats is None
+    with pytest.raises(ValueError, match="percentile"):
+        HedgeSettings(percentile=1.5)
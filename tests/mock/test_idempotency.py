@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import (
+    CreateReceiptRequest,
+    CreateReceiptResponse,
+    EbarimtRestClient,
+    PosApiAmbiguousReceiptError,
+    PosApiHttpError,
+    PosApiTransportError,
+    RestClientSettings,
+)
+from ebarimt_pos_sdk.resources import LedgerStats, receipt_key
+from ebarimt_pos_sdk.resources.idempotency import is_ambiguous
+from ebarimt_pos_sdk.settings import IdempotencySettings, RetrySettings
+
+from ..data.receipt import SUCCESS_RESPONSE
+from ..helpers import BASE_REST_URL
+from .test_receipt import create_receipt_payload
+
+URL = f"{BASE_REST_URL}/rest/receipt"
+KEY = receipt_key(create_receipt_payload)
+ISSUED = CreateReceiptResponse.model_validate(SUCCESS_RESPONSE)
+
+
+def _client(settings: IdempotencySettings | None = None) -> EbarimtRestClient:
+    return EbarimtRestClient(
+        RestClientSettings(
+            base_url=BASE_REST_URL,
+            retry=RetrySettings(backoff_base_seconds=0),
+            receipt_idempotency=settings or IdempotencySettings(),
+        )
+    )
+
+
+@respx.mock
+def test_repeated_create_returns_the_recorded_receipt() -> None:
+    route = respx.post(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    with _client() as client:
+        first = client.receipt.create(create_receipt_payload)
+        payload = create_receipt_payload.model_dump(by_alias=True, exclude_none=True)
+        assert client.receipt.create(payload) is first
+        assert route.call_count == 1
+        assert client.receipt.ledger.stats() == LedgerStats(hits=1, sent=1, size=1)  # type: ignore[union-attr]
+
+
+@respx.mock
+def test_ambiguous_failure_blocks_resend_until_settled() -> None:
+    route = respx.post(URL).mock(
+        side_effect=[httpx.ReadTimeout("no answer"), httpx.Response(200, json=SUCCESS_RESPONSE)]
+    )
+    with _client() as client:
+        ledger = client.receipt.ledger
+        assert ledger is not None
+        with pytest.raises(PosApiTransportError):
+            client.receipt.create(create_receipt_payload)
+        with pytest.raises(PosApiAmbiguousReceiptError) as info:
+            client.receipt.create(create_receipt_payload)
+        assert info.value.key == KEY
+        assert isinstance(info.value.cause, PosApiTransportError)
+        assert ledger.unresolved() == [KEY]
+        assert route.call_count == 1
+
+        ledger.forget(KEY)  # checked: it was not issued
+        assert client.receipt.create(create_receipt_payload).id == ISSUED.id
+        assert route.call_count == 2
+
+
+@respx.mock
+def test_reconciler_confirms_before_each_resend() -> None:
+    route = respx.post(URL).mock(
+        side_effect=[httpx.Response(502), httpx.Response(200, json=SUCCESS_RESPONSE)]
+    )
+    seen: list[CreateReceiptRequest] = []
+
+    def reconcile(request: CreateReceiptRequest) -> CreateReceiptResponse | None:
+        seen.append(request)
+        return None
+
+    with _client(IdempotencySettings(reconcile=reconcile)) as client:
+        assert client.receipt.create(create_receipt_payload).id == ISSUED.id
+    assert route.call_count == 2
+    assert seen == [create_receipt_payload]
+
+
+@respx.mock
+def test_reconciler_finding_the_receipt_stops_the_resend() -> None:
+    route = respx.post(URL).mock(side_effect=httpx.RemoteProtocolError("dropped"))
+    settings = IdempotencySettings(reconcile=lambda _request: ISSUED)
+    with _client(settings) as client:
+        assert client.receipt.create(create_receipt_payload) is ISSUED
+        assert client.receipt.create(create_receipt_payload) is ISSUED
+        stats = client.receipt.ledger.stats()  # type: ignore[union-attr]
+    assert route.call_count == 1
+    assert (stats.ambiguous, stats.reconciled, stats.hits) == (1, 1, 1)
+
+
+@respx.mock
+def test_definite_failures_clear_the_key() -> None:
+    route = respx.post(URL).mock(
+        side_effect=[
+            httpx.Response(400, json={"message": "bad"}),
+            httpx.ConnectError("refused"),
+            httpx.Response(200, json=SUCCESS_RESPONSE),
+        ]
+    )
+    with _client() as client:
+        with pytest.raises(PosApiHttpError):
+            client.receipt.create(create_receipt_payload, idempotency_key="sale-1")
+        # A connect error is retried by the transport even for POST.
+        client.receipt.create(create_receipt_payload, idempotency_key="sale-1")
+        assert route.call_count == 3
+        assert client.receipt.ledger.unresolved() == []  # type: ignore[union-attr]
+
+
+def test_http_error_without_a_response_is_ambiguous() -> None:
+    request = httpx.Request("POST", URL)
+    error = PosApiHttpError(
+        message="bad", request=request, response=httpx.Response(400, request=request)
+    )
+    assert not is_ambiguous(error)
+    error.response = None
+    assert is_ambiguous(error)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_duplicates_are_sent_once() -> None:
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=SUCCESS_RESPONSE)
+
+    route = respx.post(URL).mock(side_effect=slow)
+    async with _client() as client:
+        results = await asyncio.gather(
+            *(client.receipt.acreate(create_receipt_payload) for _ in range(3))
+        )
+    assert route.call_count == 1
+    assert all(r is results[0] for r in results)
+
+
+@respx.mock
+def test_resolve_and_keys_need_a_ledger() -> None:
+    route = respx.post(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    with _client() as client:
+        client.receipt.ledger.resolve("sale-1", ISSUED)  # type: ignore[union-attr]
+        assert client.receipt.create(create_receipt_payload, idempotency_key="sale-1") is ISSUED
+        assert route.call_count == 0
+
+    with EbarimtRestClient(RestClientSettings(base_url=BASE_REST_URL)) as plain:
+        assert plain.receipt.ledger is None
+        with pytest.raises(ValueError, match="receipt_idempotency"):
+            plain.receipt.create(create_receipt_payload, idempotency_key="sale-1")
+
+
+def test_rejects_bad_settings() -> None:
+    with pytest.raises(ValueError, match="IdempotencySettings.max_attempts"):
+        IdempotencySettings(max_attempts=0)
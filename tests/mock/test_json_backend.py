@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import (
+    CreateReceiptRequest,
+    EbarimtRestClient,
+    Item,
+    RestClientSettings,
+    SubReceipt,
+)
+from ebarimt_pos_sdk._json import STDLIB_JSON, get_json_backend
+from ebarimt_pos_sdk.transport.sync_transport import SyncTransport
+
+from ..data.receipt import SUCCESS_RESPONSE
+from ..helpers import BASE_REST_URL
+
+BASE = "https://example.com"
+
+PAYLOAD = CreateReceiptRequest(
+    branch_no="001",
+    total_amount=1000,
+    merchant_tin="12345678901",
+    pos_no="001",
+    type="B2C_RECEIPT",
+    bill_id_suffix="01",
+    receipts=[
+        SubReceipt(
+            total_amount=1000,
+            tax_type="VAT_ABLE",
+            merchant_tin="12345678901",
+            items=[
+                Item(
+                    name="Талх",
+                    measure_unit="ш",
+                    qty=1,
+                    unit_price=1000,
+                    total_amount=1000,
+                )
+            ],
+        )
+    ],
+)
+
+
+class RecordingBackend:
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.dumped: list[Any] = []
+
+    def dumps(self, obj: Any) -> bytes:
+        self.dumped.append(obj)
+        return STDLIB_JSON.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return STDLIB_JSON.loads(data)
+
+
+def test_stdlib_backend_matches_httpx_encoding() -> None:
+    body = {"name": "Цай", "qty": 1, "items": [1.5, None]}
+    expected = httpx.Request("POST", BASE, json=body).content
+    assert STDLIB_JSON.dumps(body) == expected
+    assert STDLIB_JSON.loads(expected) == body
+
+
+def test_backend_resolution(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_json_backend("stdlib") is STDLIB_JSON
+
+    def not_installed(name: str) -> Any:
+        raise ModuleNotFoundError(f"No module named {name!r}")
+
+    monkeypatch.setattr(importlib, "import_module", not_installed)
+    assert get_json_backend("auto") is STDLIB_JSON
+    with pytest.raises(ImportError, match="orjson"):
+        get_json_backend("orjson")
+
+
+def test_settings_reject_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="json_backend"):
+        RestClientSettings(base_url=BASE_REST_URL, json_backend="ujson")  # type: ignore[arg-type]
+
+
+@respx.mock
+def test_model_payload_is_sent_as_compact_json_bytes() -> None:
+    route = respx.post(f"{BASE_REST_URL}/rest/receipt").mock(
+        return_value=httpx.Response(200, json=SUCCESS_RESPONSE)
+    )
+    with EbarimtRestClient(RestClientSettings(base_url=BASE_REST_URL)) as client:
+        resp = client.receipt.create(PAYLOAD)
+
+    assert resp.id == SUCCESS_RESPONSE["id"]
+    request = route.calls.last.request
+    assert request.headers["content-type"] == "application/json"
+    # Same bytes the old dict + httpx ``json=`` path produced.
+    expected = PAYLOAD.model_dump(mode="json", by_alias=True, exclude_none=True)
+    assert request.content == httpx.Request("POST", BASE, json=expected).content
+    assert "Талх".encode() in request.content
+    assert "customerTin" not in json.loads(request.content)
+
+
+@respx.mock
+def test_dict_payloads_use_the_transport_backend() -> None:
+    respx.post(f"{BASE}/x").mock(return_value=httpx.Response(200, json={}))
+    backend = RecordingBackend()
+    transport = SyncTransport(httpx.Client(base_url=BASE), json_backend=backend)
+    result = transport.send("POST", "/x", payload={"a": 1}, headers={"X-Trace": "1"})
+
+    assert backend.dumped == [{"a": 1}]
+    assert result.request.content == b'{"a":1}'
+    assert result.request.headers["content-type"] == "application/json"
+    assert result.request.headers["x-trace"] == "1"
+
+    # Pre-encoded bytes pass through untouched.
+    transport.send("POST", "/x", payload=b'{"b":2}')
+    assert backend.dumped == [{"a": 1}]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient, PosApiHttpError
+from ebarimt_pos_sdk.resources import CacheStats, LookupCache
+from ebarimt_pos_sdk.settings import CacheSettings, RetrySettings
+
+from ..data.merchant_info import NOT_FOUND_RESPONSE, SUCCESS_RESPONSE
+from ..data.tin_info import SUCCESS_RESPONSE as TIN_RESPONSE
+from ..helpers import BASE_API_URL
+
+MERCHANT_URL = f"{BASE_API_URL}/api/info/check/getInfo"
+TIN_URL = f"{BASE_API_URL}/api/info/check/getTinInfo"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(cache: CacheSettings | None = None) -> EbarimtApiClient:
+    return EbarimtApiClient(
+        settings=ApiClientSettings(
+            base_url=BASE_API_URL,
+            lookup_cache=cache or CacheSettings(),
+            retry=RetrySettings(retryable_statuses=frozenset()),
+        )
+    )
+
+
+def _with_clock(client: EbarimtApiClient, clock: FakeClock) -> None:
+    for resource in (client.merchant_info, client.tin_info):
+        assert resource.cache is not None
+        resource.cache._clock = clock
+
+
+@respx.mock
+def test_positive_answers_are_cached_until_ttl() -> None:
+    route = respx.get(MERCHANT_URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    clock = FakeClock()
+    with _client(CacheSettings(ttl_s=60)) as client:
+        _with_clock(client, clock)
+        first = client.merchant_info.read("12345678901")
+        assert client.merchant_info.read("12345678901") == first
+        assert route.call_count == 1
+
+        clock.now = 60
+        client.merchant_info.read("12345678901")
+        assert route.call_count == 2
+        assert client.merchant_info.cache.stats() == CacheStats(  # type: ignore[union-attr]
+            hits=1, misses=2, expirations=1, size=1
+        )
+
+
+@respx.mock
+def test_unknown_tin_uses_negative_ttl() -> None:
+    route = respx.get(MERCHANT_URL).mock(return_value=httpx.Response(200, json=NOT_FOUND_RESPONSE))
+    clock = FakeClock()
+    with _client(CacheSettings(ttl_s=600, negative_ttl_s=5)) as client:
+        _with_clock(client, clock)
+        assert client.merchant_info.read("1").data is None
+        assert client.merchant_info.read("1").data is None
+        assert route.call_count == 1
+        clock.now = 5
+        client.merchant_info.read("1")
+        assert route.call_count == 2
+        stats = client.merchant_info.cache.stats()  # type: ignore[union-attr]
+        assert (stats.negative_hits, stats.hits) == (1, 0)
+
+
+@respx.mock
+def test_client_errors_are_cached_but_server_errors_are_not() -> None:
+    route = respx.get(TIN_URL).mock(
+        side_effect=[
+            httpx.Response(503, json={}),
+            httpx.Response(400, json={"status": 400, "message": "bad regNo"}),
+        ]
+    )
+    with _client() as client:
+        with pytest.raises(PosApiHttpError):
+            client.tin_info.read("AA00000000")
+        raised = []
+        for _ in range(3):
+            with pytest.raises(PosApiHttpError) as info:
+                client.tin_info.read("AA00000000")
+            assert info.value.response is not None
+            assert info.value.response.status_code == 400
+            raised.append(info.value)
+    assert route.call_count == 2
+    # Every hit raises its own copy of the cached error.
+    assert len({id(error) for error in raised}) == 3
+    assert {error.message for error in raised} == {raised[0].message}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_key_is_what_is_sent_and_custom_headers_bypass() -> None:
+    route = respx.get(TIN_URL).mock(return_value=httpx.Response(200, json=TIN_RESPONSE))
+    async with _client() as client:
+        await client.tin_info.aread(" AA00000000 ")
+        assert route.calls[-1].request.url.params["regNo"] == " AA00000000 "
+        client.tin_info.read(" AA00000000 ")
+        assert route.call_count == 1
+
+        client.tin_info.read("AA00000000", headers={"X-Trace": "1"})
+        await client.tin_info.aread("BB00000000", headers={"X-Trace": "1"})
+        assert route.call_count == 3
+        assert client.tin_info.cache.stats().size == 1  # type: ignore[union-attr]
+        client.tin_info.read("AA00000000")  # a different value is a different key
+        assert route.call_count == 4
+
+
+@respx.mock
+def test_lru_eviction_and_invalidate() -> None:
+    route = respx.get(TIN_URL).mock(return_value=httpx.Response(200, json=TIN_RESPONSE))
+    with _client(CacheSettings(max_entries=2)) as client:
+        cache = client.tin_info.cache
+        assert cache is not None
+        client.tin_info.read("a")
+        client.tin_info.read("b")
+        client.tin_info.read("a")  # "b" is now least recently used
+        client.tin_info.read("c")
+        assert cache.stats().evictions == 1
+        client.tin_info.read("a")
+        assert route.call_count == 3
+
+        cache.invalidate("a")
+        client.tin_info.read("a")
+        assert route.call_count == 4
+        cache.invalidate()
+        assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_reads_share_the_cache() -> None:
+    route = respx.get(MERCHANT_URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    async with _client() as client:
+        first = await client.merchant_info.aread("12345678901")
+        assert await client.merchant_info.aread("12345678901") == first
+        assert client.merchant_info.read("12345678901") == first
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_hits_are_shallow_copies() -> None:
+    respx.get(MERCHANT_URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    with _client() as client:
+        first = client.merchant_info.read("12345678901")
+        first.msg = "changed"
+        second = client.merchant_info.read("12345678901")
+        assert second is not first
+        assert second.msg == SUCCESS_RESPONSE["msg"]
+        assert second.data is first.data  # nested models are shared
+
+
+def test_cache_is_off_by_default() -> None:
+    with EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL)) as client:
+        assert client.merchant_info.cache is None
+        assert client.tin_info.cache is None
+
+
+def test_zero_negative_ttl_disables_negative_caching() -> None:
+    cache: LookupCache[str] = LookupCache(CacheSettings(negative_ttl_s=0))
+    calls: list[int] = []
+
+    def fetch() -> str:
+        calls.append(1)
+        return ""
+
+    cache.call("k", fetch, lambda v: not v)
+    cache.call("k", fetch, lambda v: not v)
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"max_entries": 0}, {"ttl_s": 0}, {"negative_ttl_s": -1}], ids=str
+)
+def test_settings_validation(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError, match="CacheSettings"):
+        CacheSettings(**kwargs)  # type: ignore[arg-type]
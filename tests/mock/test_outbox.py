@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import (
+    CreateReceiptRequest,
+    EbarimtRestClient,
+    PosApiValidationError,
+    RestClientSettings,
+)
+from ebarimt_pos_sdk.outbox import OutboxStats, OutboxStatus, ReceiptOutbox
+from ebarimt_pos_sdk.settings import IdempotencySettings, OutboxSettings, RetrySettings
+
+from ..data.receipt import SUCCESS_RESPONSE
+from ..helpers import BASE_REST_URL
+from .test_receipt import create_receipt_payload
+
+URL = f"{BASE_REST_URL}/rest/receipt"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(**kwargs: object) -> EbarimtRestClient:
+    return EbarimtRestClient(
+        RestClientSettings(
+            base_url=BASE_REST_URL,
+            retry=RetrySettings(max_retries=1, retryable_statuses=frozenset()),
+            **kwargs,  # type: ignore[arg-type]
+        )
+    )
+
+
+def _settings(**kwargs: object) -> OutboxSettings:
+    retry = RetrySettings(max_retries=3, backoff_base_seconds=10, max_backoff_seconds=60)
+    return OutboxSettings(retry=retry, **kwargs)  # type: ignore[arg-type]
+
+
+def _receipt(suffix: str) -> dict:
+    payload = create_receipt_payload.model_dump(by_alias=True, exclude_none=True)
+    return {**payload, "billIdSuffix": suffix}
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    suffix = json.loads(request.content)["billIdSuffix"]
+    return httpx.Response(200, json={**SUCCESS_RESPONSE, "id": f"receipt-{suffix}"})
+
+
+@respx.mock
+def test_enqueue_is_offline_and_drain_sends(tmp_path: Path) -> None:
+    route = respx.post(URL).mock(side_effect=_respond)
+    with _client() as client, ReceiptOutbox(tmp_path / "outbox.db", client.receipt) as outbox:
+        ids = [outbox.enqueue(_receipt(f"{i:02d}")) for i in range(5)]
+        assert route.call_count == 0
+        assert outbox.stats() == OutboxStats(pending=5)
+        assert outbox.status(ids[0]).status is OutboxStatus.PENDING  # type: ignore[union-attr]
+
+        assert outbox.drain() == 5
+        assert route.call_count == 5
+        assert outbox.stats() == OutboxStats(sent=5)
+        entry = outbox.status(ids[3])
+        assert entry is not None and entry.attempts == 1 and entry.next_attempt_at is None
+        assert entry.response.id == "receipt-03"  # type: ignore[union-attr]
+        assert outbox.status(999) is None
+
+
+def test_invalid_receipts_fail_at_enqueue(tmp_path: Path) -> None:
+    with _client() as client, ReceiptOutbox(tmp_path / "outbox.db", client.receipt) as outbox:
+        with pytest.raises(PosApiValidationError):
+            outbox.enqueue({"totalAmount": "nope"})
+        assert outbox.stats() == OutboxStats()
+
+
+def test_keyed_enqueue_is_idempotent(tmp_path: Path) -> None:
+    with _client() as client, ReceiptOutbox(tmp_path / "outbox.db", client.receipt) as outbox:
+        first = outbox.enqueue(_receipt("01"), key="sale-1")
+        assert outbox.enqueue(_receipt("01"), key="sale-1") == first
+        assert outbox.status_by_key("sale-1").id == first  # type: ignore[union-attr]
+        assert outbox.stats() == OutboxStats(pending=1)
+
+
+@respx.mock
+def test_unsent_receipts_back_off_then_fail(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    route = respx.post(URL).mock(side_effect=httpx.ConnectError("connection refused"))
+    clock = FakeClock()
+    with (
+        _client() as client,
+        ReceiptOutbox(
+            tmp_path / "o.db", client.receipt, settings=_settings(), clock=clock
+        ) as outbox,
+        caplog.at_level(logging.WARNING, "ebarimt_pos_sdk"),
+    ):
+        entry_id = outbox.enqueue(_receipt("01"))
+        assert outbox.run_once() == 1
+        entry = outbox.status(entry_id)
+        assert entry.status is OutboxStatus.PENDING and entry.attempts == 1  # type: ignore[union-attr]
+        assert entry.next_attempt_at == clock.now + 10  # type: ignore[union-attr]
+        assert entry.error.startswith("PosApiTransportError")  # type: ignore[union-attr]
+
+        assert outbox.run_once() == 0  # not due yet
+        clock.now += 10
+        assert outbox.run_once() == 1
+        assert outbox.status(entry_id).next_attempt_at == clock.now + 20  # type: ignore[union-attr]
+        clock.now += 20
+        outbox.run_once()
+
+        assert outbox.status(entry_id).status is OutboxStatus.FAILED  # type: ignore[union-attr]
+        assert [e.id for e in outbox.failed()] == [entry_id]
+        assert route.call_count == 3
+    assert "failed after 3 attempt(s)" in caplog.text
+
+
+@respx.mock
+def test_possibly_issued_receipts_are_not_sent_again(tmp_path: Path) -> None:
+    responses = iter(
+        [
+            httpx.Response(503, json={}),
+            httpx.ReadTimeout("read timed out"),
+            httpx.Response(200, json=SUCCESS_RESPONSE),
+        ]
+    )
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    route = respx.post(URL).mock(side_effect=handler)
+    with _client() as client, ReceiptOutbox(tmp_path / "o.db", client.receipt) as outbox:
+        unavailable = outbox.enqueue(_receipt("01"))
+        timed_out = outbox.enqueue(_receipt("02"))
+        assert outbox.drain() == 2
+        assert route.call_count == 2
+        assert outbox.stats() == OutboxStats(needs_reconcile=2)
+        assert {e.id for e in outbox.unresolved()} == {unavailable, timed_out}
+
+        # Checked by hand and not issued: send it again.
+        assert outbox.requeue(timed_out)
+        assert not outbox.requeue(999)
+        assert outbox.drain() == 1
+        assert outbox.status(timed_out).status is OutboxStatus.SENT  # type: ignore[union-attr]
+
+
+@respx.mock
+def test_a_reconciling_ledger_makes_ambiguous_failures_retryable(tmp_path: Path) -> None:
+    responses = iter([httpx.Response(503, json={}), httpx.Response(200, json=SUCCESS_RESPONSE)])
+    route = respx.post(URL).mock(side_effect=lambda _request: next(responses))
+    checked: list[str] = []
+
+    def reconcile(request: CreateReceiptRequest) -> None:
+        checked.append(request.bill_id_suffix)
+        return None  # not issued
+
+    clock = FakeClock()
+    idempotency = IdempotencySettings(max_attempts=1, reconcile=reconcile)
+    with (
+        _client(receipt_idempotency=idempotency) as client,
+        ReceiptOutbox(
+            tmp_path / "o.db", client.receipt, settings=_settings(), clock=clock
+        ) as outbox,
+    ):
+        entry_id = outbox.enqueue(_receipt("01"))
+        outbox.run_once()
+        assert outbox.status(entry_id).status is OutboxStatus.PENDING  # type: ignore[union-attr]
+        clock.now += 10
+        outbox.run_once()
+        assert outbox.status(entry_id).status is OutboxStatus.SENT  # type: ignore[union-attr]
+    assert checked == ["01"]
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_client_errors_and_rejected_receipts_fail_at_once(tmp_path: Path) -> None:
+    responses = iter(
+        [
+            httpx.Response(400, json={"message": "bad receipt"}),
+            httpx.Response(200, json={**SUCCESS_RESPONSE, "status": "ERROR"}),
+        ]
+    )
+    respx.post(URL).mock(side_effect=lambda _request: next(responses))
+    with _client() as client, ReceiptOutbox(tmp_path / "o.db", client.receipt) as outbox:
+        rejected = outbox.enqueue(_receipt("01"))
+        errored = outbox.enqueue(_receipt("02"))
+        assert outbox.drain() == 2
+        error = outbox.status(rejected).error  # type: ignore[union-attr]
+        assert error.startswith("PosApiHttpError: HTTP 400") and "bad receipt" in error  # type: ignore[union-attr]
+        assert outbox.status(errored).response.status == "ERROR"  # type: ignore[union-attr]
+        assert outbox.stats() == OutboxStats(failed=2)
+
+
+@respx.mock
+def test_expired_lease_is_claimed_again(tmp_path: Path) -> None:
+    respx.post(URL).mock(side_effect=_respond)
+    clock = FakeClock()
+    path = tmp_path / "o.db"
+    with _client() as client:
+        with ReceiptOutbox(path, client.receipt, clock=clock) as crashed:
+            entry_id = crashed.enqueue(_receipt("01"))
+            crashed._claim()  # claimed, then the process "dies"
+
+        with ReceiptOutbox(
+            path, client.receipt, settings=_settings(lease_s=30), clock=clock
+        ) as outbox:
+            assert outbox.stats() == OutboxStats(sending=1)
+            clock.now += 119
+            assert outbox.run_once() == 0  # default 120s lease still held
+            clock.now += 1
+            assert outbox.run_once() == 1
+            assert outbox.status(entry_id).status is OutboxStatus.SENT  # type: ignore[union-attr]
+
+
+@respx.mock
+def test_outcome_is_not_recorded_once_the_lease_is_lost(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    clock = FakeClock()
+    with (
+        _client() as client,
+        ReceiptOutbox(
+            tmp_path / "o.db", client.receipt, settings=_settings(lease_s=30), clock=clock
+        ) as outbox,
+    ):
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            clock.now += 31
+            assert len(outbox._claim()) == 1  # another worker takes the expired lease
+            return _respond(request)
+
+        respx.post(URL).mock(side_effect=handler)
+        entry_id = outbox.enqueue(_receipt("01"))
+        with caplog.at_level(logging.WARNING, logger="ebarimt_pos_sdk.outbox"):
+            assert outbox.run_once() == 1
+        entry = outbox.status(entry_id)
+        assert entry is not None and entry.status is OutboxStatus.SENDING
+        assert entry.attempts == 0 and entry.next_attempt_at == clock.now + 30
+        assert "lease lost" in caplog.text
+
+
+@respx.mock
+def test_thread_worker_sends_as_receipts_arrive(tmp_path: Path) -> None:
+    sent = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.set()
+        return _respond(request)
+
+    respx.post(URL).mock(side_effect=handler)
+    settings = OutboxSettings(poll_interval_s=30)
+    with (
+        _client() as client,
+        ReceiptOutbox(tmp_path / "o.db", client.receipt, settings=settings) as outbox,
+    ):
+        outbox.start()
+        entry_id = outbox.enqueue(_receipt("01"))
+        assert sent.wait(2)  # woken by the enqueue, not the 30s poll
+        outbox.stop(timeout_s=2)
+        assert outbox.status(entry_id).status is OutboxStatus.SENT  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_task_worker_and_prune(tmp_path: Path) -> None:
+    respx.post(URL).mock(side_effect=_respond)
+    clock = FakeClock()
+    settings = OutboxSettings(poll_interval_s=30)
+    async with _client() as client:
+        outbox = ReceiptOutbox(tmp_path / "o.db", client.receipt, settings=settings, clock=clock)
+        outbox.astart()
+        ids = [outbox.enqueue(_receipt(f"{i:02d}")) for i in range(3)]
+        for _ in range(200):
+            if outbox.stats() == OutboxStats(sent=3):
+                break
+            await asyncio.sleep(0.01)
+        await outbox.astop()
+        assert outbox.stats() == OutboxStats(sent=3)
+        assert outbox.status(ids[2]).response.id == "receipt-02"  # type: ignore[union-attr]
+
+        clock.now += 3600
+        assert outbox.prune(older_than_s=60) == 3
+        assert outbox.stats() == OutboxStats()
+        outbox.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_aclose_finishes_the_round_and_close_joins_from_another_thread(
+    tmp_path: Path,
+) -> None:
+    route = respx.post(URL).mock(side_effect=_respond)
+    settings = OutboxSettings(poll_interval_s=30)
+    async with _client() as client:
+        async with ReceiptOutbox(tmp_path / "a.db", client.receipt, settings=settings) as outbox:
+            outbox.astart()
+            entry_id = outbox.enqueue(_receipt("01"))
+            while not route.called:
+                await asyncio.sleep(0.005)
+        assert outbox._task is None
+        with ReceiptOutbox(tmp_path / "a.db", client.receipt) as reopened:
+            assert reopened.status(entry_id).status is OutboxStatus.SENT  # type: ignore[union-attr]
+
+        outbox = ReceiptOutbox(tmp_path / "b.db", client.receipt, settings=settings)
+        outbox.astart()
+        task = outbox._task
+        await asyncio.to_thread(outbox.close)
+        assert task is not None and task.done() and not task.cancelled()
+
+        outbox = ReceiptOutbox(tmp_path / "c.db", client.receipt, settings=settings)
+        outbox.astart()
+        task = outbox._task
+        assert task is not None
+        outbox.close()  # on the worker's own loop: cancelled, not joined
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+def test_rejects_bad_settings() -> None:
+    with pytest.raises(ValueError, match="OutboxSettings.batch_size"):
+        OutboxSettings(batch_size=0)
+    with pytest.raises(ValueError, match="OutboxSettings.lease_s"):
+        OutboxSettings(lease_s=0)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from ebarimt_pos_sdk import EbarimtRestClient, RestClientSettings
+
+from ..helpers import BASE_REST_URL
+
+
+def _spy_clients(monkeypatch: pytest.MonkeyPatch) -> dict[str, dict[str, Any]]:
+    """Record the kwargs passed to the httpx client constructors."""
+    captured: dict[str, dict[str, Any]] = {}
+    real_sync = httpx.Client
+    real_async = httpx.AsyncClient
+
+    def spy_sync(*args: Any, **kwargs: Any) -> httpx.Client:
+        captured["sync"] = kwargs
+        # Drop http2 so the test does not depend on the optional h2 package.
+        return real_sync(*args, **{**kwargs, "http2": False})
+
+    def spy_async(*args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        captured["async"] = kwargs
+        return real_async(*args, **{**kwargs, "http2": False})
+
+    monkeypatch.setattr("ebarimt_pos_sdk.clients.base_client.httpx.Client", spy_sync)
+    monkeypatch.setattr("ebarimt_pos_sdk.clients.base_client.httpx.AsyncClient", spy_async)
+    return captured
+
+
+def test_default_pool_matches_httpx_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = _spy_clients(monkeypatch)
+
+    with EbarimtRestClient(RestClientSettings(base_url=BASE_REST_URL)):
+        pass
+
+    for side in ("sync", "async"):
+        limits = captured[side]["limits"]
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+        assert limits.keepalive_expiry == 5.0
+        assert captured[side]["http2"] is False
+
+
+def test_pool_settings_forwarded_to_both_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = _spy_clients(monkeypatch)
+    settings = RestClientSettings(
+        base_url=BASE_REST_URL,
+        max_connections=250,
+        max_keepalive_connections=None,
+        keepalive_expiry_s=30.0,
+        http2=True,
+    )
+
+    with EbarimtRestClient(settings):
+        pass
+
+    for side in ("sync", "async"):
+        limits = captured[side]["limits"]
+        assert limits.max_connections == 250
+        assert limits.max_keepalive_connections is None
+        assert limits.keepalive_expiry == 30.0
+        assert captured[side]["http2"] is True
+
+
+def test_zero_keepalive_connections_is_allowed() -> None:
+    settings = RestClientSettings(base_url=BASE_REST_URL, max_keepalive_connections=0)
+    assert settings.max_keepalive_connections == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_connections": 0}, "max_connections"),
+        ({"max_keepalive_connections": -1}, "max_keepalive_connections"),
+        ({"keepalive_expiry_s": -1.0}, "keepalive_expiry_s"),
+    ],
+)
+def test_pool_settings_rejects_invalid_values(kwargs: dict[str, Any], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        RestClientSettings(base_url=BASE_REST_URL, **kwargs)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient, TaxType
+from ebarimt_pos_sdk.catalogs import ProductTaxCodeCatalog, ProductTaxCodeIndex
+from ebarimt_pos_sdk.resources import ProductTaxCode
+
+from ..data.product_tax_code import SUCCESS_RESPONSE
+from ..helpers import BASE_API_URL
+
+URL = f"{BASE_API_URL}/api/receipt/receipt/getProductTaxCode"
+
+
+def _row(code: str, start: str, end: str | None, tax_type: str) -> ProductTaxCode:
+    return ProductTaxCode.model_validate(
+        {
+            "startDate": start,
+            "endDate": end,
+            "taxProductCode": code,
+            "taxProductName": f"{code} {tax_type}",
+            "taxTypeCode": 1,
+            "taxTypeName": tax_type,
+        }
+    )
+
+
+@pytest.fixture
+def index() -> ProductTaxCodeIndex:
+    return ProductTaxCodeIndex.build(
+        [
+            # Deliberately out of order: the index sorts per code.
+            _row("501", "2024-01-01 00:00:00", None, "VAT_ZERO"),
+            _row("501", "2020-01-01 00:00:00", "2024-01-01 00:00:00", "VAT_FREE"),
+            _row("777", "2016-01-01 00:00:00", None, "NO_VAT"),
+            _row("777", "2020-01-01 00:00:00", "2021-01-01 00:00:00", "VAT_FREE"),
+        ]
+    )
+
+
+def test_interval_lookup(index: ProductTaxCodeIndex) -> None:
+    assert index.tax_type("501", datetime(2022, 6, 1)) is TaxType.VAT_FREE
+    # Start is inclusive, end exclusive.
+    assert index.tax_type("501", datetime(2024, 1, 1)) is TaxType.VAT_ZERO
+    assert index.tax_type("501", datetime(2023, 12, 31, 23, 59)) is TaxType.VAT_FREE
+    assert index.at("501", datetime(2019, 1, 1)) is None
+    assert index.at("nope", datetime(2022, 1, 1)) is None
+    assert "501" in index and "nope" not in index
+    assert [r.tax_type_name for r in index.history("501")] == [TaxType.VAT_FREE, TaxType.VAT_ZERO]
+
+
+def test_expired_newer_row_falls_back_to_open_older_one(index: ProductTaxCodeIndex) -> None:
+    assert index.tax_type("777", datetime(2020, 6, 1)) is TaxType.VAT_FREE
+    assert index.tax_type("777", datetime(2022, 6, 1)) is TaxType.NO_VAT
+
+
+def test_lookup_after_every_row_ended_stops_at_once() -> None:
+    rows = [
+        _row("900", f"{year}-01-01 00:00:00", f"{year + 1}-01-01 00:00:00", "VAT_FREE")
+        for year in range(2000, 2020)
+    ]
+    index = ProductTaxCodeIndex.build(rows)
+    assert index.at("900", datetime(2025, 1, 1)) is None
+    assert index.tax_type("900", datetime(2019, 6, 1)) is TaxType.VAT_FREE
+    assert index.by_code["900"].reach[-1] == datetime(2020, 1, 1)
+
+
+def test_aware_times_are_read_in_ulaanbaatar(index: ProductTaxCodeIndex) -> None:
+    # 17:00 UTC on Dec 31 is 01:00 on Jan 1 in Ulaanbaatar.
+    when = datetime(2023, 12, 31, 17, 0, tzinfo=timezone.utc)
+    assert index.tax_type("501", when) is TaxType.VAT_ZERO
+
+
+def test_active_rows(index: ProductTaxCodeIndex) -> None:
+    active = index.active(datetime(2022, 1, 1))
+    assert {(r.tax_product_code, r.tax_type_name) for r in active} == {
+        ("501", TaxType.VAT_FREE),
+        ("777", TaxType.NO_VAT),
+    }
+
+
+@respx.mock
+def test_catalog_fetches_once_within_ttl() -> None:
+    route = respx.get(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    with EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL)) as client:
+        catalog = ProductTaxCodeCatalog(client.product_tax_code)
+        row = catalog.lookup("0002291", datetime(2025, 1, 1))
+        assert row is not None and row.tax_type_name is TaxType.NO_VAT
+        assert catalog.lookup("0002291", datetime(2035, 1, 1)) is None
+        assert len(catalog.get()) == len(SUCCESS_RESPONSE["data"])
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_catalog_async_lookup() -> None:
+    route = respx.get(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    async with EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL)) as client:
+        catalog = ProductTaxCodeCatalog(client.product_tax_code)
+        assert await catalog.alookup("00016112") is not None
+        await catalog.arefresh()
+    assert route.call_count == 2
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import EbarimtRestClient, PosApiDeadlineExceededError, RestClientSettings
+from ebarimt_pos_sdk.settings import RateLimitSettings
+from ebarimt_pos_sdk.transport import RateLimiter
+from ebarimt_pos_sdk.transport.async_transport import AsyncTransport
+from ebarimt_pos_sdk.transport.rate_limit import TokenBucket
+from ebarimt_pos_sdk.transport.sync_transport import SyncTransport
+
+BASE = "https://example.com"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_reserves_future_slots_in_order() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimitSettings(rate_per_s=10, burst=2), clock=clock)
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+    # Refill is capped at the burst size.
+    clock.now += 10.0
+    assert [bucket.reserve() for _ in range(3)] == pytest.approx([0.0, 0.0, 0.1])
+
+    stats = bucket.stats
+    assert (stats.requests, stats.throttled) == (7, 3)
+    assert stats.waited_s == pytest.approx(0.4)
+
+
+def test_reservation_over_max_wait_takes_nothing() -> None:
+    bucket = TokenBucket(RateLimitSettings(rate_per_s=1), clock=FakeClock())
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve(max_wait_s=0.5) is None
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_longest_prefix_wins() -> None:
+    limiter = RateLimiter(
+        {
+            "/": RateLimitSettings(rate_per_s=100),
+            "/rest": RateLimitSettings(rate_per_s=10),
+            "/rest/receipt": RateLimitSettings(rate_per_s=1),
+        }
+    )
+    assert limiter.bucket_for("/rest/receipt") is limiter.bucket_for("/rest/receipt/")
+    assert limiter.bucket_for("/rest/receipt") is not limiter.bucket_for("/rest/info")
+    assert limiter.bucket_for("/rest/receipts") is limiter.bucket_for("/rest/info")
+    assert limiter.bucket_for("/api/info") is limiter.bucket_for("/")
+    assert RateLimiter({"/rest": RateLimitSettings(rate_per_s=1)}).reserve("/api") == 0.0
+
+
+@respx.mock
+def test_sync_transport_sleeps_for_its_reservation(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", lambda s: sleeps.append(s))
+    respx.get(f"{BASE}/x").mock(return_value=httpx.Response(200, json={}))
+    respx.get(f"{BASE}/y").mock(return_value=httpx.Response(200, json={}))
+    limiter = RateLimiter({"/x": RateLimitSettings(rate_per_s=10)})
+    transport = SyncTransport(httpx.Client(base_url=BASE), rate_limiter=limiter)
+
+    for _ in range(3):
+        transport.send("GET", "/x")
+    transport.send("GET", "/y")
+
+    assert sleeps == pytest.approx([0.1, 0.2], abs=0.01)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_transport_awaits_its_reservation(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(s: float) -> None:
+        sleeps.append(s)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    respx.post(f"{BASE}/x").mock(return_value=httpx.Response(200, json={}))
+    limiter = RateLimiter({"/x": RateLimitSettings(rate_per_s=5, burst=2)})
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), rate_limiter=limiter)
+
+    await asyncio.gather(*(transport.send("POST", "/x", payload={}) for _ in range(4)))
+    assert sleeps == pytest.approx([0.2, 0.4], abs=0.01)
+
+
+@respx.mock
+def test_wait_past_deadline_raises_without_sending(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+    route = respx.get(f"{BASE}/x").mock(return_value=httpx.Response(200, json={}))
+    limiter = RateLimiter({"/x": RateLimitSettings(rate_per_s=1)})
+    transport = SyncTransport(httpx.Client(base_url=BASE), rate_limiter=limiter)
+
+    transport.send("GET", "/x")
+    with pytest.raises(PosApiDeadlineExceededError):
+        transport.send("GET", "/x", deadline_s=0.5)
+    assert route.call_count == 1
+
+
+def test_client_shares_one_limiter_between_transports() -> None:
+    settings = RestClientSettings(
+        base_url=BASE, rate_limits={"/rest/receipt": RateLimitSettings(rate_per_s=20, burst=5)}
+    )
+    with EbarimtRestClient(settings) as client:
+        assert client.rate_limiter is not None
+        assert client._sync_transport._rate_limiter is client.rate_limiter
+        assert client._async_transport._rate_limiter is client.rate_limiter
+        assert set(client.rate_limiter.stats()) == {"/rest/receipt"}
+
+    with EbarimtRestClient(RestClientSettings(base_url=BASE)) as client:
+        assert client.rate_limiter is None
+
+    with pytest.raises(ValueError, match="rate_per_s"):
+        RateLimitSettings(rate_per_s=0)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient, PosApiHttpError
+from ebarimt_pos_sdk.resources.batch import arun_many, run_many
+from ebarimt_pos_sdk.settings import CacheSettings, RetrySettings
+
+from ..data.merchant_info import SUCCESS_RESPONSE
+from ..data.tin_info import SUCCESS_RESPONSE as TIN_RESPONSE
+from ..helpers import BASE_API_URL
+
+MERCHANT_URL = f"{BASE_API_URL}/api/info/check/getInfo"
+TIN_URL = f"{BASE_API_URL}/api/info/check/getTinInfo"
+
+
+def _client(**kwargs: object) -> EbarimtApiClient:
+    return EbarimtApiClient(
+        settings=ApiClientSettings(
+            base_url=BASE_API_URL,
+            retry=RetrySettings(retryable_statuses=frozenset()),
+            **kwargs,  # type: ignore[arg-type]
+        )
+    )
+
+
+def _merchant(request: httpx.Request) -> httpx.Response:
+    tin = request.url.params["tin"]
+    if tin == "bad":
+        return httpx.Response(400, json={"status": 400, "message": "invalid tin"})
+    body = {**SUCCESS_RESPONSE, "data": {**SUCCESS_RESPONSE["data"], "name": tin}}
+    return httpx.Response(200, json=body)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_aread_many_dedupes_orders_and_bounds() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _merchant(request)
+
+    route = respx.get(MERCHANT_URL).mock(side_effect=handler)
+    tins = ["t3", "t1", "bad", " t1 ", "t2", "t4", "t3"]
+    async with _client() as client:
+        results = await client.merchant_info.aread_many(tins, concurrency=2)
+
+    assert route.call_count == 5
+    assert peak == 2
+    assert [r.key for r in results] == ["t3", "t1", "bad", "t1", "t2", "t4", "t3"]
+    assert results[1] is results[3]
+    assert [r.value.data.name for r in results if r.ok] == [  # type: ignore[union-attr]
+        "t3", "t1", "t1", "t2", "t4", "t3",
+    ]  # fmt: skip
+    failed = results[2]
+    assert not failed.ok and isinstance(failed.error, PosApiHttpError)
+    with pytest.raises(PosApiHttpError):
+        failed.unwrap()
+
+
+@respx.mock
+def test_read_many_runs_on_a_thread_pool() -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200, json=TIN_RESPONSE)
+
+    route = respx.get(TIN_URL).mock(side_effect=handler)
+    reg_nos = [f"AA{i:08d}" for i in range(8)]
+    with _client() as client:
+        results = client.tin_info.read_many(reg_nos, concurrency=3)
+
+    assert route.call_count == 8
+    assert 1 < peak <= 3
+    assert [r.key for r in results] == reg_nos
+    assert all(r.unwrap().data == "16000859970" for r in results)
+
+
+@respx.mock
+def test_read_many_goes_through_the_lookup_cache() -> None:
+    route = respx.get(MERCHANT_URL).mock(side_effect=_merchant)
+    with _client(lookup_cache=CacheSettings()) as client:
+        client.merchant_info.read("t1")
+        results = client.merchant_info.read_many(["t1", "t2"], concurrency=1)
+    assert [r.ok for r in results] == [True, True]
+    assert route.call_count == 2
+
+
+def test_unexpected_errors_are_reported_per_key() -> None:
+    def fetch(key: str) -> int:
+        if key == "odd":
+            raise TypeError("unexpected body")
+        return len(key)
+
+    for concurrency in (1, 4):
+        results = run_many(["a", "odd", "bb"], fetch, concurrency=concurrency)
+        assert [r.value for r in results] == [1, None, 2]
+        assert isinstance(results[1].error, TypeError)
+        with pytest.raises(TypeError):
+            results[1].unwrap()
+
+
+@pytest.mark.asyncio
+async def test_async_unexpected_errors_and_cancellation() -> None:
+    async def fetch(key: str) -> int:
+        if key == "odd":
+            raise ValueError("unexpected body")
+        return len(key)
+
+    results = await arun_many(["a", "odd"], fetch, concurrency=2)
+    assert results[0].value == 1 and isinstance(results[1].error, ValueError)
+
+    started = asyncio.Event()
+    cancelled: list[str] = []
+
+    async def hang(key: str) -> int:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(key)
+            raise
+        return 0
+
+    batch = asyncio.create_task(arun_many(["x", "y"], hang, concurrency=2))
+    await started.wait()
+    batch.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await batch
+    assert sorted(cancelled) == ["x", "y"]
+
+
+def test_rejects_non_positive_concurrency() -> None:
+    with _client() as client, pytest.raises(ValueError, match="concurrency"):
+        client.tin_info.read_many(["a"], concurrency=0)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient, PosApiDeadlineExceededError
+from ebarimt_pos_sdk.transport import SingleFlightStats
+from ebarimt_pos_sdk.transport.async_transport import AsyncTransport
+from ebarimt_pos_sdk.transport.single_flight import AsyncSingleFlight, SingleFlight, request_key
+from ebarimt_pos_sdk.transport.sync_transport import SyncTransport
+
+from ..data.merchant_info import SUCCESS_RESPONSE
+from ..helpers import BASE_API_URL
+
+BASE = "https://example.com"
+INFO_URL = f"{BASE_API_URL}/api/info/check/getInfo"
+
+
+def _settings(**kwargs: object) -> ApiClientSettings:
+    return ApiClientSettings(base_url=BASE_API_URL, coalesce_gets=True, **kwargs)
+
+
+def test_request_key_ignores_param_order_but_not_headers() -> None:
+    a = request_key("GET", "/x", {"a": "1", "b": "2"}, None)
+    assert a == request_key("GET", "/x", {"a": "1", "b": "2"}, {})
+    assert a != request_key("GET", "/x", {"a": "2"}, None)
+    assert a != request_key("GET", "/x", {"a": "1", "b": "2"}, {"Authorization": "Bearer t"})
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_identical_areads_share_one_request_and_model() -> None:
+    release = asyncio.Event()
+
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json=SUCCESS_RESPONSE)
+
+    route = respx.get(INFO_URL).mock(side_effect=slow)
+    async with EbarimtApiClient(settings=_settings()) as client:
+        tasks = [asyncio.create_task(client.merchant_info.aread("01234567891")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert route.call_count == 1
+        assert all(r is results[0] for r in results)
+        assert client.single_flight_stats == SingleFlightStats(leaders=1, shared=4)
+
+        # Nothing is cached once the flight lands.
+        await client.merchant_info.aread("01234567891")
+        assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_different_params_are_not_coalesced() -> None:
+    route = respx.get(INFO_URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    async with EbarimtApiClient(settings=_settings()) as client:
+        await asyncio.gather(
+            client.merchant_info.aread("01234567891"),
+            client.merchant_info.aread("01234567892"),
+        )
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_does_not_cancel_the_shared_call() -> None:
+    flight = AsyncSingleFlight()
+    release = asyncio.Event()
+
+    async def fn() -> str:
+        await release.wait()
+        return "ok"
+
+    first = asyncio.create_task(flight.do("k", fn))
+    second = asyncio.create_task(flight.do("k", fn))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    assert await second == "ok"
+    assert flight.stats == SingleFlightStats(leaders=1, shared=1)
+
+
+@respx.mock
+def test_sync_threads_share_one_request_and_errors_propagate() -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(_request: httpx.Request) -> httpx.Response:
+        started.set()
+        release.wait(5)
+        return httpx.Response(200, json={})
+
+    route = respx.get(f"{BASE}/x").mock(side_effect=slow)
+    transport = SyncTransport(httpx.Client(base_url=BASE), coalesce_gets=True)
+    results: list[object] = []
+
+    def call() -> None:
+        results.append(transport.send("GET", "/x"))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    joiners = [threading.Thread(target=call) for _ in range(3)]
+    for t in joiners:
+        t.start()
+    while transport.single_flight_stats.shared < 3:  # type: ignore[union-attr]
+        threading.Event().wait(0.001)
+    release.set()
+    for t in [leader, *joiners]:
+        t.join(5)
+
+    assert route.call_count == 1
+    assert len(results) == 4 and all(r is results[0] for r in results)
+
+    flight = SingleFlight()
+    with pytest.raises(RuntimeError, match="boom"):
+        flight.do("k", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    assert flight.stats == SingleFlightStats(leaders=1, shared=0)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_joiner_waits_only_until_its_own_deadline() -> None:
+    release = asyncio.Event()
+
+    async def slow(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={})
+
+    route = respx.get(f"{BASE}/x").mock(side_effect=slow)
+    async with httpx.AsyncClient(base_url=BASE) as client:
+        transport = AsyncTransport(client, coalesce_gets=True)
+        leader = asyncio.create_task(transport.send("GET", "/x"))
+        await asyncio.sleep(0)
+        with pytest.raises(PosApiDeadlineExceededError) as info:
+            await transport.send("GET", "/x", deadline_s=0.05)
+        assert info.value.deadline_s == 0.05
+        assert not leader.done()
+
+        release.set()
+        assert (await leader).response.status_code == 200
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_sync_joiner_waits_only_until_its_own_deadline() -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(_request: httpx.Request) -> httpx.Response:
+        started.set()
+        release.wait(5)
+        return httpx.Response(200, json={})
+
+    respx.get(f"{BASE}/x").mock(side_effect=slow)
+    transport = SyncTransport(httpx.Client(base_url=BASE), coalesce_gets=True)
+    leader = threading.Thread(target=lambda: transport.send("GET", "/x"))
+    leader.start()
+    started.wait(5)
+    try:
+        with pytest.raises(PosApiDeadlineExceededError):
+            transport.send("GET", "/x", deadline_s=0.05)
+        assert leader.is_alive()
+    finally:
+        release.set()
+        leader.join(5)
+    assert transport.single_flight_stats == SingleFlightStats(leaders=1, shared=1)
+
+
+def test_coalescing_is_off_by_default() -> None:
+    with EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL)) as client:
+        assert client.single_flight_stats is None
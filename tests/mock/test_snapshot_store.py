@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient
+from ebarimt_pos_sdk.catalogs import (
+    BunaBarcode,
+    BunaNode,
+    BunaSnapshot,
+    DistrictCatalog,
+    ProductTaxCodeCatalog,
+    SnapshotStore,
+)
+from ebarimt_pos_sdk.resources import GetDistrictCodeResponse, GetProductTaxCodeResponse
+
+from ..data.district_code import SUCCESS_RESPONSE as DISTRICTS
+from ..data.product_tax_code import SUCCESS_RESPONSE as TAX_CODES
+from ..helpers import BASE_API_URL
+
+DISTRICT_URL = f"{BASE_API_URL}/api/info/check/getBranchInfo"
+TAX_CODE_URL = f"{BASE_API_URL}/api/receipt/receipt/getProductTaxCode"
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    return tmp_path / "reference.sqlite3"
+
+
+def _client() -> EbarimtApiClient:
+    return EbarimtApiClient(settings=ApiClientSettings(base_url=BASE_API_URL))
+
+
+def test_district_rows_round_trip(store_path: Path) -> None:
+    response = GetDistrictCodeResponse.model_validate(DISTRICTS)
+    with SnapshotStore(store_path, clock=FakeClock(1000)) as store:
+        assert store.load_districts() is None
+        store.save_districts(response)
+
+    with SnapshotStore(store_path) as store:
+        stored = store.load_districts()
+        assert stored is not None
+        assert stored.value == response and stored.fetched_at == 1000
+        assert store.district("0102").sub_branch_name == "Чулуут"  # type: ignore[union-attr]
+        assert store.district("9999") is None
+        assert [r.sub_branch_code for r in store.branch("01")][:2] == ["01", "02"]
+
+
+def test_product_tax_codes_by_code(store_path: Path) -> None:
+    response = GetProductTaxCodeResponse.model_validate(TAX_CODES)
+    with SnapshotStore(store_path) as store:
+        store.save_product_tax_codes(response)
+        [row] = store.product_tax_codes("0002291")
+        assert row == next(r for r in response.data if r.tax_product_code == "0002291")
+        assert store.product_tax_codes("nope") == ()
+        # Saving again replaces rather than appends.
+        store.save_product_tax_codes(response)
+        assert len(store.load_product_tax_codes().value.data) == len(response.data)  # type: ignore[union-attr]
+
+
+def test_buna_round_trip_and_point_queries(store_path: Path) -> None:
+    leaf = ("0", "01", "011", "0111", "01111", "0111100")
+    snapshot = BunaSnapshot(
+        nodes=(
+            *(BunaNode(leaf[:depth], f"level {depth}") for depth in range(1, 7)),
+            BunaNode(("0", "02"), "Мал"),
+            BunaNode(("1",), "Хүдэр"),
+        ),
+        barcodes=(BunaBarcode("0111100", "800888883000", "Тест", "2022-07-17"),),
+        include_barcodes=True,
+    )
+    with SnapshotStore(store_path) as store:
+        store.save_buna(snapshot)
+        assert store.load_buna().value == snapshot  # type: ignore[union-attr]
+        assert store.buna_node("0111100").path == leaf  # type: ignore[union-attr]
+        assert [n.code for n in store.buna_children()] == ["0", "1"]
+        assert [n.code for n in store.buna_children("0")] == ["01", "02"]
+        assert store.buna_barcode("800888883000").classification_code == "0111100"  # type: ignore[union-attr]
+        assert store.buna_node("9") is None
+
+
+@respx.mock
+def test_catalog_cold_start_reads_the_store(store_path: Path) -> None:
+    route = respx.get(DISTRICT_URL).mock(return_value=httpx.Response(200, json=DISTRICTS))
+    wall = FakeClock(10_000)
+
+    with _client() as client, SnapshotStore(store_path, clock=wall) as store:
+        DistrictCatalog(client.district_code, snapshot_store=store).get()
+    assert route.call_count == 1
+
+    # A new process: the stored copy is 1h old, well inside the 24h TTL.
+    wall.now += 3600
+    clock = FakeClock()
+    with _client() as client, SnapshotStore(store_path, clock=wall) as store:
+        catalog = DistrictCatalog(
+            client.district_code, ttl_s=24 * 3600, snapshot_store=store, clock=clock
+        )
+        assert catalog.lookup("0102") is not None
+        assert route.call_count == 1
+        assert catalog.expires_in_s == 23 * 3600
+
+        clock.now += 23 * 3600
+        catalog.get()
+        assert route.call_count == 2
+        assert store.fetched_at("districts") == wall.now
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_expired_snapshot_is_served_stale_while_reloading(store_path: Path) -> None:
+    route = respx.get(TAX_CODE_URL).mock(return_value=httpx.Response(200, json=TAX_CODES))
+    wall = FakeClock(0)
+    with SnapshotStore(store_path, clock=wall) as store:
+        store.save_product_tax_codes(GetProductTaxCodeResponse.model_validate(TAX_CODES))
+        wall.now = 7 * 3600  # older than the 6h TTL
+
+        async with _client() as client:
+            catalog = ProductTaxCodeCatalog(
+                client.product_tax_code, max_stale_s=24 * 3600, snapshot_store=store
+            )
+            assert await catalog.alookup("0002291") is not None
+            assert route.call_count == 0
+            await catalog.arefresh()
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_restore_does_not_wait_for_a_sync_reload(store_path: Path) -> None:
+    entered, release = threading.Event(), threading.Event()
+
+    def blocked(_request: httpx.Request) -> httpx.Response:
+        entered.set()
+        release.wait(5)
+        return httpx.Response(200, json=DISTRICTS)
+
+    respx.get(DISTRICT_URL).mock(side_effect=blocked)
+    with SnapshotStore(store_path) as store:
+        store.save_districts(GetDistrictCodeResponse.model_validate(DISTRICTS))
+        with _client() as client:
+            catalog = DistrictCatalog(client.district_code, snapshot_store=store)
+            reload = threading.Thread(target=catalog.refresh)
+            reload.start()
+            entered.wait(5)
+            threading.Timer(2.0, release.set).start()  # unblocks a stuck loop eventually
+            started = time.monotonic()
+            try:
+                assert await asyncio.wait_for(catalog.alookup("0102"), 1.0) is not None
+                assert time.monotonic() - started < 1.0
+            finally:
+                release.set()
+                reload.join(5)
+
+
+@respx.mock
+def test_store_failures_never_fail_reads(
+    store_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    respx.get(DISTRICT_URL).mock(return_value=httpx.Response(200, json=DISTRICTS))
+    store = SnapshotStore(store_path)
+    store.close()
+    with _client() as client, caplog.at_level(logging.WARNING, "ebarimt_pos_sdk"):
+        catalog = DistrictCatalog(client.district_code, snapshot_store=store)
+        assert catalog.lookup("0102") is not None
+    assert "could not load snapshot" in caplog.text
+    assert "could not save snapshot" in caplog.text
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import ApiClientSettings, EbarimtApiClient
+from ebarimt_pos_sdk.catalogs import DistrictCatalog, ProductTaxCodeCatalog
+from ebarimt_pos_sdk.settings import CacheSettings, RetrySettings
+
+from ..data.district_code import SUCCESS_RESPONSE as DISTRICTS
+from ..data.merchant_info import SUCCESS_RESPONSE as MERCHANT
+from ..data.product_tax_code import SUCCESS_RESPONSE as TAX_CODES
+from ..helpers import BASE_API_URL
+
+DISTRICT_URL = f"{BASE_API_URL}/api/info/check/getBranchInfo"
+TAX_CODE_URL = f"{BASE_API_URL}/api/receipt/receipt/getProductTaxCode"
+MERCHANT_URL = f"{BASE_API_URL}/api/info/check/getInfo"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(**kwargs: object) -> EbarimtApiClient:
+    return EbarimtApiClient(
+        settings=ApiClientSettings(
+            base_url=BASE_API_URL,
+            retry=RetrySettings(retryable_statuses=frozenset()),
+            **kwargs,  # type: ignore[arg-type]
+        )
+    )
+
+
+def _wait_for(condition: Callable[[], bool], timeout_s: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+@respx.mock
+def test_sync_catalog_serves_stale_and_reloads_in_background() -> None:
+    entered = threading.Event()
+    gate = threading.Event()
+    responses = iter([True, False])
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        if not next(responses):
+            entered.set()
+            gate.wait(2)  # the background reload blocks here, not the caller
+        return httpx.Response(200, json=DISTRICTS)
+
+    route = respx.get(DISTRICT_URL).mock(side_effect=handler)
+    clock = FakeClock()
+    with _client() as client:
+        catalog = DistrictCatalog(client.district_code, ttl_s=60, max_stale_s=30, clock=clock)
+        first = catalog.get()
+
+        clock.now = 70
+        assert catalog.get() is first
+        assert entered.wait(2)
+        assert catalog.get() is first  # one reload, not one per call
+        gate.set()
+        _wait_for(lambda: catalog._index is not first)
+        assert route.call_count == 2
+        assert catalog.expires_in_s == 60
+
+
+@respx.mock
+def test_past_max_stale_reload_is_synchronous() -> None:
+    route = respx.get(DISTRICT_URL).mock(return_value=httpx.Response(200, json=DISTRICTS))
+    clock = FakeClock()
+    with _client() as client:
+        catalog = DistrictCatalog(client.district_code, ttl_s=60, max_stale_s=30, clock=clock)
+        first = catalog.get()
+        clock.now = 90
+        assert catalog.get() is not first
+        assert route.call_count == 2
+
+
+@respx.mock
+def test_failed_background_reload_keeps_stale_index(caplog: pytest.LogCaptureFixture) -> None:
+    responses = iter([httpx.Response(200, json=DISTRICTS)])
+    route = respx.get(DISTRICT_URL).mock(
+        side_effect=lambda _request: next(responses, httpx.Response(400, json={}))
+    )
+    clock = FakeClock()
+    with _client() as client, caplog.at_level(logging.WARNING, "ebarimt_pos_sdk"):
+        catalog = DistrictCatalog(client.district_code, ttl_s=60, max_stale_s=30, clock=clock)
+        first = catalog.get()
+        clock.now = 61
+        assert catalog.get() is first
+        _wait_for(lambda: "background refresh" in caplog.text)
+        assert catalog.get() is first
+    assert route.call_count >= 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_catalog_reloads_on_a_task() -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            started.set()
+            await release.wait()
+        return httpx.Response(200, json=TAX_CODES)
+
+    respx.get(TAX_CODE_URL).mock(side_effect=handler)
+    clock = FakeClock()
+    async with _client() as client:
+        catalog = ProductTaxCodeCatalog(
+            client.product_tax_code, ttl_s=60, max_stale_s=600, clock=clock
+        )
+        first = await catalog.aget()
+        clock.now = 100
+        assert await catalog.aget() is first
+        await asyncio.wait_for(started.wait(), 1)
+        assert await catalog.aget() is first
+        release.set()
+        for _ in range(100):
+            if catalog._index is not first:
+                break
+            await asyncio.sleep(0.01)
+        assert catalog._index is not first
+    assert calls == 2
+
+
+@respx.mock
+def test_lookup_cache_serves_stale_then_refreshes() -> None:
+    bodies = iter([MERCHANT, {**MERCHANT, "msg": "refreshed"}, MERCHANT])
+    route = respx.get(MERCHANT_URL).mock(
+        side_effect=lambda request: httpx.Response(200, json=next(bodies))
+    )
+    clock = FakeClock()
+    with _client(lookup_cache=CacheSettings(ttl_s=60, max_stale_s=30)) as client:
+        cache = client.merchant_info.cache
+        assert cache is not None
+        cache._clock = clock
+        first = client.merchant_info.read("1")
+
+        clock.now = 70
+        assert client.merchant_info.read("1") == first
+        _wait_for(lambda: route.call_count == 2)
+        _wait_for(lambda: client.merchant_info.read("1").msg == "refreshed")
+        assert cache.stats().stale_hits >= 1
+
+        clock.now = 1000
+        client.merchant_info.read("1")
+        assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_lookup_cache_refreshes_on_a_task() -> None:
+    route = respx.get(MERCHANT_URL).mock(return_value=httpx.Response(200, json=MERCHANT))
+    clock = FakeClock()
+    async with _client(lookup_cache=CacheSettings(ttl_s=60, max_stale_s=30)) as client:
+        cache = client.merchant_info.cache
+        assert cache is not None
+        cache._clock = clock
+        first = await client.merchant_info.aread("1")
+        clock.now = 61
+        assert await client.merchant_info.aread("1") == first
+        for _ in range(100):
+            if route.call_count == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert route.call_count == 2
+
+
+def test_rejects_non_positive_max_stale() -> None:
+    with _client() as client, pytest.raises(ValueError, match="max_stale_s"):
+        DistrictCatalog(client.district_code, max_stale_s=0)
+    with pytest.raises(ValueError, match="max_stale_s"):
+        CacheSettings(max_stale_s=-1)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from ebarimt_pos_sdk import CreateReceiptRequest, Item, SubReceipt
+from ebarimt_pos_sdk.resources import ItemTaxes, ReceiptTaxCalculator, TaxIssue, TaxRates
+
+from .test_receipt import create_receipt_payload
+
+
+def _receipt(*lines: tuple[float | int | str, float | int | str], tax_type: str = "VAT_ABLE"):
+    items = [
+        Item(name=f"Item {i}", measure_unit="ш", qty=qty, unit_price=price, total_amount=0)
+        for i, (qty, price) in enumerate(lines)
+    ]
+    return CreateReceiptRequest(
+        branch_no="001",
+        total_amount=0,
+        merchant_tin="12345678901",
+        pos_no="001",
+        type="B2C_RECEIPT",
+        bill_id_suffix="01",
+        receipts=[
+            SubReceipt(total_amount=0, tax_type=tax_type, merchant_tin="12345678901", items=items)
+        ],
+    )
+
+
+def test_item_taxes_gross_and_net() -> None:
+    gross = ReceiptTaxCalculator()
+    assert gross.item_taxes(1, 1120, "VAT_ABLE") == ItemTaxes(
+        Decimal("1120.00"), Decimal("100.00"), Decimal("20.00")
+    )
+    assert gross.item_taxes(1, 1020, "VAT_FREE") == ItemTaxes(
+        Decimal("1020.00"), Decimal("0.00"), Decimal("0.00")
+    )
+    exempt_city = ReceiptTaxCalculator(TaxRates(city_tax_types=frozenset({"VAT_ABLE", "VAT_FREE"})))
+    assert exempt_city.item_taxes(1, 1020, "VAT_FREE") == ItemTaxes(
+        Decimal("1020.00"), Decimal("0.00"), Decimal("20.00")
+    )
+
+    net = ReceiptTaxCalculator(TaxRates(prices_include_tax=False))
+    assert net.item_taxes(2, 2500, "VAT_ABLE") == ItemTaxes(
+        Decimal("5600.00"), Decimal("500.00"), Decimal("100.00")
+    )
+    no_city = ReceiptTaxCalculator(TaxRates(city_tax_types=frozenset()))
+    assert no_city.item_taxes(1, 110, "VAT_ABLE").total_city_tax == 0
+
+
+def test_rounds_each_line_half_up() -> None:
+    # 0.1 * 0.25 = 0.025 is a tie: half-up gives 0.03 (float maths would give 0.02).
+    calculator = ReceiptTaxCalculator(TaxRates(prices_include_tax=False))
+    assert calculator.item_taxes(0.1, 0.25, "VAT_ABLE").total_amount == Decimal("0.03")
+    assert calculator.item_taxes(1, Decimal("0.05"), "VAT_ABLE").total_vat == Decimal("0.01")
+
+
+def test_fill_sums_rounded_lines_then_checks_clean() -> None:
+    request = _receipt((3, 1.1), (1, 1120), (2, "0.35"))
+    calculator = ReceiptTaxCalculator()
+    assert calculator.fill(request) is request
+
+    items = request.receipts[0].items
+    assert [item.total_amount for item in items] == [
+        Decimal("3.30"),
+        Decimal("1120.00"),
+        Decimal("0.70"),
+    ]
+    assert request.total_vat == sum(item.total_vat for item in items)
+    assert request.receipts[0].total_city_tax == request.total_city_tax
+    assert {"total_vat", "total_city_tax"} <= request.model_fields_set
+    assert calculator.check_receipt(request) == ()
+    assert b'"totalVAT":"100.35"' in request.model_dump_json(by_alias=True).encode()
+
+
+def test_check_receipt_flags_mismatches() -> None:
+    request = _receipt((1, 1120), (1, 1120))
+    calculator = ReceiptTaxCalculator()
+    calculator.fill(request)
+    request.receipts[0].items[1].total_vat = Decimal("99")
+
+    assert calculator.check_receipt(request) == (
+        TaxIssue(0, 1, "total_vat", Decimal("100.00"), Decimal("99")),
+    )
+
+    # The documented example leaves VAT and city tax unset on a 1000 line.
+    issues = calculator.check_receipt(create_receipt_payload)
+    assert {(i.receipt, i.item, i.field, i.actual) for i in issues} == {
+        (0, 0, "total_vat", None),
+        (0, 0, "total_city_tax", None),
+        (0, None, "total_vat", None),
+        (0, None, "total_city_tax", None),
+        (None, None, "total_vat", None),
+        (None, None, "total_city_tax", None),
+    }
+    assert (
+        ReceiptTaxCalculator(TaxRates(vat=Decimal(0), city_tax=Decimal(0))).check_receipt(
+            create_receipt_payload
+        )
+        == ()
+    )
+
+
+@pytest.mark.parametrize("include", [True, False])
+def test_vectorized_check_matches_decimal(include: bool) -> None:
+    pytest.importorskip("numpy")
+    lines = [(q, p) for q in (1, 3, 0.5, "2.25") for p in (1.1, 1120, "0.35", 999.99, 0.25)] * 5
+    request = _receipt(*lines)
+    rates = TaxRates(prices_include_tax=include)
+    ReceiptTaxCalculator(rates).fill(request)
+    request.receipts[0].items[7].total_city_tax += Decimal("0.01")
+    request.receipts[0].items[42].total_amount = Decimal("1")
+    request.total_vat += 1
+
+    plain = ReceiptTaxCalculator(rates, vectorize=False).check_receipt(request)
+    vectorized = ReceiptTaxCalculator(rates, vectorize=True).check_receipt(request)
+    assert vectorized == plain
+    assert {(i.item, i.field) for i in plain if i.item is not None} == {
+        (7, "total_city_tax"),
+        (42, "total_amount"),
+    }
+
+
+def test_float_rates_are_converted_through_str() -> None:
+    rates = TaxRates(vat=0.1, city_tax=0.02, rounding_unit=1)  # type: ignore[arg-type]
+    assert (rates.vat, rates.city_tax, rates.rounding_unit) == (
+        Decimal("0.1"),
+        Decimal("0.02"),
+        Decimal(1),
+    )
+    assert all(type(rate) is Decimal for rate in (rates.vat, rates.city_tax, rates.rounding_unit))
+
+
+def test_rejects_bad_rates() -> None:
+    with pytest.raises(ValueError, match="TaxRates.vat"):
+        TaxRates(vat=Decimal("-0.1"))
+    with pytest.raises(ValueError, match="TaxRates.rounding_unit"):
+        TaxRates(rounding_unit=Decimal(0))
@@ -8,9 +8,12 @@ import httpx
 import pytest
 import respx
 
+from ebarimt_pos_sdk import EbarimtRestClient, RestClientSettings
 from ebarimt_pos_sdk.errors import PosApiTransportError
 from ebarimt_pos_sdk.settings.retry_settings import RetrySettings
 from ebarimt_pos_sdk.transport.async_transport import AsyncTransport
+from ebarimt_pos_sdk.transport.http import parse_retry_after
+from ebarimt_pos_sdk.transport.retry import RetryBudget
 from ebarimt_pos_sdk.transport.sync_transport import SyncTransport
 
 BASE = "https://example.com"
@@ -95,7 +98,8 @@ def test_sync_post_body_is_resent_on_retry() -> None:
             httpx.Response(200, json={"ok": True}),
         ]
     )
-    transport = SyncTransport(httpx.Client(base_url=BASE), retry=RetrySettings(max_retries=3))
+    retry = RetrySettings(max_retries=3, retry_methods=frozenset({"POST"}))
+    transport = SyncTransport(httpx.Client(base_url=BASE), retry=retry)
     result = transport.send("POST", "/x", payload={"hello": "world"})
     assert result.response.status_code == 200
     assert route.call_count == 3
@@ -140,7 +144,8 @@ async def test_async_post_body_is_resent_on_retry() -> None:
             httpx.Response(200, json={"ok": True}),
         ]
     )
-    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), retry=RetrySettings(max_retries=3))
+    retry = RetrySettings(max_retries=3, retry_methods=frozenset({"POST"}))
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), retry=retry)
     result = await transport.send("POST", "/x", payload={"a": 1})
     assert result.response.status_code == 200
     assert route.call_count == 2
@@ -426,7 +431,8 @@ def test_sync_method_preserved_on_retry(method: str) -> None:
     route = respx.route(method=method, url=f"{BASE}/x").mock(
         side_effect=[httpx.Response(503), httpx.Response(200, json={})]
     )
-    transport = SyncTransport(httpx.Client(base_url=BASE), retry=RetrySettings(max_retries=3))
+    retry = RetrySettings(max_retries=3, retry_methods=frozenset({method}))
+    transport = SyncTransport(httpx.Client(base_url=BASE), retry=retry)
     payload = {"k": "v"} if method in {"POST", "PUT", "PATCH"} else None
     transport.send(method, "/x", payload=payload)  # type: ignore[arg-type]
     assert route.call_count == 2
@@ -434,6 +440,39 @@ def test_sync_method_preserved_on_retry(method: str) -> None:
         assert call.request.method == method
 
 
+@pytest.mark.parametrize(
+    ("error", "calls"),
+    [(httpx.ConnectError("refused"), 2), (httpx.ReadTimeout("slow"), 1)],
+)
+@respx.mock
+def test_sync_post_is_only_retried_when_never_sent(error: httpx.HTTPError, calls: int) -> None:
+    route = respx.post(f"{BASE}/x").mock(side_effect=[error, httpx.Response(200, json={})])
+    transport = SyncTransport(
+        httpx.Client(base_url=BASE), retry=RetrySettings(backoff_base_seconds=0)
+    )
+    if calls == 1:
+        with pytest.raises(PosApiTransportError):
+            transport.send("POST", "/x", payload={})
+    else:
+        transport.send("POST", "/x", payload={})
+    assert route.call_count == calls
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_post_is_not_retried_on_5xx_by_default() -> None:
+    route = respx.post(f"{BASE}/x").mock(return_value=httpx.Response(503))
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE))
+    result = await transport.send("POST", "/x", payload={})
+    assert result.response.status_code == 503
+    assert route.call_count == 1
+
+
+def test_rejects_lower_case_retry_methods() -> None:
+    with pytest.raises(ValueError, match="RetrySettings.retry_methods"):
+        RetrySettings(retry_methods=frozenset({"post"}))
+
+
 # --------------------------
 # Non-retryable HTTPError surfaces immediately
 # --------------------------
@@ -469,3 +508,133 @@ async def test_async_non_retryable_http_error_does_not_retry() -> None:
     with pytest.raises(PosApiTransportError):
         await transport.send("GET", "/x")
     assert len(calls) == 1
+
+
+# --------------------------
+# Jitter, cap, Retry-After
+# --------------------------
+
+
+def test_retry_settings_sleep_is_capped() -> None:
+    s = RetrySettings(backoff_base_seconds=1.0, max_backoff_seconds=3.0)
+    assert s.sleep_seconds(5) == 3.0
+
+
+def test_retry_settings_decorrelated_jitter_stays_in_bounds() -> None:
+    s = RetrySettings(backoff_base_seconds=0.5, max_backoff_seconds=10.0, jitter=True)
+    previous = None
+    for attempt in range(20):
+        sleep = s.sleep_seconds(attempt, previous=previous)
+        upper = max(0.5, (previous if previous is not None else 0.5) * 3)
+        assert 0.5 <= sleep <= min(10.0, upper)
+        previous = sleep
+
+
+def test_retry_settings_retry_after_wins_but_is_capped() -> None:
+    s = RetrySettings(backoff_base_seconds=1.0, max_backoff_seconds=5.0)
+    assert s.sleep_seconds(0, retry_after=2.0) == 2.0
+    assert s.sleep_seconds(0, retry_after=60.0) == 5.0
+    ignored = RetrySettings(backoff_base_seconds=1.0, respect_retry_after=False)
+    assert ignored.sleep_seconds(0, retry_after=2.0) == 1.0
+
+
+def test_parse_retry_after_forms() -> None:
+    assert parse_retry_after(httpx.Response(503, headers={"Retry-After": "7"})) == 7.0
+    assert parse_retry_after(httpx.Response(503)) is None
+    assert parse_retry_after(httpx.Response(503, headers={"Retry-After": "soon"})) is None
+    past = parse_retry_after(
+        httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    )
+    assert past == 0.0
+
+
+@respx.mock
+def test_sync_honors_retry_after_on_503(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", lambda s: sleeps.append(s))
+
+    respx.get(f"{BASE}/x").mock(
+        side_effect=[
+            httpx.Response(503, headers={"Retry-After": "4"}),
+            httpx.Response(200, json={}),
+        ]
+    )
+    transport = SyncTransport(httpx.Client(base_url=BASE), retry=RetrySettings(max_retries=3))
+    transport.send("GET", "/x")
+    assert sleeps == [4.0]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_honors_retry_after_on_503(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(s: float) -> None:
+        sleeps.append(s)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    respx.get(f"{BASE}/x").mock(
+        side_effect=[
+            httpx.Response(503, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={}),
+        ]
+    )
+    transport = AsyncTransport(httpx.AsyncClient(base_url=BASE), retry=RetrySettings())
+    await transport.send("GET", "/x")
+    assert sleeps == [2.0]
+
+
+# --------------------------
+# Retry budget
+# --------------------------
+
+
+def test_retry_budget_refills_by_ratio_up_to_burst() -> None:
+    budget = RetryBudget(ratio=0.5, burst=2)
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    assert budget.try_withdraw()
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 2
+
+
+@respx.mock
+def test_sync_exhausted_budget_stops_retrying() -> None:
+    route = respx.get(f"{BASE}/x").mock(return_value=httpx.Response(503))
+    transport = SyncTransport(
+        httpx.Client(base_url=BASE),
+        retry=RetrySettings(max_retries=3, budget_ratio=0.1, budget_burst=1),
+    )
+    # First call: one retry fits in the burst, the second is refused.
+    assert transport.send("GET", "/x").response.status_code == 503
+    assert route.call_count == 2
+    # Budget is now empty: the next call gets no retries at all.
+    transport.send("GET", "/x")
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_sync_exhausted_budget_raises_on_network_error() -> None:
+    route = respx.get(f"{BASE}/x").mock(side_effect=httpx.ConnectError("boom"))
+    budget = RetryBudget(ratio=0.1, burst=1)
+    budget.try_withdraw()
+    transport = SyncTransport(
+        httpx.Client(base_url=BASE), retry=RetrySettings(max_retries=3), retry_budget=budget
+    )
+    with pytest.raises(PosApiTransportError):
+        transport.send("GET", "/x")
+    assert route.call_count == 1
+
+
+def test_client_shares_one_budget_across_transports() -> None:
+    settings = RestClientSettings(base_url=BASE, retry=RetrySettings(budget_ratio=0.2))
+    with EbarimtRestClient(settings) as client:
+        assert client._retry_budget is not None
+        assert client._sync_transport._retry_budget is client._retry_budget
+        assert client._async_transport._retry_budget is client._retry_budget
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from ebarimt_pos_sdk import EbarimtRestClient, PosApiValidationError, RestClientSettings
+from ebarimt_pos_sdk.resources import receipt_key, trusted_receipt_json
+from ebarimt_pos_sdk.settings import IdempotencySettings
+
+from ..data.receipt import SUCCESS_RESPONSE
+from ..helpers import BASE_REST_URL
+from .test_receipt import create_receipt_payload
+
+URL = f"{BASE_REST_URL}/rest/receipt"
+WIRE = create_receipt_payload.model_dump(by_alias=True, exclude_none=True)
+VALIDATED_BODY = create_receipt_payload.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def test_trusted_json_matches_the_validated_bytes() -> None:
+    assert trusted_receipt_json(WIRE) == VALIDATED_BODY
+    assert receipt_key(VALIDATED_BODY) == receipt_key(create_receipt_payload)
+
+
+def test_equivalent_dict_and_model_share_a_key() -> None:
+    def respell(value: object) -> object:
+        if isinstance(value, dict):
+            return {k: respell(v) for k, v in reversed(value.items())} | {"lotNo": None}
+        if isinstance(value, list):
+            return [respell(v) for v in value]
+        return float(value) if isinstance(value, int) and not isinstance(value, bool) else value
+
+    body = trusted_receipt_json(respell(WIRE))  # type: ignore[arg-type]
+    assert body != VALIDATED_BODY
+    assert receipt_key(body) == receipt_key(create_receipt_payload)
+
+
+def test_structure_errors_name_every_bad_path() -> None:
+    sub = WIRE["receipts"][0]
+    bad_item = {k: v for k, v in sub["items"][0].items() if k != "unitPrice"}
+    payload = {
+        **WIRE,
+        "receipts": [{**sub, "items": [bad_item, "nope"]}, {**sub, "items": []}],
+        "payments": [{"code": "CASH"}],
+    }
+    del payload["posNo"]
+
+    with pytest.raises(PosApiValidationError) as info:
+        trusted_receipt_json(payload)
+
+    assert info.value.stage == "request" and info.value.model == "CreateReceiptRequest"
+    errors = {(e["loc"], e["type"]) for e in info.value.validation_error.errors()}
+    assert errors == {
+        (("posNo",), "missing"),
+        (("receipts", 0, "items", 0, "unitPrice"), "missing"),
+        (("receipts", 0, "items", 1), "dict_type"),
+        (("receipts", 1, "items"), "too_short"),
+        (("payments", 0, "paidAmount"), "missing"),
+        (("payments", 0, "status"), "missing"),
+    }
+
+
+@respx.mock
+def test_validate_false_skips_value_validation_only() -> None:
+    route = respx.post(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    sub = WIRE["receipts"][0]
+    zero_qty = {**WIRE, "receipts": [{**sub, "items": [{**sub["items"][0], "qty": 0}]}]}
+
+    with EbarimtRestClient(RestClientSettings(base_url=BASE_REST_URL)) as client:
+        client.receipt.create(WIRE, validate=False)
+        assert route.calls[-1].request.content == VALIDATED_BODY
+
+        client.receipt.create(zero_qty, validate=False)  # trusted: not re-checked
+        with pytest.raises(PosApiValidationError):
+            client.receipt.create(zero_qty)
+        with pytest.raises(PosApiValidationError):
+            client.receipt.create({"receipts": []}, validate=False)
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_acreate_many_trusted_goes_through_the_ledger() -> None:
+    route = respx.post(URL).mock(return_value=httpx.Response(200, json=SUCCESS_RESPONSE))
+    settings = RestClientSettings(base_url=BASE_REST_URL, receipt_idempotency=IdempotencySettings())
+    async with EbarimtRestClient(settings) as client:
+        await client.receipt.acreate(create_receipt_payload)  # validated path
+        results = [r async for r in client.receipt.acreate_many([WIRE, WIRE], validate=False)]
+    assert all(r.ok for r in results)
+    assert route.call_count == 1  # same content key on both paths
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import sys
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import httpx
+import pytest
+
+from ebarimt_pos_sdk import EbarimtRestClient, RestClientSettings
+
+from ..data.receipt import SUCCESS_RESPONSE
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(SUCCESS_RESPONSE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:  # client_address is "" on a Unix socket
+        return "uds"
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def uds_path(tmp_path: Path) -> Iterator[str]:
+    path = str(tmp_path / "posapi.sock")
+    server = _UnixHTTPServer(path, _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield path
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _payload() -> dict:
+    return {
+        "branchNo": "001",
+        "totalAmount": 1000,
+        "merchantTin": "12345678901",
+        "posNo": "001",
+        "type": "B2C_RECEIPT",
+        "billIdSuffix": "01",
+        "receipts": [
+            {
+                "totalAmount": 1000,
+                "taxType": "VAT_ABLE",
+                "merchantTin": "12345678901",
+                "items": [
+                    {
+                        "name": "Bread",
+                        "measureUnit": "ш",
+                        "qty": 1,
+                        "unitPrice": 1000,
+                        "totalAmount": 1000,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_sync_receipt_over_unix_socket(uds_path: str) -> None:
+    settings = RestClientSettings(base_url="http://localhost", uds=uds_path)
+    with EbarimtRestClient(settings) as client:
+        resp = client.receipt.create(_payload())
+    assert resp.id == SUCCESS_RESPONSE["id"]
+
+
+@pytest.mark.asyncio
+async def test_async_receipt_over_unix_socket(uds_path: str) -> None:
+    settings = RestClientSettings(base_url="http://localhost", uds=uds_path)
+    async with EbarimtRestClient(settings) as client:
+        resp = await client.receipt.acreate(_payload())
+    assert resp.id == SUCCESS_RESPONSE["id"]
+
+
+def test_proxy_environment_cannot_bypass_the_socket(
+    uds_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+    monkeypatch.setenv("ALL_PROXY", "http://127.0.0.1:9")
+    settings = RestClientSettings(base_url="http://localhost", uds=uds_path)
+    with EbarimtRestClient(settings) as client:
+        assert client._sync_client.trust_env is False
+        assert not client._sync_client._mounts  # type: ignore[attr-defined]
+        resp = client.receipt.create(_payload())
+    assert resp.id == SUCCESS_RESPONSE["id"]
+
+
+def test_socket_options_and_pool_reach_custom_transport() -> None:
+    option = (socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+    settings = RestClientSettings(
+        base_url="http://localhost",
+        socket_options=(option,),
+        max_connections=7,
+        trust_env=False,
+    )
+    with EbarimtRestClient(settings) as client:
+        pool = client._sync_client._transport._pool  # type: ignore[attr-defined]
+        assert pool._socket_options == (option,)
+        assert pool._max_connections == 7
+        assert client._sync_client.trust_env is False
+
+
+def test_default_settings_keep_httpx_default_transport() -> None:
+    with EbarimtRestClient(RestClientSettings(base_url="http://localhost")) as client:
+        assert client._sync_client._transport._pool._uds is None  # type: ignore[attr-defined]
+
+
+def test_rejects_blank_uds() -> None:
+    with pytest.raises(ValueError, match="uds"):
+        RestClientSettings(base_url="http://localhost", uds="  ")
+
+
+def test_injected_client_is_left_alone(uds_path: str) -> None:
+    injected = httpx.Client(base_url="http://localhost")
+    settings = RestClientSettings(base_url="http://localhost", uds=uds_path)
+    with EbarimtRestClient(settings, sync_client=injected) as client:
+        assert client._sync_client is injected